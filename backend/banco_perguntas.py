@@ -0,0 +1,110 @@
+import os
+import random
+import threading
+from database.criar_banco import Database, Inserir_perguntas
+from database.consultas import SQL_CARREGAR_PERGUNTAS
+
+
+class Pergunta:
+    """Registro compacto de uma pergunta do banco"""
+    __slots__ = ('id_pergunta', 'pergunta', 'opcoes', 'resposta')
+
+    def __init__(self, id_pergunta, pergunta, opcoes, resposta):
+        self.id_pergunta = id_pergunta
+        self.pergunta = pergunta
+        self.opcoes = opcoes  # tupla (A, B, C, D)
+        self.resposta = resposta
+
+    def como_dict(self):
+        return {
+            "id_pergunta": self.id_pergunta,
+            "pergunta": self.pergunta,
+            "opcoes": list(self.opcoes),
+            "resposta": self.resposta
+        }
+
+
+class QuestionBank:
+    """
+    Banco de perguntas em memória, indexado por (dificuldade, classe).
+
+    A tabela Perguntas é lida uma única vez (sem ORDER BY RANDOM()) e
+    recarregada apenas quando Inserir_perguntas registra novas inserções.
+    """
+
+    def __init__(self, db_name):
+        self.db = Database(db_name)
+        self._indices = {}
+        self._versao = None
+        self._lock = threading.Lock()
+
+    def carregar(self):
+        """Lê todas as perguntas e reconstrói os índices por nível"""
+        conn = self.db.conectar_no_banco()
+        if conn is None:
+            return False
+
+        try:
+            versao = Inserir_perguntas.versao
+            cursor = conn.execute(SQL_CARREGAR_PERGUNTAS)
+
+            indices = {}
+            for row in cursor:
+                chave = (row[1], row[2])
+                bucket = indices.get(chave)
+                if bucket is None:
+                    bucket = indices[chave] = []
+                bucket.append(Pergunta(row[0], row[3], (row[4], row[5], row[6], row[7]), row[8]))
+
+            self._indices = indices
+            self._versao = versao
+            return True
+        except Exception as e:
+            print(f"Erro ao carregar banco de perguntas: {e}")
+            return False
+        finally:
+            self.db.fechar_conexao()
+
+    def _garantir_atualizado(self):
+        if self._versao != Inserir_perguntas.versao:
+            with self._lock:
+                if self._versao != Inserir_perguntas.versao:
+                    self.carregar()
+
+    def invalidar(self):
+        self._versao = None
+
+    def niveis_disponiveis(self):
+        """Retorna os pares (dificuldade, classe) que possuem perguntas"""
+        self._garantir_atualizado()
+        return sorted(self._indices)
+
+    def quantidade(self, dificuldade, classe):
+        self._garantir_atualizado()
+        return len(self._indices.get((dificuldade, classe), ()))
+
+    def sortear(self, dificuldade, classe, quantidade, aleatorio=None):
+        """
+        Sorteia até `quantidade` perguntas distintas do nível, em ordem aleatória
+
+        Args:
+            aleatorio: random.Random do chamador (partidas reproduzíveis); padrão: módulo random
+        """
+        self._garantir_atualizado()
+        bucket = self._indices.get((dificuldade, classe))
+        if not bucket:
+            return []
+        return (aleatorio or random).sample(bucket, min(quantidade, len(bucket)))
+
+
+_bancos = {}
+_bancos_lock = threading.Lock()
+
+def obter_banco_perguntas(db_name=os.path.join("database", "raizes_ocultas.db")):
+    """Retorna o QuestionBank compartilhado pelo processo para o arquivo informado"""
+    chave = os.path.abspath(db_name)
+    with _bancos_lock:
+        banco = _bancos.get(chave)
+        if banco is None:
+            banco = _bancos[chave] = QuestionBank(db_name)
+        return banco
@@ -1,39 +1,25 @@
 import os
-import hashlib
 import sqlite3
 from database.criar_banco import Funcoes_DataBase
+from database.esquema import esquema_pronto
 from backend.validador import Validador
+from backend import senhas
+
+CAMINHO_BANCO = os.path.join("database", "raizes_ocultas.db")
 
 class Cadastrar:
-    def __init__(self):
-        # Garante que o diretório database existe
-        if not os.path.exists("database"):
-            os.makedirs("database")
-            
-        db_path = os.path.join("database", "raizes_ocultas.db")
-        self.db = Funcoes_DataBase(db_path)
+    def __init__(self, db_path=CAMINHO_BANCO):
+        # Sem I/O: o esquema é verificado uma vez por processo (database/esquema.py)
+        self.db_path = db_path
+        self.db = Funcoes_DataBase(self.db_path)
         
         # Verifica se o banco existe e tem as tabelas necessárias
         if not self.verificar_banco_pronto():
             raise Exception("Banco de dados não está pronto para uso")
 
     def verificar_banco_pronto(self):
-        """Verifica se o banco de dados existe e tem a tabela Usuario"""
-        try:
-            conn = self.db.db.conectar_no_banco()
-            if conn is None:
-                return False
-                
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='Usuario'")
-                return cursor.fetchone() is not None
-                
-        except Exception as e:
-            print(f"Erro ao verificar banco: {e}")
-            return False
-        finally:
-            self.db.db.fechar_conexao()
+        """Verifica se o banco de dados existe e tem as tabelas necessárias (resultado em cache)"""
+        return esquema_pronto(self.db_path)
             
     def validar_dados_cadastro(self, nome: str, email: str, senha: str, confirmar_senha: str) -> tuple:
         """
@@ -95,8 +81,9 @@ class Cadastrar:
             return False, msg, None
         
         try:
-            # Hash da senha
-            senha_hash = hashlib.sha256(senha.encode()).hexdigest()
+            # Hash salgado com o custo calibrado para esta máquina (ver backend/senhas.py)
+            algoritmo, custo = senhas.custo_configurado(self.db_path)
+            senha_hash = senhas.gerar_hash(senha, custo, algoritmo)
             
             # Inserir no banco
             user_id = self.db.inserir_cliente(nome.strip(), email.strip(), senha_hash)
@@ -154,5 +141,14 @@ def cadastrar_usuario_simples(nome: str, email: str, senha: str) -> tuple:
     Returns:
         tuple: (sucesso: bool, mensagem: str, id_usuario: int ou None)
     """
-    cadastrador = Cadastrar()
-    return cadastrador.cadastrar_usuario(nome, email, senha, senha)
\ No newline at end of file
+    return obter_cadastrar().cadastrar_usuario(nome, email, senha, senha)
+
+
+_cadastrar = None
+
+def obter_cadastrar():
+    """Serviço de cadastro compartilhado pelo processo (sem estado por chamada)"""
+    global _cadastrar
+    if _cadastrar is None:
+        _cadastrar = Cadastrar()
+    return _cadastrar
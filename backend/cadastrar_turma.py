@@ -1,15 +1,34 @@
+import io
 import os
+import csv
+import time
+import threading
+import unicodedata
 from database.criar_banco import Funcoes_DataBase
+from database.esquema import esquema_pronto
+from database.consultas import (
+    SQL_LISTAR_TURMAS_USUARIO, SQL_ESTATISTICAS_TURMA, SQL_ESTATISTICAS_USUARIO,
+    sql_listar_turmas_pagina
+)
 import sqlite3
 
+CAMINHO_BANCO = os.path.join("database", "raizes_ocultas.db")
+
+# Valores iniciais de uma nova turma: vida_max, vida_atual, pontos_acerto, pontos_erro, vivo
+VALORES_INICIAIS = (3, 3, 0, 0, True)
+
+# Cabeçalhos aceitos na importação de turmas (normalizados, sem acento)
+COLUNAS_CSV = {
+    'nome': 'nome', 'nome_turma': 'nome', 'turma': 'nome',
+    'quantidade': 'quantidade', 'quantidade_turma': 'quantidade', 'alunos': 'quantidade',
+    'serie': 'serie', 'serie_turma': 'serie', 'ano': 'serie',
+}
+
 class CadastrarTurma:
-    def __init__(self, id_usuario):
+    def __init__(self, id_usuario, db_path=CAMINHO_BANCO):
+        # Sem I/O: o esquema é verificado uma vez por processo (database/esquema.py)
         self.id_usuario = id_usuario
-        # Garante que o diretório database existe
-        if not os.path.exists("database"):
-            os.makedirs("database")
-            
-        db_path = os.path.join("database", "raizes_ocultas.db")
+        self.db_path = db_path
         self.db = Funcoes_DataBase(db_path)
         
         # Verifica se o banco existe e tem as tabelas necessárias
@@ -17,22 +36,8 @@ class CadastrarTurma:
             raise Exception("Banco de dados não está pronto para uso")
     
     def verificar_banco_pronto(self):
-        """Verifica se o banco de dados existe e tem a tabela Turma"""
-        try:
-            conn = self.db.db.conectar_no_banco()
-            if conn is None:
-                return False
-                
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='Turma'")
-                return cursor.fetchone() is not None
-                
-        except Exception as e:
-            print(f"Erro ao verificar banco: {e}")
-            return False
-        finally:
-            self.db.db.fechar_conexao()
+        """Verifica se o banco de dados existe e tem as tabelas necessárias (resultado em cache)"""
+        return esquema_pronto(self.db_path)
 
     def validar_dados_cadastro_turma(self, nome: str, quantidade: int, serie: str):
         if not nome.strip():
@@ -49,11 +54,7 @@ class CadastrarTurma:
     def cadastrar_turma(self, nome: str, quantidade: int, serie: str):
         """Cadastra uma nova turma associada ao usuário"""
         # Valores padrão para nova turma
-        vida_max = 3
-        vida_atual = 3
-        pontos_acerto = 0
-        pontos_erro = 0
-        vivo = True
+        vida_max, vida_atual, pontos_acerto, pontos_erro, vivo = VALORES_INICIAIS
         
         try:
             # Valida os dados primeiro
@@ -87,6 +88,160 @@ class CadastrarTurma:
         except Exception as e:
             return False, f"Erro ao cadastrar turma: {str(e)}", None
     
+    @staticmethod
+    def ler_csv_turmas(caminho):
+        """
+        Lê turmas de um arquivo .csv (colunas nome, quantidade e serie)
+
+        O separador (vírgula, ponto e vírgula ou tabulação) é detectado, e o
+        arquivo pode vir em UTF-8 ou Latin-1 (CSV salvo pelo Excel).
+
+        Yields:
+            tuple: (numero_linha, turma: dict ou None, erro: str ou None)
+        """
+        # newline='': as quebras de linha dentro de campos entre aspas chegam ao csv intactas
+        try:
+            with open(caminho, encoding='utf-8-sig', newline='') as arquivo:
+                conteudo = arquivo.read()
+        except UnicodeDecodeError:
+            with open(caminho, encoding='latin-1', newline='') as arquivo:
+                conteudo = arquivo.read()
+
+        try:
+            dialeto = csv.Sniffer().sniff(conteudo[:4096], delimiters=",;\t")
+        except csv.Error:
+            dialeto = csv.excel
+
+        leitor = csv.reader(io.StringIO(conteudo, newline=''), dialeto)
+        cabecalho = next(leitor, None)
+        if cabecalho is None:
+            return
+        colunas = [
+            COLUNAS_CSV.get(unicodedata.normalize('NFKD', c).encode('ascii', 'ignore').decode().strip().lower())
+            for c in cabecalho
+        ]
+        faltando = {'nome', 'quantidade', 'serie'} - set(colunas)
+        if faltando:
+            yield 1, None, f"Cabeçalho sem a(s) coluna(s): {', '.join(sorted(faltando))}"
+            return
+
+        # line_num é a linha do arquivo onde o registro termina
+        for valores in leitor:
+            if not any(v.strip() for v in valores):
+                continue
+            yield leitor.line_num, {
+                coluna: valor.strip() for coluna, valor in zip(colunas, valores) if coluna
+            }, None
+
+    def cadastrar_turmas_em_lote(self, registros):
+        """
+        Cadastra várias turmas de uma vez (ex.: início do período letivo)
+
+        Todas as linhas são validadas antes de gravar: se alguma for inválida,
+        nada é inserido. As válidas são gravadas em uma única transação; nomes
+        já usados (no banco ou repetidos no próprio lote) são pulados e
+        reportados linha a linha.
+
+        Args:
+            registros: iterável de (numero_linha, turma: dict ou None, erro: str ou None),
+                       como produzido por ler_csv_turmas
+
+        Returns:
+            tuple: (sucesso: bool, mensagem: str, relatorio: dict)
+        """
+        relatorio = {'lidas': 0, 'inseridas': 0, 'conflitos': [], 'erros': [], 'segundos': 0.0}
+        inicio = time.perf_counter()
+
+        validas = []      # (numero_linha, registro para inserir_turmas)
+        primeira = {}     # nome -> linha em que apareceu primeiro
+        try:
+            for numero, turma, erro in registros:
+                relatorio['lidas'] += 1
+                if erro is None:
+                    erro, dados = self._validar_linha(turma)
+                if erro:
+                    relatorio['erros'].append((numero, erro))
+                    continue
+                if dados[0] in primeira:
+                    relatorio['conflitos'].append((numero, f"Nome repetido no arquivo (linha {primeira[dados[0]]})"))
+                    continue
+                primeira[dados[0]] = numero
+                validas.append((numero, dados + VALORES_INICIAIS))
+        except (OSError, csv.Error) as e:
+            return False, f"Erro ao ler as turmas: {e}", relatorio
+
+        if relatorio['erros']:
+            relatorio['segundos'] = time.perf_counter() - inicio
+            return False, f"{len(relatorio['erros'])} linha(s) inválida(s); nenhuma turma foi cadastrada", relatorio
+
+        try:
+            existentes = self.db.inserir_turmas([dados for _, dados in validas], self.id_usuario)
+        except Exception as e:
+            relatorio['segundos'] = time.perf_counter() - inicio
+            return False, f"Erro ao cadastrar turmas: {str(e)}", relatorio
+
+        for numero, dados in validas:
+            if dados[0] in existentes:
+                relatorio['conflitos'].append((numero, f"Já existe uma turma chamada '{dados[0]}'"))
+        relatorio['conflitos'].sort()
+        relatorio['inseridas'] = len(validas) - len(existentes)
+        relatorio['segundos'] = time.perf_counter() - inicio
+        return True, (
+            f"{relatorio['inseridas']} turmas cadastradas, "
+            f"{len(relatorio['conflitos'])} com nome já usado"
+        ), relatorio
+
+    def importar_csv(self, caminho):
+        """Cadastra as turmas de um arquivo .csv (ver cadastrar_turmas_em_lote)"""
+        return self.cadastrar_turmas_em_lote(self.ler_csv_turmas(caminho))
+
+    def _validar_linha(self, turma):
+        """Retorna (erro ou None, (nome, quantidade, serie))"""
+        nome = (turma.get('nome') or '').strip()
+        serie = (turma.get('serie') or '').strip()
+        try:
+            quantidade = int(str(turma.get('quantidade') or '').strip())
+        except ValueError:
+            return f"Quantidade de alunos inválida: {turma.get('quantidade')!r}", None
+        valido, msg = self.validar_dados_cadastro_turma(nome, quantidade, serie)
+        if not valido:
+            return msg, None
+        return None, (nome, quantidade, serie)
+
+    def listar_turmas_pagina(self, id_usuario: int, apos_id=None, limite=50, busca="") -> list:
+        """
+        Retorna uma página das turmas do usuário, das mais recentes para as mais antigas
+        
+        A paginação é por chave (id_turma < apos_id), não por OFFSET: cada página
+        custa o mesmo, e a consulta inteira é atendida pelo índice idx_turma_usuario.
+        
+        Args:
+            apos_id: id_turma da última turma da página anterior (None na primeira)
+            limite: quantidade máxima de turmas da página
+            busca: trecho do nome ou da série (sem diferenciar maiúsculas)
+            
+        Returns:
+            list: (id_turma, nome_turma, quantidade_turma, serie_turma)
+        """
+        parametros = [id_usuario, apos_id if apos_id is not None else 2 ** 63 - 1]
+        busca = busca.strip()
+        if busca:
+            padrao = "%" + busca.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            parametros += [padrao, padrao]
+        parametros.append(limite)
+        sql = sql_listar_turmas_pagina(com_busca=bool(busca))
+
+        try:
+            conn = self.db.db.conectar_no_banco()
+            if conn is None:
+                return []
+            return conn.execute(sql, parametros).fetchall()
+        except Exception as e:
+            print(f"Erro ao listar turmas: {e}")
+            return []
+        finally:
+            self.db.db.fechar_conexao()
+
     def listar_turmas_usuario(self, id_usuario: int) -> list:
         """Retorna todas as turmas criadas por um usuário específico"""
         try:
@@ -96,11 +251,7 @@ class CadastrarTurma:
                 
             with conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT id_turma,nome_turma,quantidade_turma,serie_turma FROM Turma
-                        WHERE id_usuario = ?
-                        ORDER BY id_turma DESC
-                """, (id_usuario,))
+                cursor.execute(SQL_LISTAR_TURMAS_USUARIO, (id_usuario,))
                 
                 return cursor.fetchall()
                 
@@ -112,31 +263,67 @@ class CadastrarTurma:
     @staticmethod
     def cadastrar_turma_simples(nome: str, quantidade: int, serie: str, id_usuario: int) -> tuple:
         """Método estático simplificado para cadastro de turma"""
-        cadastro = CadastrarTurma(id_usuario)
-        return cadastro.cadastrar_turma(nome, quantidade, serie)
+        return obter_cadastro_turma(id_usuario).cadastrar_turma(nome, quantidade, serie)
         
+    @staticmethod
+    def _formatar_estatisticas(total, acertos, erros, soma_tempo, qtd_tempo):
+        return {
+            'total': total or 0,
+            'acertos': acertos or 0,
+            'erros': erros or 0,
+            # tempo_resposta é gravado em milissegundos; tempo_medio em segundos
+            'tempo_medio': (soma_tempo / qtd_tempo / 1000) if qtd_tempo else 0
+        }
+
     def get_estatisticas_turma(self, id_turma):
-        conn = sqlite3.connect("database/raizes_ocultas.db")
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_perguntas,
-                SUM(acertou) as acertos,
-                COUNT(*) - SUM(acertou) as erros,
-                AVG(tempo_resposta) as tempo_medio
-            FROM Dados_do_jogador
-            WHERE id_turma = ?
-        """, (id_turma,))
-        
-        resultado = cursor.fetchone()
-        conn.close()
+        """Lê o resumo da turma mantido incrementalmente em Turma_Estatisticas (O(1))"""
+        conn = self.db.db.conectar_no_banco()
+        if conn is None:
+            return None
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute(SQL_ESTATISTICAS_TURMA, (id_turma,))
+            
+            resultado = cursor.fetchone()
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar estatísticas: {e}")
+            return None
+        finally:
+            self.db.db.fechar_conexao()
         
         if resultado:
-            return {
-                'total': resultado[0],
-                'acertos': resultado[1],
-                'erros': resultado[2],
-                'tempo_medio': resultado[3] or 0
-            }
-        return None
\ No newline at end of file
+            return self._formatar_estatisticas(*resultado)
+        return self._formatar_estatisticas(0, 0, 0, 0, 0)
+
+    def get_estatisticas_usuario(self, id_usuario: int) -> list:
+        """Retorna (id_turma, nome_turma, estatisticas) de todas as turmas do usuário em uma consulta"""
+        conn = self.db.db.conectar_no_banco()
+        if conn is None:
+            return []
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute(SQL_ESTATISTICAS_USUARIO, (id_usuario,))
+            
+            return [
+                (row[0], row[1], self._formatar_estatisticas(*row[2:]))
+                for row in cursor.fetchall()
+            ]
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar estatísticas: {e}")
+            return []
+        finally:
+            self.db.db.fechar_conexao()
+
+
+_cadastros = {}
+_cadastros_lock = threading.Lock()
+
+def obter_cadastro_turma(id_usuario):
+    """Serviço de turmas do usuário, criado uma vez por processo"""
+    with _cadastros_lock:
+        cadastro = _cadastros.get(id_usuario)
+        if cadastro is None:
+            cadastro = _cadastros[id_usuario] = CadastrarTurma(id_usuario)
+        return cadastro
@@ -0,0 +1,183 @@
+import os
+import queue
+import threading
+import time
+import atexit
+from database.criar_banco import Funcoes_DataBase
+
+TENTATIVAS_MAX = 5       # gravações de um lote antes de desistir dele
+ESPERA_MAX_REENVIO = 30  # segundos entre tentativas, no máximo
+
+
+class GravadorRespostas:
+    """
+    Fila de gravação assíncrona (write-behind) para Dados_do_jogador.
+
+    O jogo apenas enfileira as respostas; uma thread em segundo plano as
+    grava em lote, em uma única transação, a cada `tamanho_lote` eventos ou
+    `intervalo_ms` milissegundos, o que ocorrer primeiro.
+
+    Um lote que falha (ex.: banco bloqueado) não é descartado: fica guardado
+    e é regravado com espera crescente, até TENTATIVAS_MAX vezes.
+    """
+
+    def __init__(self, db_name, tamanho_lote=20, intervalo_ms=500):
+        self.fdb = Funcoes_DataBase(db_name)
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo_ms / 1000
+        self._fila = queue.Queue()
+        self._parar = False
+        self._reenvio = []  # [lote, tentativas], usado só pela thread de gravação
+        self._proximo_reenvio = None
+        self.estatisticas = {
+            'recebidas': 0,
+            'gravadas': 0,
+            'lotes': 0,
+            'erros': 0,               # tentativas de gravação que falharam
+            'reenvios': 0,            # novas tentativas de lotes que tinham falhado
+            'pendentes_reenvio': 0,   # respostas aguardando nova tentativa
+            'perdidas': 0,            # respostas descartadas após TENTATIVAS_MAX falhas
+            'ultima_latencia_ms': 0.0,
+            'maior_latencia_ms': 0.0,
+            'latencia_total_ms': 0.0,
+        }
+        self._thread = threading.Thread(target=self._executar, name="GravadorRespostas", daemon=True)
+        self._thread.start()
+
+    @property
+    def profundidade_fila(self):
+        """Quantidade aproximada de eventos aguardando gravação"""
+        return self._fila.qsize()
+
+    @property
+    def latencia_media_ms(self):
+        lotes = self.estatisticas['lotes']
+        return self.estatisticas['latencia_total_ms'] / lotes if lotes else 0.0
+
+    def registrar(self, id_turma, id_pergunta, acertou, tempo_resposta):
+        """Enfileira uma resposta sem bloquear quem chamou"""
+        if self._parar:
+            raise RuntimeError("Gravador de respostas já foi encerrado")
+        self.estatisticas['recebidas'] += 1
+        self._fila.put((id_turma, id_pergunta, acertou, tempo_resposta))
+
+    def descarregar(self, timeout=5.0):
+        """
+        Bloqueia até que todas as respostas enfileiradas tenham sido gravadas
+
+        Na interface, chame em uma thread de trabalho (ver front/tarefas.py).
+
+        Returns:
+            bool: False se o tempo esgotou ou se ainda há lotes aguardando reenvio
+        """
+        if not self._thread.is_alive():
+            return self.profundidade_fila == 0
+        concluido = threading.Event()
+        self._fila.put(concluido)
+        return concluido.wait(timeout) and self.estatisticas['pendentes_reenvio'] == 0
+
+    def encerrar(self, timeout=5.0):
+        """Grava o que estiver pendente e finaliza a thread de gravação"""
+        if self._parar:
+            return
+        self.descarregar(timeout)
+        self._parar = True
+        self._fila.put(None)
+        self._thread.join(timeout)
+
+    def _executar(self):
+        lote = []
+        limite = None
+        while True:
+            prazos = [p for p in (limite, self._proximo_reenvio) if p is not None]
+            espera = max(0.0, min(prazos) - time.monotonic()) if prazos else None
+            try:
+                item = self._fila.get(timeout=espera)
+            except queue.Empty:
+                item = False  # tempo do lote esgotado
+
+            if isinstance(item, tuple):
+                lote.append(item)
+                if limite is None:
+                    limite = time.monotonic() + self.intervalo
+                if len(lote) < self.tamanho_lote:
+                    continue
+
+            if lote:
+                if not self._gravar(lote):
+                    self._guardar_para_reenvio(lote, 1)
+                lote = []
+            limite = None
+
+            # descarregar/encerrar tentam os lotes com falha sem esperar o prazo
+            forcar = item is None or isinstance(item, threading.Event)
+            if self._reenvio and (forcar or time.monotonic() >= self._proximo_reenvio):
+                self._reenviar(desistir=item is None)
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                return
+
+    def _guardar_para_reenvio(self, lote, tentativas):
+        self._reenvio.append([lote, tentativas])
+        self.estatisticas['pendentes_reenvio'] += len(lote)
+        espera = min(self.intervalo * 2 ** tentativas, ESPERA_MAX_REENVIO)
+        proximo = time.monotonic() + espera
+        if self._proximo_reenvio is None or proximo < self._proximo_reenvio:
+            self._proximo_reenvio = proximo
+
+    def _reenviar(self, desistir=False):
+        pendentes, self._reenvio = self._reenvio, []
+        self._proximo_reenvio = None
+        for lote, tentativas in pendentes:
+            self.estatisticas['pendentes_reenvio'] -= len(lote)
+            self.estatisticas['reenvios'] += 1
+            if self._gravar(lote):
+                continue
+            tentativas += 1
+            if tentativas >= TENTATIVAS_MAX or desistir:
+                self.estatisticas['perdidas'] += len(lote)
+                print(f"❌ {len(lote)} respostas descartadas após {tentativas} tentativas de gravação")
+            else:
+                self._guardar_para_reenvio(lote, tentativas)
+
+    def _gravar(self, lote):
+        """Grava o lote em uma transação; retorna False se falhou (o lote é mantido para reenvio)"""
+        inicio = time.perf_counter()
+        try:
+            self.fdb.registrar_respostas(lote)
+            self.estatisticas['gravadas'] += len(lote)
+            sucesso = True
+        except Exception as e:
+            self.estatisticas['erros'] += 1
+            print(f"⚠️ Erro ao gravar lote de {len(lote)} respostas (será regravado): {e}")
+            sucesso = False
+        latencia = (time.perf_counter() - inicio) * 1000
+        self.estatisticas['lotes'] += 1
+        self.estatisticas['ultima_latencia_ms'] = latencia
+        self.estatisticas['latencia_total_ms'] += latencia
+        self.estatisticas['maior_latencia_ms'] = max(self.estatisticas['maior_latencia_ms'], latencia)
+        return sucesso
+
+
+_gravadores = {}
+_gravadores_lock = threading.Lock()
+
+def obter_gravador(db_name=os.path.join("database", "raizes_ocultas.db")):
+    """Retorna o GravadorRespostas compartilhado pelo processo para o arquivo informado"""
+    chave = os.path.abspath(db_name)
+    with _gravadores_lock:
+        gravador = _gravadores.get(chave)
+        if gravador is None:
+            gravador = _gravadores[chave] = GravadorRespostas(db_name)
+        return gravador
+
+def encerrar_gravadores():
+    with _gravadores_lock:
+        gravadores = list(_gravadores.values())
+        _gravadores.clear()
+    for gravador in gravadores:
+        gravador.encerrar()
+
+atexit.register(encerrar_gravadores)
@@ -1,10 +1,9 @@
-import tkinter as tk
-from tkinter import messagebox
-import threading
-import sqlite3
 import os
-import random
 import time
+import random
+from collections import defaultdict
+from backend.banco_perguntas import obter_banco_perguntas
+from backend.gravador_respostas import obter_gravador
 
 
 # Configurações do banco de dados
@@ -12,279 +11,284 @@ pasta_db = "database"
 nome_banco = "raizes_ocultas.db"
 caminho_completo = os.path.join(pasta_db, nome_banco)
 
+PERGUNTAS_POR_PARTIDA = 10
+LETRAS = ['A', 'B', 'C', 'D']
+
+# Quanto maior a dificuldade, menos tempo o jogador tem
+TEMPOS_BASE = {
+    1: 120,  # Fácil - mais tempo
+    2: 90,
+    3: 60,
+    4: 30    # Difícil - menos tempo
+}
+
+
 class QuizGame:
-    def __init__(self, root, nivel="1-1",id_turma = None):
-        self.root = root
-        self.root.title("Quiz Game")
-        self.root.geometry("600x400")
-        self.pergunta_atual = 0
+    """
+    Regras do quiz, sem interface gráfica.
+
+    A tela (ou o simulador) conduz a partida chamando iniciar(),
+    proxima_pergunta(), responder() e verificar_prazo(), e acompanha o jogo
+    pelos eventos registrados com ouvir():
+
+        pergunta(numero, pergunta, tempo_limite)
+        resposta(acertou, tempo_gasto_ms, resposta_correta)
+        bonus(tipo, mensagem)
+        vida_perdida(motivo, vidas)
+        segunda_chance(mensagem)
+        fim(venceu, pontuacao, mensagem)
+        erro(mensagem)
+
+    O tempo de cada pergunta vem de um relógio monotônico: ao exibir a
+    pergunta são guardados o início e o prazo, e o tempo gasto (em
+    milissegundos) é a diferença até a resposta, independente de quantas
+    vezes a interface conseguiu atualizar o cronômetro.
+    """
+
+    def __init__(self, nivel="1-1", id_turma=None, quantidade=PERGUNTAS_POR_PARTIDA,
+                 db_name=caminho_completo, aleatorio=None, relogio=time.monotonic):
+        self.nivel = nivel
+        self.id_turma = id_turma
+        self.quantidade = quantidade
+        self.db_name = db_name
+        self.aleatorio = aleatorio or random.Random()
+        self.relogio = relogio
+
+        self.pergunta_atual = -1
         self.pontuacao = 0
         self.vidas = 3
-        self.timer = None
-        self.tempo_restante = 0
-        self.nivel = nivel
         self.respostas_corretas_consecutivas = 0
-        self.tempo_respostas = []  # Armazena o tempo gasto em cada resposta
+        self.tempo_respostas = []  # Tempo gasto em cada resposta, em milissegundos
+        self.inicio_pergunta = None
+        self.prazo = None
+        self.aguardando_resposta = False
         self.bonus_disponivel = False
-        self.id_turma = id_turma  # Adicione esta linha
-        
+        self.terminado = False
+        self.venceu = False
+        self.perguntas = []
+        self.TEMPOS = []
+        self.gravador = obter_gravador(db_name)
+        self._ouvintes = defaultdict(list)
+
         # Parse do nível para obter dificuldade e classe
         self.dificuldade, self.classe = map(int, nivel.split('-'))
-        
-        # Carrega as perguntas do banco de dados
+
+    def ouvir(self, evento, callback):
+        """Registra callback(**dados) para o evento (ver docstring da classe)"""
+        self._ouvintes[evento].append(callback)
+
+    def _emitir(self, evento, **dados):
+        for callback in self._ouvintes.get(evento, ()):
+            callback(**dados)
+
+    def iniciar(self):
+        """
+        Sorteia as perguntas do nível.
+
+        Returns:
+            bool: False se não houver perguntas (o evento "erro" é emitido)
+        """
         self.perguntas = self.carregar_perguntas_do_banco()
-        
-        # Configura os tempos baseados na dificuldade
+        if not self.perguntas:
+            self.terminado = True
+            self._emitir('erro', mensagem="Nenhuma pergunta encontrada para este nível!")
+            return False
         self.TEMPOS = self.definir_tempos()
-        
-        # Elementos da interface
-        self.label_pergunta = tk.Label(root, text="", wraplength=500, font=("Arial", 14))
-        self.label_pergunta.pack(pady=20)
+        return True
 
-        self.botoes = []
-        for i in range(4):
-            btn = tk.Button(root, text="", width=25, font=("Arial", 12), command=lambda i=i: self.verificar_resposta(i))
-            btn.pack(pady=5)
-            self.botoes.append(btn)
+    def definir_tempos(self):
+        """Define os tempos baseados na dificuldade da pergunta"""
+        return [TEMPOS_BASE[self.dificuldade]] * len(self.perguntas)
 
-        self.label_timer = tk.Label(root, text="", font=("Arial", 12))
-        self.label_timer.pack(pady=10)
+    @property
+    def pergunta(self):
+        """Pergunta em exibição (dict), ou None"""
+        if 0 <= self.pergunta_atual < len(self.perguntas):
+            return self.perguntas[self.pergunta_atual]
+        return None
 
-        self.label_vidas = tk.Label(root, text="Vidas: 3", font=("Arial", 12))
-        self.label_vidas.pack()
+    @property
+    def tempo_limite(self):
+        """Tempo da pergunta atual, em segundos"""
+        return self.TEMPOS[self.pergunta_atual]
 
-        if self.perguntas:
-            self.carregar_pergunta()
-        else:
-            messagebox.showerror("Erro", "Nenhuma pergunta encontrada para este nível!")
-            self.root.quit()
+    def tempo_decorrido_ms(self):
+        if self.inicio_pergunta is None:
+            return 0
+        return round((self.relogio() - self.inicio_pergunta) * 1000)
 
-    def carregar_perguntas_do_banco(self):
-        """Carrega perguntas do banco de dados baseado no nível selecionado"""
-        try:
-            conn = sqlite3.connect(caminho_completo)
-            cursor = conn.cursor()
-            
-            # Busca perguntas com a dificuldade e classe especificadas
-            # No método carregar_perguntas_do_banco(), modifique a query SQL para:
-            cursor.execute("""
-                SELECT pergunta, opcao_a, opcao_b, opcao_c, opcao_d, resposta 
-                FROM Perguntas 
-                WHERE dificuldade_pergunta = ? AND classe_pergunta = ?
-                ORDER BY RANDOM()
-                LIMIT 10  # Limita a 10 perguntas por jogo
-            """, (self.dificuldade, self.classe))
-                        
-            perguntas = []
-            for row in cursor.fetchall():
-                perguntas.append({
-                    "pergunta": row[0],
-                    "opcoes": [row[1], row[2], row[3], row[4]],
-                    "resposta": row[5]  # A, B, C ou D
-                })
-            
-            conn.close()
-            return perguntas
-        except Exception as e:
-            messagebox.showerror("Erro", f"Falha ao carregar perguntas: {str(e)}")
-            return []
+    def tempo_restante(self):
+        """Segundos (fracionários) até o prazo da pergunta atual"""
+        if not self.aguardando_resposta:
+            return 0.0
+        return max(0.0, self.prazo - self.relogio())
 
-    def definir_tempos(self):
-        """Define os tempos baseados na dificuldade da pergunta"""
-        # Quanto maior a dificuldade, menos tempo o jogador tem
-        tempos_base = {
-            1: 120,  # Fácil - mais tempo
-            2: 90,
-            3: 60,
-            4: 30    # Difícil - menos tempo
-        }
-        return [tempos_base[self.dificuldade]] * len(self.perguntas)
-
-    def carregar_pergunta(self):
+    def verificar_prazo(self):
+        """
+        Encerra a pergunta se o prazo já passou; a interface chama a cada quadro.
+
+        Returns:
+            bool: True se o tempo da pergunta acabou nesta chamada
+        """
+        if self.aguardando_resposta and self.relogio() >= self.prazo:
+            self.tempo_esgotado()
+            return True
+        return False
+
+    def proxima_pergunta(self):
+        """
+        Avança para a próxima pergunta.
+
+        Returns:
+            dict: a pergunta, ou None se o quiz terminou
+        """
+        if self.terminado:
+            return None
+        self.pergunta_atual += 1
         if self.pergunta_atual >= len(self.perguntas):
-            messagebox.showinfo("Parabéns!", f"Você completou o quiz! Pontuação: {self.pontuacao}")
-            self.root.quit()
-            return
+            self._finalizar(True, f"Você completou o quiz! Pontuação: {self.pontuacao}")
+            return None
 
         p = self.perguntas[self.pergunta_atual]
-        self.label_pergunta.config(text=f"{self.pergunta_atual+1}. {p['pergunta']}")
-        
-        # Mapeia as opções para os botões
-        opcoes_mapeadas = {
-            'A': p['opcoes'][0],
-            'B': p['opcoes'][1],
-            'C': p['opcoes'][2],
-            'D': p['opcoes'][3]
-        }
-        
-        for i, letra in enumerate(['A', 'B', 'C', 'D']):
-            self.botoes[i].config(text=opcoes_mapeadas[letra])
-
-        self.tempo_restante = self.TEMPOS[self.pergunta_atual]
-        self.atualizar_timer()
-
-    def atualizar_timer(self):
-        self.label_timer.config(text=f"Tempo restante: {self.tempo_restante} segundos")
-        if self.tempo_restante <= 0:
-            self.perde_vida("Tempo esgotado!")
-            return
+        self.inicio_pergunta = self.relogio()
+        self.prazo = self.inicio_pergunta + self.tempo_limite
+        self.aguardando_resposta = True
+        self._emitir('pergunta', numero=self.pergunta_atual + 1, pergunta=p, tempo_limite=self.tempo_limite)
+        return p
+
+    def responder(self, indice, tempo_gasto_ms=None):
+        """
+        Registra a alternativa escolhida (0 a 3) para a pergunta atual.
+
+        Args:
+            tempo_gasto_ms: tempo informado (simulações); por padrão, o medido pelo relógio
+
+        Returns:
+            bool: True se acertou (False também quando a resposta chegou após o prazo)
+        """
+        p = self.pergunta
+        if p is None or self.terminado or not self.aguardando_resposta:
+            raise RuntimeError("Nenhuma pergunta aguardando resposta")
+
+        if tempo_gasto_ms is None:
+            tempo_gasto_ms = self.tempo_decorrido_ms()
+        limite_ms = self.tempo_limite * 1000
+        if tempo_gasto_ms >= limite_ms:
+            # O clique chegou depois do prazo (ex.: interface ocupada): vale o prazo
+            self.tempo_esgotado()
+            return False
+
+        self.aguardando_resposta = False
+        letra_selecionada = LETRAS[indice]
+        acertou = letra_selecionada == p['resposta']
+        self.tempo_respostas.append(tempo_gasto_ms)
 
-        self.tempo_restante -= 1
-        self.timer = self.root.after(1000, self.atualizar_timer)
-
-    def verificar_resposta(self, indice):
-        self.root.after_cancel(self.timer)
-        
-        tempo_gasto = self.TEMPOS[self.pergunta_atual] - self.tempo_restante
-        letra_selecionada = ['A', 'B', 'C', 'D'][indice]
-        resposta_correta = self.perguntas[self.pergunta_atual]['resposta']
-        acertou = letra_selecionada == resposta_correta
-        
         # Salva a resposta no banco de dados
-        self.salvar_resposta_turma(acertou, tempo_gasto)
-        
+        self.salvar_resposta_turma(acertou, tempo_gasto_ms)
+        self._emitir('resposta', acertou=acertou, tempo_gasto_ms=tempo_gasto_ms, resposta_correta=p['resposta'])
+
         if acertou:
             self.pontuacao += 1
             self.respostas_corretas_consecutivas += 1
-            mensagem = "Você acertou!"
-            
-            if self.respostas_corretas_consecutivas >= 3 and tempo_gasto < (self.TEMPOS[self.pergunta_atual] / 2):
+            if self.respostas_corretas_consecutivas >= 3 and tempo_gasto_ms < limite_ms / 2:
                 self.conceder_bonus()
-                mensagem += "\n\nVocê ganhou um bônus especial!"
-            
-            messagebox.showinfo("Correto!", mensagem)
         else:
             self.respostas_corretas_consecutivas = 0
             self.perde_vida("Resposta incorreta!")
-            return
+        return acertou
 
-        self.pergunta_atual += 1
-        self.carregar_pergunta()
+    def tempo_esgotado(self):
+        """Encerra a pergunta atual por falta de tempo (ver verificar_prazo)"""
+        if not self.aguardando_resposta:
+            return
+        self.aguardando_resposta = False
+        self.respostas_corretas_consecutivas = 0
+        self.perde_vida("Tempo esgotado!")
 
-    def salvar_resposta_turma(self, acertou, tempo_gasto):
+    def salvar_resposta_turma(self, acertou, tempo_gasto_ms):
         if not self.id_turma:
             return
-            
+
         try:
-            conn = sqlite3.connect(caminho_completo)
-            cursor = conn.cursor()
-            
-            # Obtém o ID da pergunta atual
-            cursor.execute("""
-                SELECT id_pergunta FROM Perguntas 
-                WHERE pergunta = ? AND classe_pergunta = ? AND dificuldade_pergunta = ?
-            """, (
-                self.perguntas[self.pergunta_atual]['pergunta'],
-                self.classe,
-                self.dificuldade
-            ))
-            
-            id_pergunta = cursor.fetchone()[0]
-            
-            # Insere ou ignora se já existir (devido à constraint UNIQUE)
-            cursor.execute("""
-                INSERT OR IGNORE INTO Dados_do_jogador 
-                (id_turma, id_pergunta, acertou, tempo_resposta)
-                VALUES (?, ?, ?, ?)
-            """, (self.id_turma, id_pergunta, int(acertou), tempo_gasto))
-            
-            conn.commit()
-            conn.close()
+            # O id da pergunta já vem do banco de perguntas; a gravação ocorre em segundo plano
+            self.gravador.registrar(
+                self.id_turma,
+                self.pergunta['id_pergunta'],
+                acertou,
+                tempo_gasto_ms
+            )
         except Exception as e:
             print(f"Erro ao salvar resposta: {e}")
-        self.pergunta_atual += 1
-        self.carregar_pergunta()
+
+    def encerrar(self, aguardar=True):
+        """
+        Finaliza a partida e, se `aguardar`, espera as respostas pendentes serem gravadas
+
+        Na interface, use aguardar=False e chame gravador.descarregar em uma
+        thread de trabalho (ver TelaQuiz.voltar).
+        """
+        if not self.terminado:
+            self._finalizar(False, "Quiz encerrado.")
+        if aguardar:
+            return self.gravador.descarregar()
+        return True
+
+    def _finalizar(self, venceu, mensagem):
+        self.terminado = True
+        self.aguardando_resposta = False
+        self.venceu = venceu
+        self._emitir('fim', venceu=venceu, pontuacao=self.pontuacao, mensagem=mensagem)
 
     def conceder_bonus(self):
         """Concede um bônus aleatório ao jogador"""
         self.respostas_corretas_consecutivas = 0  # Reseta o contador
-        
+
         # Tipos de bônus disponíveis
-        bonus = random.choice([
+        bonus = self.aleatorio.choice([
             "vida_extra",
             "segunda_chance",
             "tempo_extra"
         ])
-        
+
         if bonus == "vida_extra":
             self.vidas += 1
-            self.label_vidas.config(text=f"Vidas: {self.vidas}")
-            messagebox.showinfo("Bônus!", "Você ganhou uma vida extra!")
-        
+            mensagem = "Você ganhou uma vida extra!"
+
         elif bonus == "segunda_chance":
             self.bonus_disponivel = True
-            messagebox.showinfo("Bônus!", "Você ganhou uma segunda chance! Poderá tentar novamente se errar a próxima pergunta.")
-        
-        elif bonus == "tempo_extra":
+            mensagem = "Você ganhou uma segunda chance! Não perderá vida se errar a próxima pergunta."
+
+        else:
             # Adiciona 10 segundos à próxima pergunta
             if self.pergunta_atual + 1 < len(self.TEMPOS):
                 self.TEMPOS[self.pergunta_atual + 1] += 10
-            messagebox.showinfo("Bônus!", "Você ganhou +10 segundos para a próxima pergunta!")
+            mensagem = "Você ganhou +10 segundos para a próxima pergunta!"
+
+        self._emitir('bonus', tipo=bonus, mensagem=mensagem)
 
     def perde_vida(self, motivo):
         if self.bonus_disponivel:
             self.bonus_disponivel = False
-            messagebox.showinfo("Segunda Chance", "Você usou seu bônus de segunda chance!")
-            self.pergunta_atual += 1
-            self.carregar_pergunta()
+            self._emitir('segunda_chance', mensagem="Você usou seu bônus de segunda chance!")
             return
-            
+
         self.vidas -= 1
-        self.label_vidas.config(text=f"Vidas: {self.vidas}")
-        messagebox.showwarning("Erro!", f"{motivo} Você perdeu uma vida.")
-        
+        self._emitir('vida_perdida', motivo=motivo, vidas=self.vidas)
+
         if self.vidas <= 0:
-            messagebox.showerror("Fim de Jogo", "Você perdeu todas as vidas!")
-            self.root.quit()
-        else:
-            self.pergunta_atual += 1
-            self.carregar_pergunta()
+            self._finalizar(False, "Você perdeu todas as vidas!")
 
     def carregar_perguntas_do_banco(self):
-        """Carrega perguntas do banco de dados baseado no nível selecionado"""
+        """Sorteia as perguntas do nível selecionado a partir do banco em memória"""
         try:
-            conn = sqlite3.connect(caminho_completo)
-            cursor = conn.cursor()
-            
-            # Primeiro, verifique quais perguntas existem
-            cursor.execute("SELECT DISTINCT dificuldade_pergunta, classe_pergunta FROM Perguntas")
-            niveis_disponiveis = cursor.fetchall()
-            print("Níveis disponíveis no banco:", niveis_disponiveis)
-            
-            # Sua query original continua aqui...
-            cursor.execute("""
-                SELECT pergunta, opcao_a, opcao_b, opcao_c, opcao_d, resposta 
-                FROM Perguntas 
-                WHERE dificuldade_pergunta = ? AND classe_pergunta = ?
-                ORDER BY RANDOM()
-            """, (self.dificuldade, self.classe))
-            
-            perguntas = []
-            for row in cursor.fetchall():
-                perguntas.append({
-                    "pergunta": row[0],
-                    "opcoes": [row[1], row[2], row[3], row[4]],
-                    "resposta": row[5]
-                })
-            
+            banco = obter_banco_perguntas(self.db_name)
+            perguntas = [
+                p.como_dict()
+                for p in banco.sortear(self.dificuldade, self.classe, self.quantidade, self.aleatorio)
+            ]
+
             print(f"Encontradas {len(perguntas)} perguntas para dificuldade {self.dificuldade} e classe {self.classe}")
-            conn.close()
             return perguntas
         except Exception as e:
-            messagebox.showerror("Erro", f"Falha ao carregar perguntas: {str(e)}")
+            print(f"Falha ao carregar perguntas: {e}")
             return []
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    
-    # Exemplos corretos:
-    # Ato I (Classe 5) - Fase Fácil (Dificuldade 1)
-    # jogo = QuizGame(root, nivel="1-5")  # Dificuldade 1, Classe 5
-    
-    # Ato II (Classe 4) - Fase Média (Dificuldade 2)
-    jogo = QuizGame(root, nivel="2-4")
-    
-    # Ato III (Classe 3) - Fase Difícil (Dificuldade 3)
-    # jogo = QuizGame(root, nivel="3-3")
-    
-    root.mainloop()
\ No newline at end of file
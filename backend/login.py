@@ -1,21 +1,25 @@
-from PyQt6.QtWidgets import QMessageBox
 from database.criar_banco import Database, Funcoes_DataBase
 import sys
 import os
 from backend.validador import Validador
+from backend import senhas
+from database.consultas import SQL_BUSCAR_USUARIO
 import sqlite3
-import hashlib
 
 
 class Login:
-    def __init__(self):
-        db_path = os.path.join("database", "raizes_ocultas.db")
-        self.db = Funcoes_DataBase(db_path)
+    def __init__(self, db_path=os.path.join("database", "raizes_ocultas.db")):
+        self.db_path = db_path
+        self.db = Funcoes_DataBase(self.db_path)
     
     def verificar_credenciais(self, email: str, senha: str) -> tuple:
         """
         Verifica as credenciais de login do usuário
         
+        A KDF leva dezenas de milissegundos: na interface, chame em uma
+        thread de trabalho (ver front/tarefas.py). Hashes antigos ou com
+        custo diferente do configurado são regravados após um login válido.
+        
         Args:
             email: Email do usuário
             senha: Senha em texto puro (será hasheada para comparação)
@@ -28,39 +32,35 @@ class Login:
             return False, "Erro ao conectar ao banco", None
             
         try:
-            with conn:
-                cursor = conn.cursor()
-                
-                # Hash da senha fornecida
-                senha_hash = hashlib.sha256(senha.encode()).hexdigest()
-                
-                # Busca usuário pelo email
-                cursor.execute("""
-                    SELECT id_usuario, cripto_senha, deletado 
-                    FROM Usuario 
-                    WHERE email = ?
-                """, (email,))
-                
-                usuario = cursor.fetchone()
-                
-                if not usuario:    
-                    return False, "E-mail não cadastrado", None
-
-                id_usuario, hash_armazenado, deletado = usuario
-                
-                if deletado:
-                    return False, "Conta desativada", None
-                    
-                if senha_hash != hash_armazenado:
-                    return False, "Senha incorreta", None
-                    
-                return True, "Login bem-sucedido", id_usuario
-                
+            # Busca usuário pelo email
+            cursor = conn.execute(SQL_BUSCAR_USUARIO, (email,))
+            usuario = cursor.fetchone()
         except sqlite3.Error as e:
             print(f"Erro ao verificar login: {e}")
             return False, f"Erro no banco de dados: {e}", None
         finally:
+            # A conexão não fica presa durante o cálculo do hash
             self.db.db.fechar_conexao()
+                
+        if not usuario:    
+            return False, "E-mail não cadastrado", None
+
+        id_usuario, hash_armazenado, deletado = usuario
+        
+        if deletado:
+            return False, "Conta desativada", None
+
+        algoritmo, custo = senhas.custo_configurado(self.db_path)
+        valida, precisa_rehash = senhas.verificar(senha, hash_armazenado, custo, algoritmo)
+        if not valida:
+            return False, "Senha incorreta", None
+
+        if precisa_rehash:
+            novo_hash = senhas.gerar_hash(senha, custo, algoritmo)
+            if self.db.atualizar_senha(id_usuario, novo_hash):
+                print(f"🔐 Hash de senha do usuário {id_usuario} atualizado para {algoritmo}")
+            
+        return True, "Login bem-sucedido", id_usuario
 
     def realizar_login(self, email: str, senha: str) -> tuple:
         """
@@ -83,4 +83,14 @@ class Login:
             return False, msg, None
             
         # Verifica  no banco
-        return self.verificar_credenciais(email, senha)
\ No newline at end of file
+        return self.verificar_credenciais(email, senha)
+
+
+_login = None
+
+def obter_login():
+    """Serviço de login compartilhado pelo processo (sem estado por chamada)"""
+    global _login
+    if _login is None:
+        _login = Login()
+    return _login
@@ -0,0 +1,240 @@
+import os
+import marshal
+import threading
+from collections import OrderedDict
+
+RAIZ_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_ROTEIROS = os.path.join(RAIZ_PROJETO, "assets", "roteiros")
+PASTA_COMPILADOS = os.path.join(RAIZ_PROJETO, "assets", ".cache", "roteiros")
+VERSAO_FORMATO = 1
+
+# Instruções compiladas: tuplas cujo primeiro item é o código da operação
+FALA = 0      # (FALA, falante, texto)
+ESCOLHA = 1   # (ESCOLHA, falante, pergunta, ((rotulo, destino), ...))
+QUIZ = 2      # (QUIZ, dificuldade, classe, quantidade, destino_acerto, destino_erro)
+IR = 3        # (IR, destino)
+FIM = 4       # (FIM,)
+
+INSTRUCAO_FIM = (FIM,)
+
+
+def compilar(linhas, nome="roteiro"):
+    """
+    Compila o texto de um Ato em {cena: tupla de instruções}.
+
+    Formato (uma instrução por linha, '#' inicia comentário):
+        [cena]                          início de uma cena
+        @Falante                        falante das próximas falas
+        texto                           fala do falante atual
+        ? pergunta                      escolha; seguida de linhas '* rótulo -> destino'
+        !quiz dif classe qtd -> acerto | erro
+        -> destino                      desvio (destino = cena ou ato:cena)
+        !fim                            encerra o roteiro
+
+    Raises:
+        ValueError: com o número da linha, se o texto for inválido
+    """
+    cenas = {}
+    cena = None
+    instrucoes = []
+    falante = "narrador"
+    escolha = None
+
+    def fechar_cena():
+        if cena is not None:
+            cenas[cena] = tuple(instrucoes)
+
+    for numero, linha in enumerate(linhas, 1):
+        linha = linha.strip()
+        if not linha or linha.startswith("#"):
+            continue
+
+        def erro(msg):
+            return ValueError(f"{nome}:{numero}: {msg}")
+
+        if escolha is not None and not linha.startswith("*"):
+            if not escolha[3]:
+                raise erro("escolha sem opções")
+            instrucoes.append((ESCOLHA, escolha[1], escolha[2], tuple(escolha[3])))
+            escolha = None
+
+        if linha.startswith("[") and linha.endswith("]"):
+            fechar_cena()
+            cena, instrucoes, falante = linha[1:-1].strip(), [], "narrador"
+            if cena in cenas:
+                raise erro(f"cena '{cena}' repetida")
+            continue
+        if cena is None:
+            raise erro("instrução fora de uma cena")
+
+        if linha.startswith("@"):
+            falante = linha[1:].strip()
+        elif linha.startswith("?"):
+            escolha = [ESCOLHA, falante, linha[1:].strip(), []]
+        elif linha.startswith("*"):
+            if escolha is None or "->" not in linha:
+                raise erro("opção deve seguir '?' e ter '-> destino'")
+            rotulo, destino = linha[1:].split("->", 1)
+            escolha[3].append((rotulo.strip(), destino.strip()))
+        elif linha.startswith("->"):
+            instrucoes.append((IR, linha[2:].strip()))
+        elif linha == "!fim":
+            instrucoes.append(INSTRUCAO_FIM)
+        elif linha.startswith("!quiz"):
+            try:
+                parametros, destinos = linha[5:].split("->", 1)
+                dificuldade, classe, quantidade = (int(v) for v in parametros.split())
+                acerto, falha = (d.strip() for d in destinos.split("|", 1))
+            except ValueError:
+                raise erro("use '!quiz dificuldade classe quantidade -> acerto | erro'")
+            instrucoes.append((QUIZ, dificuldade, classe, quantidade, acerto, falha))
+        else:
+            instrucoes.append((FALA, falante, linha))
+
+    if escolha is not None:
+        if not escolha[3]:
+            raise ValueError(f"{nome}: escolha sem opções no fim do arquivo")
+        instrucoes.append((ESCOLHA, escolha[1], escolha[2], tuple(escolha[3])))
+    fechar_cena()
+    return cenas
+
+
+class CacheRoteiros:
+    """
+    Carrega os Atos sob demanda, no máximo `max_atos` em memória (LRU).
+
+    O arquivo de cada Ato é interpretado uma única vez: a forma compilada é
+    gravada com marshal em assets/.cache/roteiros, com o mtime do original
+    no nome, e as próximas leituras só desserializam as tuplas.
+    """
+
+    def __init__(self, pasta=PASTA_ROTEIROS, max_atos=2):
+        self.pasta = pasta
+        self.max_atos = max_atos
+        self._atos = OrderedDict()
+        self._lock = threading.Lock()
+        self.estatisticas = {'memoria': 0, 'compilados': 0, 'interpretados': 0}
+
+    def caminho(self, ato):
+        return os.path.join(self.pasta, f"ato_{ato}.txt")
+
+    def ato(self, ato):
+        """
+        Returns:
+            dict: {cena: instruções} do Ato
+
+        Raises:
+            FileNotFoundError: se o arquivo do Ato não existir
+        """
+        ato = str(ato)
+        with self._lock:
+            cenas = self._atos.get(ato)
+            if cenas is not None:
+                self._atos.move_to_end(ato)
+                self.estatisticas['memoria'] += 1
+                return cenas
+
+            cenas = self._carregar(ato)
+            self._atos[ato] = cenas
+            while len(self._atos) > self.max_atos:
+                self._atos.popitem(last=False)
+            return cenas
+
+    def _carregar(self, ato):
+        caminho = self.caminho(ato)
+        info = os.stat(caminho)
+        compilado = os.path.join(
+            PASTA_COMPILADOS, f"ato_{ato}-{info.st_mtime_ns}-{info.st_size}-v{VERSAO_FORMATO}.bin"
+        )
+        try:
+            with open(compilado, "rb") as f:
+                cenas = marshal.load(f)
+            self.estatisticas['compilados'] += 1
+            return cenas
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        with open(caminho, encoding="utf-8") as f:
+            cenas = compilar(f, os.path.basename(caminho))
+        self.estatisticas['interpretados'] += 1
+
+        try:
+            os.makedirs(PASTA_COMPILADOS, exist_ok=True)
+            temporario = f"{compilado}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporario, "wb") as f:
+                marshal.dump(cenas, f)
+            os.replace(temporario, compilado)
+        except OSError as e:
+            print(f"⚠️ Não foi possível gravar o roteiro compilado do ato {ato}: {e}")
+        return cenas
+
+
+_cache = None
+
+def obter_cache_roteiros():
+    """Retorna o CacheRoteiros compartilhado pelo processo"""
+    global _cache
+    if _cache is None:
+        _cache = CacheRoteiros()
+    return _cache
+
+
+class MotorRoteiro:
+    """
+    Executa um roteiro compilado, uma instrução por vez.
+
+    proximo() devolve a próxima instrução a ser exibida (FALA, ESCOLHA, QUIZ
+    ou FIM); desvios (IR) são resolvidos internamente. Depois de uma ESCOLHA
+    chame escolher(indice); depois de um QUIZ, resultado_quiz(acertou).
+    Destinos são 'cena' (no Ato atual) ou 'ato:cena'.
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache or obter_cache_roteiros()
+        self.ato = None
+        self.cena = None
+        self._instrucoes = ()
+        self._pc = 0
+        self._pendente = None
+
+    def iniciar(self, destino):
+        self._pendente = None
+        self._ir(destino)
+
+    def _ir(self, destino):
+        ato, _, cena = destino.rpartition(":")
+        if ato:
+            self.ato = ato
+        cenas = self.cache.ato(self.ato)
+        if cena not in cenas:
+            raise KeyError(f"Cena '{cena}' não existe no ato {self.ato}")
+        self.cena = cena
+        self._instrucoes = cenas[cena]
+        self._pc = 0
+
+    def proximo(self):
+        if self._pendente is not None:
+            return self._pendente
+        while self._pc < len(self._instrucoes):
+            instrucao = self._instrucoes[self._pc]
+            self._pc += 1
+            op = instrucao[0]
+            if op == IR:
+                self._ir(instrucao[1])
+                continue
+            if op in (ESCOLHA, QUIZ):
+                self._pendente = instrucao
+            return instrucao
+        return INSTRUCAO_FIM
+
+    def escolher(self, indice):
+        instrucao, self._pendente = self._pendente, None
+        if instrucao is None or instrucao[0] != ESCOLHA:
+            raise RuntimeError("Nenhuma escolha pendente")
+        self._ir(instrucao[3][indice][1])
+
+    def resultado_quiz(self, acertou):
+        instrucao, self._pendente = self._pendente, None
+        if instrucao is None or instrucao[0] != QUIZ:
+            raise RuntimeError("Nenhum quiz pendente")
+        self._ir(instrucao[4] if acertou else instrucao[5])
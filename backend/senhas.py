@@ -0,0 +1,210 @@
+"""
+Hash de senhas com função de derivação de chave (KDF) salgada e de custo ajustável.
+
+O valor guardado em Usuario.cripto_senha carrega o algoritmo e o custo
+usados, para que hashes antigos continuem válidos quando o custo muda:
+
+    scrypt$<log2 N>$<r>$<p>$<sal hex>$<hash hex>
+    pbkdf2_sha256$<iterações>$<sal hex>$<hash hex>
+
+Hashes SHA-256 sem sal (64 caracteres hexadecimais) das versões anteriores
+ainda são aceitos no login e trocados pelo formato atual (ver verificar).
+
+O custo é calibrado na máquina onde o jogo roda e guardado em Metadados:
+
+    python -m backend.senhas --calibrar [--alvo-ms 250] [--banco caminho.db]
+"""
+import os
+import sys
+import hmac
+import time
+import hashlib
+import argparse
+import threading
+from database.criar_banco import Funcoes_DataBase
+from database.migracoes import aplicar_migracoes
+
+# scrypt depende do OpenSSL do Python; PBKDF2 está sempre disponível
+ALGORITMO = "scrypt" if hasattr(hashlib, "scrypt") else "pbkdf2_sha256"
+CUSTO_PADRAO = {"scrypt": 14, "pbkdf2_sha256": 200_000}  # log2(N) / iterações
+CUSTO_MINIMO = {"scrypt": 12, "pbkdf2_sha256": 50_000}
+CUSTO_MAXIMO_SCRYPT = 19  # N = 2**19 usa 512 MiB de memória com r=8
+MAXMEM_SCRYPT = 2**31 - 1  # limite aceito pelo hashlib.scrypt
+SCRYPT_R, SCRYPT_P = 8, 1
+TAMANHO_SAL = 16
+TAMANHO_HASH = 32
+CHAVE_CUSTO = "custo_senha"
+
+_custos = {}  # caminho do banco -> (algoritmo, custo) lido de Metadados
+_custos_lock = threading.Lock()
+
+
+def _scrypt(senha, sal, log_n, r, p):
+    n = 1 << log_n
+    return hashlib.scrypt(senha.encode(), salt=sal, n=n, r=r, p=p,
+                          maxmem=min(256 * r * n, MAXMEM_SCRYPT), dklen=TAMANHO_HASH)
+
+
+def _pbkdf2(senha, sal, iteracoes):
+    return hashlib.pbkdf2_hmac("sha256", senha.encode(), sal, iteracoes, dklen=TAMANHO_HASH)
+
+
+def gerar_hash(senha, custo=None, algoritmo=ALGORITMO):
+    """
+    Gera o hash salgado da senha no formato de cripto_senha.
+
+    Args:
+        custo: log2(N) no scrypt, iterações no PBKDF2 (padrão: CUSTO_PADRAO)
+    """
+    custo = custo or CUSTO_PADRAO[algoritmo]
+    sal = os.urandom(TAMANHO_SAL)
+    if algoritmo == "scrypt":
+        chave = _scrypt(senha, sal, custo, SCRYPT_R, SCRYPT_P)
+        return f"scrypt${custo}${SCRYPT_R}${SCRYPT_P}${sal.hex()}${chave.hex()}"
+    chave = _pbkdf2(senha, sal, custo)
+    return f"pbkdf2_sha256${custo}${sal.hex()}${chave.hex()}"
+
+
+def eh_legado(armazenado):
+    """True para o SHA-256 sem sal usado antes da KDF"""
+    return len(armazenado) == 64 and "$" not in armazenado
+
+
+def verificar(senha, armazenado, custo=None, algoritmo=ALGORITMO):
+    """
+    Compara a senha com o hash armazenado, em tempo constante.
+
+    Args:
+        custo, algoritmo: configuração atual; hashes diferentes dela pedem rehash
+
+    Returns:
+        tuple: (valida: bool, precisa_rehash: bool)
+    """
+    custo = custo or CUSTO_PADRAO[algoritmo]
+    try:
+        if eh_legado(armazenado):
+            calculado = hashlib.sha256(senha.encode()).hexdigest()
+            return hmac.compare_digest(calculado, armazenado.lower()), True
+
+        partes = armazenado.split("$")
+        if partes[0] == "scrypt" and len(partes) == 6:
+            log_n, r, p = map(int, partes[1:4])
+            sal, esperado = bytes.fromhex(partes[4]), bytes.fromhex(partes[5])
+            calculado = _scrypt(senha, sal, log_n, r, p)
+            atual = (algoritmo, custo) == ("scrypt", log_n) and (r, p) == (SCRYPT_R, SCRYPT_P)
+        elif partes[0] == "pbkdf2_sha256" and len(partes) == 4:
+            iteracoes = int(partes[1])
+            sal, esperado = bytes.fromhex(partes[2]), bytes.fromhex(partes[3])
+            calculado = _pbkdf2(senha, sal, iteracoes)
+            atual = (algoritmo, custo) == ("pbkdf2_sha256", iteracoes)
+        else:
+            print(f"⚠️ Formato de hash de senha desconhecido: {partes[0]!r}")
+            return False, False
+    except (ValueError, MemoryError, AttributeError) as e:
+        print(f"⚠️ Hash de senha inválido: {e}")
+        return False, False
+
+    valida = hmac.compare_digest(calculado, esperado)
+    return valida, valida and not atual
+
+
+def custo_configurado(db_name):
+    """
+    (algoritmo, custo) calibrados para este banco, lidos uma vez por processo.
+
+    Sem calibração (ou se o algoritmo salvo não existir neste Python), usa
+    ALGORITMO com CUSTO_PADRAO.
+    """
+    chave = os.path.abspath(db_name)
+    with _custos_lock:
+        if chave in _custos:
+            return _custos[chave]
+
+    configuracao = (ALGORITMO, CUSTO_PADRAO[ALGORITMO])
+    valor = Funcoes_DataBase(db_name).ler_metadado(CHAVE_CUSTO)
+    if valor:
+        algoritmo, _, custo = valor.partition(":")
+        if algoritmo == ALGORITMO and custo.isdigit():
+            configuracao = (algoritmo, int(custo))
+
+    with _custos_lock:
+        _custos[chave] = configuracao
+    return configuracao
+
+
+def _medir_ms(custo, algoritmo, repeticoes=3):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        gerar_hash("calibracao", custo, algoritmo)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return sorted(tempos)[len(tempos) // 2]
+
+
+def calibrar(alvo_ms=250, algoritmo=ALGORITMO, verbose=True):
+    """
+    Escolhe o maior custo cujo hash leva no máximo `alvo_ms` nesta máquina.
+
+    Returns:
+        tuple: (custo, tempo_ms) do custo escolhido (nunca abaixo de CUSTO_MINIMO)
+    """
+    custo = CUSTO_MINIMO[algoritmo]
+    tempo = _medir_ms(custo, algoritmo)
+    if verbose:
+        print(f"  {algoritmo} custo {custo}: {tempo:.1f} ms")
+
+    while True:
+        if algoritmo == "scrypt":
+            # Cada passo dobra N (e o tempo); não passa do limite de memória
+            if custo >= CUSTO_MAXIMO_SCRYPT:
+                break
+            proximo = custo + 1
+        else:
+            # O PBKDF2 é linear nas iterações: estima direto o próximo valor
+            proximo = max(custo + 1000, int(custo * alvo_ms / max(tempo, 0.1) * 0.95))
+            proximo -= proximo % 1000
+        try:
+            tempo_proximo = _medir_ms(proximo, algoritmo)
+        except (ValueError, MemoryError) as e:
+            # Sem memória para o próximo custo: fica com o último que funcionou
+            if verbose:
+                print(f"  {algoritmo} custo {proximo}: indisponível ({e})")
+            break
+        if verbose:
+            print(f"  {algoritmo} custo {proximo}: {tempo_proximo:.1f} ms")
+        if tempo_proximo > alvo_ms or proximo <= custo:
+            break
+        custo, tempo = proximo, tempo_proximo
+    return custo, tempo
+
+
+def salvar_custo(db_name, custo, algoritmo=ALGORITMO):
+    """Grava a calibração em Metadados (os próximos hashes e logins passam a usá-la)"""
+    if not Funcoes_DataBase(db_name).gravar_metadado(CHAVE_CUSTO, f"{algoritmo}:{custo}"):
+        return False
+    with _custos_lock:
+        _custos.pop(os.path.abspath(db_name), None)
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibra o custo do hash de senhas")
+    parser.add_argument("--calibrar", action="store_true", help="mede e grava o custo no banco")
+    parser.add_argument("--alvo-ms", type=float, default=250, help="tempo desejado por verificação")
+    parser.add_argument("--banco", default=os.path.join("database", "raizes_ocultas.db"))
+    args = parser.parse_args()
+
+    algoritmo, atual = custo_configurado(args.banco)
+    print(f"🔐 Custo atual: {algoritmo} {atual}")
+    if not args.calibrar:
+        sys.exit(0)
+
+    # Garante a tabela Metadados em bancos criados por versões antigas
+    aplicar_migracoes(args.banco)
+    print(f"⏱️ Calibrando para {args.alvo_ms:.0f} ms por verificação...")
+    custo, tempo = calibrar(args.alvo_ms)
+    if salvar_custo(args.banco, custo):
+        print(f"✅ Custo {algoritmo} {custo} ({tempo:.1f} ms) gravado em {args.banco}")
+    else:
+        print("❌ Não foi possível gravar o custo no banco")
+        sys.exit(1)
@@ -0,0 +1,124 @@
+"""
+Benchmark do pool de conexões: logins/s e inserções de turma/s.
+
+"antes" reproduz o padrão antigo (abrir conexão, aplicar PRAGMAs e fechar
+a cada chamada); "depois" usa as classes do backend com o pool compartilhado.
+
+Os dois caminhos de login verificam o mesmo hash com backend/senhas.py. O
+tempo da KDF é medido à parte e a busca do usuário sem KDF mostra o efeito
+do pool isolado (a KDF domina o login completo).
+
+Uso: python benchmarks/benchmark_conexoes.py [repeticoes]
+"""
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from database.criar_banco import Database
+from database.consultas import SQL_BUSCAR_USUARIO
+from backend.login import Login
+from backend import senhas
+from backend.cadastrar import cadastrar_usuario_simples
+from backend.cadastrar_turma import CadastrarTurma
+
+DB_PATH = os.path.join("database", "raizes_ocultas.db")
+EMAIL = "benchmark@escola.com"
+SENHA = "senha123"
+
+
+def conectar_sem_pool():
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+def buscar_usuario_sem_pool(email):
+    conn = conectar_sem_pool()
+    try:
+        return conn.execute(SQL_BUSCAR_USUARIO, (email,)).fetchone()
+    finally:
+        conn.close()
+
+
+def buscar_usuario_com_pool(db, email):
+    conn = db.conectar_no_banco()
+    try:
+        return conn.execute(SQL_BUSCAR_USUARIO, (email,)).fetchone()
+    finally:
+        db.fechar_conexao()
+
+
+def login_sem_pool(email, senha):
+    row = buscar_usuario_sem_pool(email)
+    algoritmo, custo = senhas.custo_configurado(DB_PATH)
+    return row is not None and senhas.verificar(senha, row[1], custo, algoritmo)[0]
+
+
+def inserir_turma_sem_pool(nome, id_usuario):
+    conn = conectar_sem_pool()
+    try:
+        with conn:
+            conn.execute("""
+                INSERT INTO Turma (
+                    nome_turma, quantidade_turma, serie_turma,
+                    vida_max, vida_atual, pontos_acerto, pontos_erro, vivo, id_usuario
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (nome, 30, "6º ano", 3, 3, 0, 0, True, id_usuario))
+    finally:
+        conn.close()
+
+
+def medir(nome, funcao, repeticoes):
+    inicio = time.perf_counter()
+    for i in range(repeticoes):
+        funcao(i)
+    duracao = time.perf_counter() - inicio
+    print(f"  {nome:<28} {repeticoes / duracao:>10.0f} op/s  ({duracao * 1000 / repeticoes:.3f} ms/op)")
+    return duracao * 1000 / repeticoes
+
+
+def main(repeticoes=2000):
+    with tempfile.TemporaryDirectory() as pasta:
+        os.chdir(pasta)
+        os.makedirs("database")
+        Database(DB_PATH).criar_tabelas()
+        _, _, id_usuario = cadastrar_usuario_simples("bench", EMAIL, SENHA)
+
+        login = Login()
+        cadastro = CadastrarTurma(id_usuario)
+        db = Database(DB_PATH)
+        algoritmo, custo = senhas.custo_configurado(DB_PATH)
+        hash_usuario = buscar_usuario_sem_pool(EMAIL)[1]
+        # A KDF leva dezenas de ms: o login completo roda menos vezes
+        repeticoes_login = max(10, repeticoes // 100)
+
+        print(f"📊 {repeticoes} repetições por cenário ({repeticoes_login} no login completo)")
+        print("Busca do usuário (sem KDF):")
+        antes = medir("antes (conexão por chamada)", lambda i: buscar_usuario_sem_pool(EMAIL), repeticoes)
+        depois = medir("depois (pool)", lambda i: buscar_usuario_com_pool(db, EMAIL), repeticoes)
+        print(f"  efeito do pool: {antes - depois:.3f} ms/login")
+
+        print(f"KDF ({algoritmo} {custo}):")
+        medir("verificar senha", lambda i: senhas.verificar(SENHA, hash_usuario, custo, algoritmo),
+              repeticoes_login)
+
+        print("Login completo (busca + KDF):")
+        medir("antes (conexão por chamada)", lambda i: login_sem_pool(EMAIL, SENHA), repeticoes_login)
+        medir("depois (pool)", lambda i: login.realizar_login(EMAIL, SENHA), repeticoes_login)
+
+        print("Inserções de turma:")
+        medir("antes (conexão por chamada)", lambda i: inserir_turma_sem_pool(f"antes-{i}", id_usuario), repeticoes)
+        medir("depois (pool)", lambda i: cadastro.cadastrar_turma(f"depois-{i}", 30, "6º ano"), repeticoes)
+
+        Database(DB_PATH).encerrar_conexoes()
+        os.chdir(RAIZ)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,97 @@
+"""
+Benchmark da latência de gravação de uma resposta contra 50 mil perguntas.
+
+"antes" reproduz o caminho antigo de QuizGame.salvar_resposta_turma (nova
+conexão, busca do id pelo texto da pergunta, INSERT e commit); "depois" usa
+Funcoes_DataBase.registrar_resposta com o id já carregado e o pool.
+
+Uso: python benchmarks/benchmark_respostas.py [respostas]
+"""
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+import statistics
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from database.criar_banco import Database, Funcoes_DataBase, Inserir_perguntas
+
+TOTAL_PERGUNTAS = 50_000
+
+
+def preparar_banco(db_path):
+    Database(db_path).criar_tabelas()
+    fdb = Funcoes_DataBase(db_path)
+    id_usuario = fdb.inserir_cliente("bench", "bench@escola.com", "x")
+    turmas = [
+        fdb.inserir_turma(f"turma-{i}", 30, "6º ano", 3, 3, 0, 0, True, id_usuario)
+        for i in range(2)
+    ]
+    perguntas = [
+        {
+            'pergunta': f'Pergunta de teste número {i}?',
+            'classe_pergunta': 3 + i % 3,
+            'dificuldade_pergunta': 1 + i % 4,
+            'opcao_a': 'A', 'opcao_b': 'B', 'opcao_c': 'C', 'opcao_d': 'D',
+            'resposta': 'A'
+        }
+        for i in range(TOTAL_PERGUNTAS)
+    ]
+    Inserir_perguntas(db_path).inserir_perguntas(perguntas)
+    return turmas
+
+
+def salvar_antes(db_path, id_turma, id_pergunta, acertou, tempo):
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT id_pergunta FROM Perguntas 
+        WHERE pergunta = ? AND classe_pergunta = ? AND dificuldade_pergunta = ?
+    """, (f'Pergunta de teste número {id_pergunta - 1}?', 3 + (id_pergunta - 1) % 3, 1 + (id_pergunta - 1) % 4))
+    id_encontrado = cursor.fetchone()[0]
+    cursor.execute("""
+        INSERT OR IGNORE INTO Dados_do_jogador 
+        (id_turma, id_pergunta, acertou, tempo_resposta)
+        VALUES (?, ?, ?, ?)
+    """, (id_turma, id_encontrado, int(acertou), tempo))
+    conn.commit()
+    conn.close()
+
+
+def relatorio(nome, latencias):
+    latencias.sort()
+    p95 = latencias[int(len(latencias) * 0.95) - 1]
+    print(f"  {nome:<10} média {statistics.mean(latencias):7.3f} ms | "
+          f"p50 {statistics.median(latencias):7.3f} ms | p95 {p95:7.3f} ms")
+
+
+def main(respostas=300):
+    with tempfile.TemporaryDirectory() as pasta:
+        db_path = os.path.join(pasta, "raizes_ocultas.db")
+        turma_antes, turma_depois = preparar_banco(db_path)
+        fdb = Funcoes_DataBase(db_path)
+        passo = TOTAL_PERGUNTAS // respostas
+
+        latencias_antes, latencias_depois = [], []
+        for i in range(respostas):
+            id_pergunta = 1 + i * passo
+
+            inicio = time.perf_counter()
+            salvar_antes(db_path, turma_antes, id_pergunta, True, 10)
+            latencias_antes.append((time.perf_counter() - inicio) * 1000)
+
+            inicio = time.perf_counter()
+            fdb.registrar_resposta(turma_depois, id_pergunta, True, 10)
+            latencias_depois.append((time.perf_counter() - inicio) * 1000)
+
+        print(f"📊 {respostas} respostas gravadas contra {TOTAL_PERGUNTAS} perguntas")
+        relatorio("antes", latencias_antes)
+        relatorio("depois", latencias_depois)
+        Database(db_path).encerrar_conexoes()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,92 @@
+"""
+Benchmark da validação a cada tecla na tela de cadastro.
+
+"antes" reproduz o padrão antigo (limpa_erro_estilo + set_erro_estilo com
+setStyleSheet nos campos, que reinterpreta o CSS a cada chamada); "depois"
+digita nos campos da TelaCadastro atual, cuja validação só troca a
+propriedade "erro" sob a folha de estilo da aplicação (front/tema.py).
+
+Roda sem janela (QT_QPA_PLATFORM=offscreen).
+
+Uso: python benchmarks/benchmark_validacao.py [teclas]
+"""
+import os
+import sys
+import time
+import statistics
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.chdir(RAIZ)
+
+from PyQt6.QtWidgets import QApplication
+from front.tema import aplicar_tema
+from front.Screens.Login_screen import TelaCadastro
+
+ESTILO_NORMAL = """
+    QLineEdit {
+        padding: 9px;
+        font-size: 14px;
+        border: 1px solid #ccc;
+        border-radius: 6px;
+        background-color: white;
+        color: #000;
+    }
+    QLineEdit::placeholder {
+        color: #aaa;
+    }
+"""
+ESTILO_ERRO = ESTILO_NORMAL.replace("border: 1px solid #ccc;", "border: 2px solid red;")
+
+# Digitação de um e-mail: inválido até o último caractere, depois válido
+EMAIL = "professora.maria@escola.mt.gov.br"
+
+
+def validar_antes(tela):
+    campos = [tela.input_email, tela.input_senha, tela.input_repetir_senha, tela.input_captcha]
+    for campo in campos:
+        campo.setStyleSheet(ESTILO_NORMAL)
+    email = tela.input_email.text().strip()
+    if email and not tela.valida_email(email):
+        tela.input_email.setStyleSheet(ESTILO_ERRO)
+    repetir = tela.input_repetir_senha.text()
+    if repetir and repetir != tela.input_senha.text():
+        tela.input_repetir_senha.setStyleSheet(ESTILO_ERRO)
+
+
+def medir(nome, app, tela, teclas, validar=None):
+    tempos = []
+    for i in range(teclas):
+        texto = EMAIL[: i % len(EMAIL) + 1]
+        inicio = time.perf_counter()
+        tela.input_email.setText(texto)  # textChanged dispara a validação da tela
+        if validar:
+            validar(tela)
+        app.processEvents()  # inclui o repolimento/pintura pendente
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    tempos.sort()
+    p95 = tempos[int(len(tempos) * 0.95) - 1]
+    print(f"  {nome:<32} média {statistics.mean(tempos):.3f} ms  p95 {p95:.3f} ms  máx {tempos[-1]:.3f} ms")
+
+
+def main(teclas=2000):
+    app = QApplication(sys.argv[:1])
+    aplicar_tema(app)
+
+    print(f"⌨️ {teclas} teclas por cenário")
+
+    tela_antes = TelaCadastro(tela_login_callback=None)
+    tela_antes.input_email.textChanged.disconnect(tela_antes.valida_ao_digitar)
+    tela_antes.show()
+    medir("antes (setStyleSheet por tecla)", app, tela_antes, teclas, validar_antes)
+    tela_antes.close()
+
+    tela_depois = TelaCadastro(tela_login_callback=None)
+    tela_depois.show()
+    medir("depois (propriedade + tema)", app, tela_depois, teclas)
+    tela_depois.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
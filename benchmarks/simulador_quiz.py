@@ -0,0 +1,233 @@
+"""
+Simulador de carga do quiz, sem interface gráfica.
+
+Cria um banco SQLite com as perguntas padrão e milhares de turmas virtuais
+e joga uma partida completa por turma com o QuizGame (backend/jogo.py):
+mesmo sorteio de perguntas, vidas, bônus e gravação por
+salvar_resposta_turma. As partidas rodam em paralelo em `--concorrencia`
+threads.
+
+Modos de gravação:
+  fila    caminho do jogo: GravadorRespostas (write-behind, uma thread grava
+          em lote); a latência vai do registrar() até o commit do lote.
+  direto  cada resposta é gravada pela própria thread da partida, com uma
+          transação por resposta (como vários computadores gravando no
+          mesmo arquivo compartilhado); mede a disputa pelo lock de escrita.
+
+Relata respostas/s, latência de gravação p50/p95/p99, erros de banco
+bloqueado e o crescimento do arquivo (banco + WAL).
+
+Uso: python benchmarks/simulador_quiz.py [--turmas 2000] [--concorrencia 16]
+         [--modo fila|direto] [--acerto 0.7] [--pensar-ms 0] [--semente 42]
+         [--banco caminho.db]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+from database.criar_banco import Database, Funcoes_DataBase, PoolConexoes
+from database.esquema import garantir_esquema
+from backend.banco_perguntas import obter_banco_perguntas
+from backend.gravador_respostas import GravadorRespostas
+from backend.jogo import QuizGame
+
+
+class GravadorMedido(GravadorRespostas):
+    """GravadorRespostas que registra, por resposta, o tempo do registrar() até o commit"""
+
+    def __init__(self, db_name, metricas):
+        super().__init__(db_name)
+        self.metricas = metricas
+
+    def registrar(self, id_turma, id_pergunta, acertou, tempo_resposta):
+        if self._parar:
+            raise RuntimeError("Gravador de respostas já foi encerrado")
+        self.estatisticas['recebidas'] += 1
+        self._fila.put((id_turma, id_pergunta, acertou, tempo_resposta, time.perf_counter()))
+
+    def _gravar(self, lote):
+        sucesso = super()._gravar([item[:4] for item in lote])
+        fim = time.perf_counter()
+        if sucesso:
+            self.metricas.gravadas([(fim - item[4]) * 1000 for item in lote])
+        else:
+            self.metricas.erro(len(lote), "falha ao gravar lote (ver saída do gravador)")
+        return sucesso
+
+
+class GravadorDireto:
+    """Grava cada resposta na thread de quem chamou, em uma transação própria"""
+
+    def __init__(self, db_name, metricas):
+        self.fdb = Funcoes_DataBase(db_name)
+        self.metricas = metricas
+
+    def registrar(self, id_turma, id_pergunta, acertou, tempo_resposta):
+        inicio = time.perf_counter()
+        try:
+            self.fdb.registrar_resposta(id_turma, id_pergunta, acertou, tempo_resposta)
+        except Exception as e:
+            self.metricas.erro(1, str(e))
+            return
+        self.metricas.gravadas([(time.perf_counter() - inicio) * 1000])
+
+    def descarregar(self, timeout=5.0):
+        return True
+
+    def encerrar(self, timeout=5.0):
+        pass
+
+
+class Metricas:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencias = []
+        self.erros = 0
+        self.bloqueios = 0
+        self.mensagens = set()  # amostra das mensagens de erro
+        self.partidas = 0
+        self.vitorias = 0
+
+    def gravadas(self, latencias):
+        with self._lock:
+            self.latencias.extend(latencias)
+
+    def erro(self, quantidade, mensagem):
+        with self._lock:
+            self.erros += quantidade
+            if "locked" in mensagem:
+                self.bloqueios += quantidade
+            if len(self.mensagens) < 5:
+                self.mensagens.add(mensagem)
+
+    def partida(self, venceu):
+        with self._lock:
+            self.partidas += 1
+            self.vitorias += int(venceu)
+
+
+def tamanho_banco(db_path):
+    return sum(os.path.getsize(c) for c in (db_path, f"{db_path}-wal") if os.path.exists(c))
+
+
+def percentil(ordenados, p):
+    if not ordenados:
+        return 0.0
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+def preparar_banco(db_path, turmas):
+    # Mesmo esquema do jogo: migrações, índices e gatilhos de Turma_Estatisticas
+    sucesso, mensagem = garantir_esquema(db_path)
+    if not sucesso:
+        raise RuntimeError(mensagem)
+    fdb = Funcoes_DataBase(db_path)
+    sucesso, mensagem = fdb.inserir_perguntas_padrao()
+    if not sucesso:
+        raise RuntimeError(mensagem)
+    id_usuario = fdb.inserir_cliente("simulador", f"simulador-{time.time_ns()}@escola.com", "x")
+    return [
+        fdb.inserir_turma(f"sim-{id_usuario}-{i}", 30, "6º ano", 3, 3, 0, 0, True, id_usuario)
+        for i in range(turmas)
+    ]
+
+
+def jogar_partida(db_path, id_turma, nivel, gravador, metricas, acerto, pensar_ms, semente):
+    aleatorio = random.Random(semente)
+    jogo = QuizGame(nivel, id_turma, db_name=db_path, aleatorio=aleatorio)
+    jogo.gravador = gravador
+    if not jogo.iniciar():
+        return 0
+
+    respostas = 0
+    while not jogo.terminado:
+        pergunta = jogo.proxima_pergunta()
+        if pergunta is None:
+            break
+        if pensar_ms:
+            time.sleep(aleatorio.uniform(0, 2 * pensar_ms) / 1000)
+        tempo_gasto_ms = aleatorio.randint(1, jogo.tempo_limite * 1000 - 1)
+        if aleatorio.random() < acerto:
+            indice = "ABCD".index(pergunta['resposta'])
+        else:
+            indice = aleatorio.choice([i for i in range(4) if "ABCD"[i] != pergunta['resposta']])
+        jogo.responder(indice, tempo_gasto_ms)
+        respostas += 1
+    metricas.partida(jogo.venceu)
+    return respostas
+
+
+def simular(db_path, turmas=2000, concorrencia=16, modo="fila", acerto=0.7, pensar_ms=0, semente=42):
+    print(f"🏫 Preparando {turmas} turmas em {db_path}...")
+    ids = preparar_banco(db_path, turmas)
+    niveis = obter_banco_perguntas(db_path).niveis_disponiveis()
+    # Cada thread de partida usa a sua própria conexão do pool
+    PoolConexoes.obter(db_path).max_conexoes = concorrencia + 4
+
+    metricas = Metricas()
+    gravador = GravadorMedido(db_path, metricas) if modo == "fila" else GravadorDireto(db_path, metricas)
+    sorteio = random.Random(semente)
+    partidas = [(id_turma, "%d-%d" % sorteio.choice(niveis), semente + i) for i, id_turma in enumerate(ids)]
+
+    tamanho_inicial = tamanho_banco(db_path)
+    print(f"🎮 {turmas} partidas, {concorrencia} em paralelo, gravação '{modo}'...")
+    inicio = time.perf_counter()
+    # As partidas imprimem mensagens do jogo; o relatório vem no final
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        with ThreadPoolExecutor(max_workers=concorrencia, thread_name_prefix="partida") as executor:
+            total = sum(executor.map(
+                lambda p: jogar_partida(db_path, p[0], p[1], gravador, metricas, acerto, pensar_ms, p[2]),
+                partidas
+            ))
+        gravador.descarregar(timeout=60)
+    duracao = time.perf_counter() - inicio
+    gravador.encerrar()
+
+    latencias = sorted(metricas.latencias)
+    crescimento = tamanho_banco(db_path) - tamanho_inicial
+    print(f"📊 Resultado ({duracao:.2f} s)")
+    print(f"  partidas        {metricas.partidas} ({metricas.vitorias} vitórias)")
+    print(f"  respostas       {total} ({total / duracao:,.0f} respostas/s)")
+    print(f"  gravação        p50 {percentil(latencias, 50):.2f} ms | p95 {percentil(latencias, 95):.2f} ms"
+          f" | p99 {percentil(latencias, 99):.2f} ms | máx {latencias[-1] if latencias else 0:.2f} ms")
+    print(f"  erros           {metricas.erros} ({metricas.bloqueios} por banco bloqueado)")
+    for mensagem in sorted(metricas.mensagens):
+        print(f"    ⚠️ {mensagem}")
+    print(f"  banco + WAL     +{crescimento / 1024:,.1f} KB "
+          f"({crescimento / total if total else 0:,.0f} bytes/resposta)")
+    Database(db_path).encerrar_conexoes()
+    return metricas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulador de carga do quiz")
+    parser.add_argument("--turmas", type=int, default=2000)
+    parser.add_argument("--concorrencia", type=int, default=16)
+    parser.add_argument("--modo", choices=("fila", "direto"), default="fila")
+    parser.add_argument("--acerto", type=float, default=0.7, help="probabilidade de acerto de cada resposta")
+    parser.add_argument("--pensar-ms", type=float, default=0, help="tempo médio de reflexão por pergunta")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--banco", help="arquivo SQLite (padrão: arquivo temporário)")
+    args = parser.parse_args()
+
+    opcoes = dict(turmas=args.turmas, concorrencia=args.concorrencia, modo=args.modo,
+                  acerto=args.acerto, pensar_ms=args.pensar_ms, semente=args.semente)
+    if args.banco:
+        simular(args.banco, **opcoes)
+    else:
+        with tempfile.TemporaryDirectory() as pasta:
+            simular(os.path.join(pasta, "raizes_ocultas.db"), **opcoes)
+
+
+if __name__ == "__main__":
+    main()
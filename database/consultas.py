@@ -0,0 +1,60 @@
+"""
+SQL das consultas de leitura frequentes, compartilhado pelo backend e pela
+verificação de planos (database/migracoes.py, CONSULTAS_CRITICAS).
+
+Os serviços executam estas mesmas strings; assim a checagem de índices
+acompanha qualquer mudança nas consultas.
+"""
+
+# backend/login.py: Login.verificar_credenciais
+SQL_BUSCAR_USUARIO = """
+    SELECT id_usuario, cripto_senha, deletado
+    FROM Usuario
+    WHERE email = ?
+"""
+
+# backend/cadastrar_turma.py: CadastrarTurma.listar_turmas_usuario
+SQL_LISTAR_TURMAS_USUARIO = """
+    SELECT id_turma,nome_turma,quantidade_turma,serie_turma FROM Turma
+        WHERE id_usuario = ?
+        ORDER BY id_turma DESC
+"""
+
+# backend/cadastrar_turma.py: CadastrarTurma.listar_turmas_pagina (ver sql_listar_turmas_pagina)
+SQL_LISTAR_TURMAS_PAGINA = """
+    SELECT id_turma,nome_turma,quantidade_turma,serie_turma FROM Turma
+        WHERE id_usuario = ? AND id_turma < ?
+"""
+SQL_FILTRO_BUSCA_TURMAS = " AND (nome_turma LIKE ? ESCAPE '\\' OR serie_turma LIKE ? ESCAPE '\\')"
+SQL_FIM_PAGINA_TURMAS = " ORDER BY id_turma DESC LIMIT ?"
+
+# backend/cadastrar_turma.py: CadastrarTurma.get_estatisticas_turma
+SQL_ESTATISTICAS_TURMA = """
+    SELECT total, acertos, erros, soma_tempo, qtd_tempo
+    FROM Turma_Estatisticas
+    WHERE id_turma = ?
+"""
+
+# backend/cadastrar_turma.py: CadastrarTurma.get_estatisticas_usuario
+SQL_ESTATISTICAS_USUARIO = """
+    SELECT t.id_turma, t.nome_turma, e.total, e.acertos, e.erros, e.soma_tempo, e.qtd_tempo
+    FROM Turma t
+    LEFT JOIN Turma_Estatisticas e ON e.id_turma = t.id_turma
+    WHERE t.id_usuario = ?
+    ORDER BY t.id_turma DESC
+"""
+
+# backend/banco_perguntas.py: QuestionBank.carregar (leitura completa, feita uma vez)
+SQL_CARREGAR_PERGUNTAS = """
+    SELECT id_pergunta, dificuldade_pergunta, classe_pergunta,
+           pergunta, opcao_a, opcao_b, opcao_c, opcao_d, resposta
+    FROM Perguntas
+"""
+
+
+def sql_listar_turmas_pagina(com_busca=False):
+    """Monta a consulta de uma página de turmas, com ou sem o filtro de busca"""
+    sql = SQL_LISTAR_TURMAS_PAGINA
+    if com_busca:
+        sql += SQL_FILTRO_BUSCA_TURMAS
+    return sql + SQL_FIM_PAGINA_TURMAS
@@ -2,41 +2,222 @@ import sqlite3
 from sqlite3 import Error
 import hashlib
 from datetime import datetime
+import atexit
+import threading
+import time
+import csv
+import json
 
 import os 
 
+# Perguntas padrão: arquivo de dados versionado, lido apenas quando precisa ser aplicado.
+# Incremente VERSAO_PERGUNTAS_PADRAO junto com o campo "versao" do arquivo.
+ARQUIVO_PERGUNTAS_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perguntas_padrao.json")
+VERSAO_PERGUNTAS_PADRAO = 1
+
+# Threads de longa duração além do pool de trabalho da interface (QThreadPool, uma por
+# núcleo): interface, gravador de respostas, ServicoAssets, pirâmide de tiles e folga
+CONEXOES_SERVICOS = 8
+
+class PoolConexoes:
+    """
+    Pool de conexões SQLite compartilhado pelo processo.
+
+    Cada thread recebe a sua própria conexão, aberta uma única vez com os
+    PRAGMAs já aplicados e reaproveitada nas chamadas seguintes.
+
+    O limite padrão cobre o QThreadPool (um por núcleo) mais as threads de
+    serviço. Se ele for atingido, a chamada espera até `timeout` segundos por
+    uma vaga (a conexão de uma thread encerrada) antes de falhar.
+    """
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, db_name, max_conexoes=None, timeout=10, intervalo_verificacao=30.0):
+        self.db_name = db_name
+        self.max_conexoes = max_conexoes or (os.cpu_count() or 4) + CONEXOES_SERVICOS
+        self.timeout = timeout
+        self.intervalo_verificacao = intervalo_verificacao
+        self._local = threading.local()
+        self._conexoes = {}  # ident da thread -> conexão
+        self._lock = threading.Lock()
+        self._vaga = threading.Condition(self._lock)
+        self.estatisticas = {'abertas': 0, 'reutilizadas': 0, 'descartadas': 0, 'esperas': 0}
+
+    @classmethod
+    def obter(cls, db_name):
+        """Retorna o pool do arquivo informado, criando-o na primeira chamada"""
+        chave = os.path.abspath(db_name)
+        with cls._pools_lock:
+            pool = cls._pools.get(chave)
+            if pool is None:
+                pool = cls(db_name)
+                cls._pools[chave] = pool
+            return pool
+
+    @classmethod
+    def encerrar_todos(cls):
+        """Fecha as conexões de todos os pools (chamado ao encerrar o processo)"""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+        for pool in pools:
+            pool.encerrar()
+
+    def _abrir(self):
+        conn = sqlite3.connect(self.db_name, timeout=self.timeout, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _saudavel(self, conn):
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except Error:
+            return False
+
+    def _liberar_threads_mortas(self):
+        vivas = {t.ident for t in threading.enumerate()}
+        for ident in [i for i in self._conexoes if i not in vivas]:
+            conn = self._conexoes.pop(ident)
+            try:
+                conn.close()
+            except Error:
+                pass
+            self.estatisticas['descartadas'] += 1
+
+    def conexao(self):
+        """Retorna a conexão da thread atual, abrindo uma nova se necessário"""
+        conn = getattr(self._local, 'conn', None)
+        agora = time.monotonic()
+
+        if conn is not None:
+            if agora - self._local.ultimo_uso < self.intervalo_verificacao or self._saudavel(conn):
+                self._local.ultimo_uso = agora
+                self.estatisticas['reutilizadas'] += 1
+                return conn
+            self._descartar_local()
+
+        with self._lock:
+            # O ident pode ter sido herdado de uma thread que já terminou
+            antiga = self._conexoes.pop(threading.get_ident(), None)
+            if antiga is not None:
+                antiga.close()
+                self.estatisticas['descartadas'] += 1
+            prazo = agora + self.timeout
+            esperou = False
+            while len(self._conexoes) >= self.max_conexoes:
+                # Uma vaga só abre quando outra thread termina ou descarta a sua conexão
+                self._liberar_threads_mortas()
+                if len(self._conexoes) < self.max_conexoes:
+                    break
+                restante = prazo - time.monotonic()
+                if restante <= 0:
+                    raise Error(f"Limite de {self.max_conexoes} conexões atingido")
+                if not esperou:
+                    esperou = True
+                    self.estatisticas['esperas'] += 1
+                self._vaga.wait(min(restante, 0.05))
+            conn = self._abrir()
+            self._conexoes[threading.get_ident()] = conn
+            self.estatisticas['abertas'] += 1
+
+        self._local.conn = conn
+        self._local.ultimo_uso = agora
+        return conn
+
+    def devolver(self, conn):
+        """Devolve a conexão ao pool, desfazendo transações deixadas abertas"""
+        if conn is None:
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.ProgrammingError:
+            pass  # conexão já encerrada pelo pool (ex.: ao finalizar o processo)
+        except Error as e:
+            print(f'Erro ao desfazer transação pendente: {e}')
+
+    def _descartar_local(self):
+        conn = getattr(self._local, 'conn', None)
+        self._local.conn = None
+        if conn is None:
+            return
+        with self._lock:
+            self._conexoes.pop(threading.get_ident(), None)
+            self._vaga.notify()
+        try:
+            conn.close()
+        except Error:
+            pass
+        self.estatisticas['descartadas'] += 1
+
+    def encerrar(self):
+        """Fecha todas as conexões abertas pelo pool"""
+        with self._lock:
+            conexoes = list(self._conexoes.values())
+            self._conexoes.clear()
+            self._vaga.notify_all()
+        for conn in conexoes:
+            try:
+                conn.close()
+            except Error as e:
+                print(f'Erro ao Fechar Conexão: {e}')
+        self._local = threading.local()
+
+atexit.register(PoolConexoes.encerrar_todos)
+
 class Database:
     def __init__(self, db_name):
         self.db_name = db_name
-        self.conn = None
-        
+        self._local = threading.local()
+
+    @property
+    def conn(self):
+        # Uma instância pode ser usada por várias threads: cada uma guarda a sua conexão,
+        # para que fechar_conexao nunca desfaça a transação em andamento de outra thread
+        return getattr(self._local, 'conn', None)
+
+    @conn.setter
+    def conn(self, conn):
+        self._local.conn = conn
+
     def banco_existe(self):
         try:
             return os.path.exists(self.db_name)  
         except Exception as e:
             print(f"Erro ao verificar existência do banco: {e}")
             return False
+
+    @property
+    def pool(self):
+        return PoolConexoes.obter(self.db_name)
             
     def conectar_no_banco(self):
         try:
-            if self.conn is None:
-                self.conn = sqlite3.connect(self.db_name, timeout=10)
-                self.conn.execute('PRAGMA journal_mode=WAL')
-                self.conn.execute("PRAGMA foreign_keys = ON")
+            # Sempre pede ao pool: a conexão é da thread atual
+            self.conn = self.pool.conexao()
             return self.conn
         except Error as e:
             print(f'Erro ao Conectar: {e}')
             return None
 
     def fechar_conexao(self):
+        # A conexão pertence ao pool: apenas a devolvemos, sem fechá-la
         if self.conn is not None:
             try:
-                self.conn.close()
+                PoolConexoes.obter(self.db_name).devolver(self.conn)
             except Exception as e:
                 print(f'Erro ao Fechar Conexão: {e}')
             finally:
                 self.conn = None
 
+    def encerrar_conexoes(self):
+        """Fecha de fato todas as conexões do pool deste banco"""
+        self.conn = None
+        self.pool.encerrar()
+
     def __del__(self):
         self.fechar_conexao()
 
@@ -106,7 +287,7 @@ class Database:
                         id_turma INTEGER NOT NULL,
                         id_pergunta INTEGER NOT NULL,
                         acertou BOOLEAN NOT NULL,  -- 1 para acerto, 0 para erro
-                        tempo_resposta INTEGER,     -- Tempo gasto para responder
+                        tempo_resposta INTEGER,     -- Tempo gasto para responder, em milissegundos
                         data_resposta TEXT DEFAULT CURRENT_TIMESTAMP,
                         FOREIGN KEY(id_turma) REFERENCES Turma(id_turma) ON DELETE CASCADE,
                         FOREIGN KEY(id_pergunta) REFERENCES Perguntas(id_pergunta) ON DELETE CASCADE,
@@ -139,6 +320,13 @@ class Database:
                     FOREIGN KEY(id_pergunta) REFERENCES Perguntas(id_pergunta) ON DELETE CASCADE
                 )
                 """)
+                #----------------  Metadados (ex.: versão das perguntas padrão) ---------------
+                cursor.execute("""
+                CREATE TABLE IF NOT EXISTS Metadados(
+                    chave TEXT PRIMARY KEY,
+                    valor TEXT NOT NULL
+                )
+                """)
                 
             return True
         except Error as e:
@@ -172,6 +360,50 @@ class Funcoes_DataBase:
         finally:
             self.db.fechar_conexao()
     
+    def inserir_turmas(self, turmas, id_usuario, tamanho_bloco=500):
+        """
+        Insere várias turmas em uma única transação (executemany)
+
+        Nomes que já existem no banco (nome_turma é UNIQUE) são pulados e
+        devolvidos, em vez de abortar a transação inteira.
+
+        Args:
+            turmas: lista de (nome, quantidade, serie, vida_max, vida_atual,
+                    pontos_acerto, pontos_erro, vivo)
+
+        Returns:
+            set: nomes que não foram inseridos por já existirem
+        """
+        conn = self.db.conectar_no_banco()
+        if conn is None:
+            raise Exception("Erro ao conectar ao banco")
+        try:
+            with conn:
+                # Reserva a escrita antes de consultar: nenhum outro processo
+                # cadastra um dos nomes entre a verificação e o INSERT
+                conn.execute("BEGIN IMMEDIATE")
+                nomes = [turma[0] for turma in turmas]
+                existentes = set()
+                for i in range(0, len(nomes), tamanho_bloco):
+                    bloco = nomes[i:i + tamanho_bloco]
+                    marcadores = ",".join("?" * len(bloco))
+                    existentes.update(row[0] for row in conn.execute(
+                        f"SELECT nome_turma FROM Turma WHERE nome_turma IN ({marcadores})", bloco
+                    ))
+                conn.executemany("""
+                    INSERT INTO Turma (
+                        nome_turma, quantidade_turma, serie_turma,
+                        vida_max, vida_atual, pontos_acerto, pontos_erro, vivo, id_usuario
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (turma + (id_usuario,) for turma in turmas if turma[0] not in existentes))
+                return existentes
+        except sqlite3.IntegrityError as e:
+            raise Exception(f'Erro de integridade: {str(e)}')
+        except Error as e:
+            raise Exception(f"Erro ao inserir turmas: {str(e)}")
+        finally:
+            self.db.fechar_conexao()
+
     # Atualiza os Status da tumra 
     def atuaziar_status_turma(self,id_turma):
         cursor = self.conn.cursor()
@@ -222,6 +454,41 @@ class Funcoes_DataBase:
             turmas.append(turma)
         return turmas
 
+    def registrar_resposta(self, id_turma, id_pergunta, acertou, tempo_resposta):
+        """Registra a resposta de uma turma (ignora respostas repetidas da mesma pergunta)"""
+        conn = self.db.conectar_no_banco()
+        if conn is None:
+            raise Exception("Erro ao conectar ao banco")
+        try:
+            with conn:
+                conn.execute("""
+                    INSERT OR IGNORE INTO Dados_do_jogador 
+                    (id_turma, id_pergunta, acertou, tempo_resposta)
+                    VALUES (?, ?, ?, ?)
+                """, (id_turma, id_pergunta, int(acertou), tempo_resposta))
+        except Error as e:
+            raise Exception(f"Erro ao registrar resposta: {str(e)}")
+        finally:
+            self.db.fechar_conexao()
+
+    def registrar_respostas(self, respostas):
+        """Registra um lote de respostas (id_turma, id_pergunta, acertou, tempo_resposta) em uma transação"""
+        conn = self.db.conectar_no_banco()
+        if conn is None:
+            raise Exception("Erro ao conectar ao banco")
+        try:
+            with conn:
+                cursor = conn.executemany("""
+                    INSERT OR IGNORE INTO Dados_do_jogador 
+                    (id_turma, id_pergunta, acertou, tempo_resposta)
+                    VALUES (?, ?, ?, ?)
+                """, [(t, p, int(a), tempo) for t, p, a, tempo in respostas])
+                return cursor.rowcount
+        except Error as e:
+            raise Exception(f"Erro ao registrar respostas: {str(e)}")
+        finally:
+            self.db.fechar_conexao()
+
     def limpar_usuarios_deletados(self, dias=30):
         """Remove usuários deletados há mais de X dias"""
         conn = self.db.conectar_no_banco()
@@ -269,441 +536,134 @@ class Funcoes_DataBase:
         finally:
             self.db.fechar_conexao()  # Alterado de self.fechar_conexao() para self.db.fechar_conexao()
         
-    def inserir_perguntas_padrao(self):
-        """Insere as perguntas padrão no banco de dados"""
-        todas_perguntas = [
-            # Ato I — O Chamado da Floresta (Mitologia e Povos Originários)
-            # Fase 1 – Início da Jornada
-            {
-                'pergunta': 'Qual destes animais é sagrado para o povo Bororo?',
-                'classe_pergunta': 5,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Onça-pintada',
-                'opcao_b': 'Arara',
-                'opcao_c': 'Jaburu',
-                'opcao_d': 'Tatu',
-                'resposta': 'C'
-            },
-            {
-                'pergunta': 'A pintura corporal indígena é usada principalmente para...?',
-                'classe_pergunta': 5,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Proteção contra insetos',
-                'opcao_b': 'Expressão cultural e identidade',
-                'opcao_c': 'Camuflagem na floresta',
-                'opcao_d': 'Decorar o corpo para festas',
-                'resposta': 'B'
-            },
-            {
-                'pergunta': 'O que significa o termo "Xingu"?',
-                'classe_pergunta': 5,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Rio grande',
-                'opcao_b': 'Povo guerreiro',
-                'opcao_c': 'Terra fértil',
-                'opcao_d': 'Lugar sagrado',
-                'resposta': 'D'
-            },
-            # Fase 2 – Saberes da Terra
-            {
-                'pergunta': 'Que povo indígena habita o Parque Nacional do Xingu?',
-                'classe_pergunta': 5,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Guarani',
-                'opcao_b': 'Yanomami',
-                'opcao_c': 'Caiapó',
-                'opcao_d': 'Vários povos diferentes',
-                'resposta': 'D'
-            },
-            {
-                'pergunta': 'Qual instrumento é tradicional em rituais indígenas mato-grossenses?',
-                'classe_pergunta': 5,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Violão',
-                'opcao_b': 'Flauta de taquara',
-                'opcao_c': 'Tambor',
-                'opcao_d': 'Pandeiro',
-                'resposta': 'B'
-            },
-            {
-                'pergunta': 'O que representa o urucum na cultura ancestral?',
-                'classe_pergunta': 5,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Proteção espiritual',
-                'opcao_b': 'Fertilidade',
-                'opcao_c': 'Guerra',
-                'opcao_d': 'Colheita abundante',
-                'resposta': 'A'
-            },
-            # Fase 3 – O Espírito da Floresta
-            {
-                'pergunta': 'O que significa o uso de grafismos corporais nas culturas indígenas do Mato Grosso?',
-                'classe_pergunta': 5,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Status social',
-                'opcao_b': 'Proteção espiritual',
-                'opcao_c': 'Identidade cultural',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            {
-                'pergunta': 'Qual a função do pajé nas aldeias?',
-                'classe_pergunta': 5,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Líder político',
-                'opcao_b': 'Guardião do conhecimento espiritual',
-                'opcao_c': 'Caçador',
-                'opcao_d': 'Artista',
-                'resposta': 'B'
-            },
-            {
-                'pergunta': 'Qual é o papel da oralidade na preservação da cultura indígena?',
-                'classe_pergunta': 5,
-                'dificuldade_pergunta': 3,
-                'opcao_a': 'Transmitir conhecimentos entre gerações',
-                'opcao_b': 'Manter viva a língua nativa',
-                'opcao_c': 'Preservar histórias e tradições',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            # Fase 4 – Boss: O Guardião da Neblina
-            {
-                'pergunta': 'Como os povos originários interpretam o tempo e os ciclos naturais?',
-                'classe_pergunta': 5,
-                'dificuldade_pergunta': 3,
-                'opcao_a': 'Como algo linear',
-                'opcao_b': 'Como um ciclo contínuo',
-                'opcao_c': 'Como algo controlado pelos deuses',
-                'opcao_d': 'Como algo aleatório',
-                'resposta': 'B'
-            },
-            
-            # Ato II — Caminhos Ancestrais (Quilombos, Danças e Resistência)
-            # Fase 1 – Batida dos Tambores
-            {
-                'pergunta': 'Qual dança é tradicional em festas de rua mato-grossenses?',
-                'classe_pergunta': 4,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Samba',
-                'opcao_b': 'Siriri',
-                'opcao_c': 'Funk',
-                'opcao_d': 'Forró',
-                'resposta': 'B'
-            },
-            {
-                'pergunta': 'O que é o cururu?',
-                'classe_pergunta': 4,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Um prato típico',
-                'opcao_b': 'Uma dança folclórica',
-                'opcao_c': 'Um instrumento musical',
-                'opcao_d': 'Um tipo de artesanato',
-                'resposta': 'B'
-            },
-            {
-                'pergunta': 'Siriri é uma dança típica do estado? Sim ou não?',
-                'classe_pergunta': 4,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Sim',
-                'opcao_b': 'Não',
-                'opcao_c': '',
-                'opcao_d': '',
-                'resposta': 'A'
-            },
-            # Fase 2 – Cores e Ritmos Quilombolas
-            {
-                'pergunta': 'Que instrumentos são usados no siriri?',
-                'classe_pergunta': 4,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Violão e pandeiro',
-                'opcao_b': 'Tambor e reco-reco',
-                'opcao_c': 'Flauta e violino',
-                'opcao_d': 'Guitarra e baixo',
-                'resposta': 'B'
-            },
-            {
-                'pergunta': 'Qual a origem da expressão "quilombo"?',
-                'classe_pergunta': 4,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Língua banto',
-                'opcao_b': 'Tupi-guarani',
-                'opcao_c': 'Português arcaico',
-                'opcao_d': 'Língua yorubá',
-                'resposta': 'A'
-            },
-            {
-                'pergunta': 'O que representa a Festa de São Benedito?',
-                'classe_pergunta': 4,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'A colheita',
-                'opcao_b': 'A resistência cultural afro-brasileira',
-                'opcao_c': 'O início do inverno',
-                'opcao_d': 'A fundação do estado',
-                'resposta': 'B'
-            },
-            # Fase 3 – A Voz da Ancestralidade
-            {
-                'pergunta': 'Qual a importância do congado para os povos afrodescendentes?',
-                'classe_pergunta': 4,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Celebração religiosa',
-                'opcao_b': 'Manutenção das tradições culturais',
-                'opcao_c': 'Resistência política',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            {
-                'pergunta': 'Como a musicalidade está presente nas manifestações quilombolas?',
-                'classe_pergunta': 4,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Como forma de oração',
-                'opcao_b': 'Como expressão cultural',
-                'opcao_c': 'Como registro histórico',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            {
-                'pergunta': 'Como a dança funciona como resistência cultural nos quilombos?',
-                'classe_pergunta': 4,
-                'dificuldade_pergunta': 3,
-                'opcao_a': 'Preservando tradições africanas',
-                'opcao_b': 'Criando identidade coletiva',
-                'opcao_c': 'Transmitindo conhecimentos',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            # Fase 4 – Boss: A Mãe da Memória Quilombola
-            {
-                'pergunta': 'Quais os principais elementos culturais dos quilombos mato-grossenses?',
-                'classe_pergunta': 4,
-                'dificuldade_pergunta': 3,
-                'opcao_a': 'Dança e música',
-                'opcao_b': 'Culinária',
-                'opcao_c': 'Religiosidade',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            
-            # Ato III — Ecos do Cerrado (Tradições e Natureza)
-            # Fase 1 – Caminho das Pedras Cantantes
-            {
-                'pergunta': 'O que é rasqueado?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Um prato típico',
-                'opcao_b': 'Um ritmo musical',
-                'opcao_c': 'Uma técnica de plantio',
-                'opcao_d': 'Um tipo de artesanato',
-                'resposta': 'B'
-            },
-            {
-                'pergunta': 'Qual desses elementos está presente no cerrado?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Buriti',
-                'opcao_b': 'Araucária',
-                'opcao_c': 'Mangue',
-                'opcao_d': 'Cacto gigante',
-                'resposta': 'A'
-            },
-            {
-                'pergunta': 'Qual o bioma predominante no centro do estado?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Amazônia',
-                'opcao_b': 'Pantanal',
-                'opcao_c': 'Cerrado',
-                'opcao_d': 'Caatinga',
-                'resposta': 'C'
-            },
-            # Fase 2 – Mistérios da Serra
-            {
-                'pergunta': 'A Serra do Roncador é conhecida por quê?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Sua biodiversidade',
-                'opcao_b': 'Seus mistérios e lendas',
-                'opcao_c': 'Sua altura',
-                'opcao_d': 'Sua mineração',
-                'resposta': 'B'
-            },
-            {
-                'pergunta': 'Qual lenda fala de um ser gigante que abre caminhos?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Mãe-do-Ouro',
-                'opcao_b': 'Saci-Pererê',
-                'opcao_c': 'Curupira',
-                'opcao_d': 'Anhangá',
-                'resposta': 'C'
-            },
-            {
-                'pergunta': 'O que é "botina de ouro" no folclore?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Um tesouro escondido',
-                'opcao_b': 'Uma lenda sobre um garimpeiro',
-                'opcao_c': 'Um tipo de calçado tradicional',
-                'opcao_d': 'Uma dança folclórica',
-                'resposta': 'B'
-            },
-            # Fase 3 – O Espantalho do Esquecimento
-            {
-                'pergunta': 'Qual a função da viola de cocho na cultura musical mato-grossense?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Acompanhamento de danças',
-                'opcao_b': 'Solos em festivais',
-                'opcao_c': 'Rituais religiosos',
-                'opcao_d': 'Educação musical',
-                'resposta': 'A'
-            },
-            {
-                'pergunta': 'Em que ocasiões o siriri e o cururu são tradicionalmente apresentados?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Festas juninas',
-                'opcao_b': 'Festas religiosas',
-                'opcao_c': 'Casamentos',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            {
-                'pergunta': 'O que diferencia o rasqueado mato-grossense de outros ritmos brasileiros?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 3,
-                'opcao_a': 'Seu ritmo acelerado',
-                'opcao_b': 'A mistura de influências indígenas, africanas e europeias',
-                'opcao_c': 'O uso de instrumentos únicos',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            # Fase 4 – Boss: O Espantalho do Esquecimento
-            {
-                'pergunta': 'Como a oralidade e a música garantem a continuidade da identidade cultural do cerrado?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 3,
-                'opcao_a': 'Transmitindo conhecimentos tradicionais',
-                'opcao_b': 'Preservando a língua local',
-                'opcao_c': 'Mantendo vivas as histórias e lendas',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            
-            # Ato IV — O Coração do Pantanal (Gastronomia, Água e Mistério)
-            # Fase 1 – Caminho das Águas
-            {
-                'pergunta': 'Qual prato é feito com peixe e muito comum na região?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Moqueca',
-                'opcao_b': 'Pacu assado',
-                'opcao_c': 'Caldo de piranha',
-                'opcao_d': 'Todos os anteriores',
-                'resposta': 'D'
-            },
-            {
-                'pergunta': 'O que é mojica de pintado?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Um tipo de pesca',
-                'opcao_b': 'Um prato feito com peixe pintado',
-                'opcao_c': 'Uma dança tradicional',
-                'opcao_d': 'Um instrumento musical',
-                'resposta': 'B'
-            },
-            {
-                'pergunta': 'O pequi é usado em qual tipo de preparo?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 1,
-                'opcao_a': 'Arroz com pequi',
-                'opcao_b': 'Licor de pequi',
-                'opcao_c': 'Frango com pequi',
-                'opcao_d': 'Todos os anteriores',
-                'resposta': 'D'
-            },
-            # Fase 2 – Festa do Rio
-            {
-                'pergunta': 'Qual instrumento é usado no rasqueado?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Violão',
-                'opcao_b': 'Viola de cocho',
-                'opcao_c': 'Guitarra',
-                'opcao_d': 'Flauta',
-                'resposta': 'B'
-            },
-            {
-                'pergunta': 'Qual a origem do termo "pantaneiro"?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Do modo de vida no Pantanal',
-                'opcao_b': 'De uma tribo indígena',
-                'opcao_c': 'De um tipo de peixe',
-                'opcao_d': 'De uma planta local',
-                'resposta': 'A'
-            },
-            {
-                'pergunta': 'Que animal é símbolo do Pantanal?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Onça-pintada',
-                'opcao_b': 'Tuiuiú',
-                'opcao_c': 'Arara-azul',
-                'opcao_d': 'Jacaré',
-                'resposta': 'B'
-            },
-            # Fase 3 – Encontro das Marés
-            {
-                'pergunta': 'Qual o papel do barco nas festas tradicionais pantaneiras?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Transporte de participantes',
-                'opcao_b': 'Palco para apresentações',
-                'opcao_c': 'Local para preparo de comida',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            {
-                'pergunta': 'Quais alimentos típicos são preparados durante as celebrações ribeirinhas no Pantanal?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 2,
-                'opcao_a': 'Peixes assados',
-                'opcao_b': 'Arroz com pequi',
-                'opcao_c': 'Carne seca',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            {
-                'pergunta': 'Como os ciclos do rio afetam o modo de vida local?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 3,
-                'opcao_a': 'Determinando épocas de pesca',
-                'opcao_b': 'Influenciando a agricultura',
-                'opcao_c': 'Definindo rotas de transporte',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            },
-            # Fase 4 – Boss: O Monstro das Águas Profundas
-            {
-                'pergunta': 'Como a cultura pantaneira une ecologia, misticismo e tradição?',
-                'classe_pergunta': 3,
-                'dificuldade_pergunta': 3,
-                'opcao_a': 'Através de lendas sobre a natureza',
-                'opcao_b': 'Por práticas sustentáveis tradicionais',
-                'opcao_c': 'Na relação harmoniosa com o ambiente',
-                'opcao_d': 'Todas as anteriores',
-                'resposta': 'D'
-            }
-        ]
-        
+    def atualizar_senha(self, id_usuario, cripto_senha):
+        """Substitui o hash de senha do usuário (ex.: ao migrar um hash antigo)"""
+        conn = self.db.conectar_no_banco()
+        if conn is None:
+            return False
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE Usuario SET cripto_senha = ? WHERE id_usuario = ?",
+                    (cripto_senha, id_usuario)
+                )
+            return True
+        except Error as e:
+            print(f"Erro ao atualizar senha: {e}")
+            return False
+        finally:
+            self.db.fechar_conexao()
+
+    def ler_metadado(self, chave, padrao=None):
+        """Valor (texto) guardado em Metadados, ou `padrao` se não existir"""
+        conn = self.db.conectar_no_banco()
+        if conn is None:
+            return padrao
+        try:
+            row = conn.execute("SELECT valor FROM Metadados WHERE chave = ?", (chave,)).fetchone()
+            return row[0] if row else padrao
+        except Error:
+            return padrao
+        finally:
+            self.db.fechar_conexao()
+
+    def gravar_metadado(self, chave, valor):
+        conn = self.db.conectar_no_banco()
+        if conn is None:
+            return False
+        try:
+            with conn:
+                conn.execute("""
+                    INSERT INTO Metadados (chave, valor) VALUES (?, ?)
+                    ON CONFLICT(chave) DO UPDATE SET valor = excluded.valor
+                """, (chave, str(valor)))
+            return True
+        except Error as e:
+            print(f"Erro ao gravar metadado {chave}: {e}")
+            return False
+        finally:
+            self.db.fechar_conexao()
+
+    def versao_perguntas_padrao(self):
+        """Versão do arquivo de perguntas padrão já aplicada ao banco (0 se nunca aplicada)"""
+        return int(self.ler_metadado('versao_perguntas_padrao', 0))
+
+    def inserir_perguntas_padrao(self, forcar=False):
+        """
+        Insere ou atualiza as perguntas padrão a partir de perguntas_padrao.json.
+        O arquivo só é lido quando o banco tem uma versão anterior à do código.
+        """
+        if not forcar and self.versao_perguntas_padrao() >= VERSAO_PERGUNTAS_PADRAO:
+            return True, "Perguntas padrão já estão atualizadas"
+
+        try:
+            with open(ARQUIVO_PERGUNTAS_PADRAO, encoding='utf-8') as arquivo:
+                dados = json.load(arquivo)
+        except (OSError, ValueError) as e:
+            return False, f"Erro ao ler perguntas padrão: {e}"
+
         inserir = Inserir_perguntas(self.db.db_name)
-        return inserir.inserir_perguntas(todas_perguntas)
+        return inserir.sincronizar_perguntas(dados['perguntas'], dados['versao'])
 
 class Inserir_perguntas:
+    # Incrementada a cada inserção para invalidar caches de perguntas (ex.: QuestionBank)
+    versao = 0
+
+    CAMPOS_OBRIGATORIOS = [
+        'pergunta', 'classe_pergunta', 'dificuldade_pergunta',
+        'opcao_a', 'opcao_b', 'opcao_c', 'opcao_d', 'resposta'
+    ]
+
+    SQL_INSERIR = """
+        INSERT INTO Perguntas (
+            pergunta, classe_pergunta, dificuldade_pergunta,
+            opcao_a, opcao_b, opcao_c, opcao_d, resposta
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_name):
         self.db = Database(db_name)
-        
+
+    @classmethod
+    def validar_pergunta(cls, pergunta):
+        """
+        Valida uma pergunta e a converte na tupla usada no INSERT
+
+        Returns:
+            tuple: (sucesso: bool, mensagem: str, dados: tuple ou None)
+        """
+        if not isinstance(pergunta, dict) or not all(pergunta.get(campo) is not None for campo in cls.CAMPOS_OBRIGATORIOS):
+            return False, f"Estrutura inválida na pergunta: {pergunta}", None
+
+        try:
+            classe = int(pergunta['classe_pergunta'])
+            dificuldade = int(pergunta['dificuldade_pergunta'])
+        except (TypeError, ValueError):
+            return False, f"Classe ou dificuldade não numérica na pergunta: {pergunta['pergunta']}", None
+
+        if classe not in (3, 4, 5):
+            return False, f"Classe inválida na pergunta: {pergunta['pergunta']}", None
+
+        if dificuldade not in (1, 2, 3, 4):
+            return False, f"Dificuldade inválida na pergunta: {pergunta['pergunta']}", None
+
+        resposta = str(pergunta['resposta']).strip().upper()
+        if resposta not in ('A', 'B', 'C', 'D'):
+            return False, f"Resposta inválida na pergunta: {pergunta['pergunta']}", None
+
+        # Opções podem ficar vazias (perguntas de sim ou não), o enunciado não
+        textos = [str(pergunta[c]).strip() for c in ('pergunta', 'opcao_a', 'opcao_b', 'opcao_c', 'opcao_d')]
+        if not textos[0]:
+            return False, "Pergunta sem enunciado", None
+
+        return True, "", (textos[0], classe, dificuldade, textos[1], textos[2], textos[3], textos[4], resposta)
+
+    @staticmethod
+    def hash_pergunta(texto):
+        """Hash do texto normalizado (sem diferença de caixa e espaços) usado na deduplicação"""
+        normalizado = " ".join(texto.casefold().split())
+        return hashlib.blake2b(normalizado.encode(), digest_size=16).digest()
+
     def inserir_perguntas(self, lista_perguntas):
         conn = self.db.conectar_no_banco()
         if conn is None:
@@ -714,42 +674,14 @@ class Inserir_perguntas:
                 cursor = conn.cursor()                
                 dados_insercao = []
                 for pergunta in lista_perguntas:
-                    # validando a bendita estrutura básica
-                    campos_obrigatorios = [
-                        'pergunta', 'classe_pergunta', 'dificuldade_pergunta',
-                        'opcao_a', 'opcao_b', 'opcao_c', 'opcao_d', 'resposta'
-                    ]
-                    
-                    if not all(campo in pergunta for campo in campos_obrigatorios):
-                        return False, f"Estrutura inválida na pergunta: {pergunta}"
-                    
-                    # valid valores específicos
-                    if pergunta['classe_pergunta'] not in (3, 4, 5):
-                        return False, f"Classe inválida na pergunta: {pergunta['pergunta']}"
-                    
-                    if pergunta['dificuldade_pergunta'] not in (1, 2, 3, 4):
-                        return False, f"Dificuldade inválida na pergunta: {pergunta['pergunta']}"
-                    
-                    if pergunta['resposta'].upper() not in ('A', 'B', 'C', 'D'):
-                        return False, f"Resposta inválida na pergunta: {pergunta['pergunta']}"                    
-                    dados_insercao.append((
-                        pergunta['pergunta'],
-                        pergunta['classe_pergunta'],
-                        pergunta['dificuldade_pergunta'],
-                        pergunta['opcao_a'],
-                        pergunta['opcao_b'],
-                        pergunta['opcao_c'],
-                        pergunta['opcao_d'],
-                        pergunta['resposta'].upper()
-                    ))                
-                cursor.executemany("""
-                    INSERT INTO Perguntas (
-                        pergunta, classe_pergunta, dificuldade_pergunta,
-                        opcao_a, opcao_b, opcao_c, opcao_d, resposta
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, dados_insercao)
+                    valido, msg, dados = self.validar_pergunta(pergunta)
+                    if not valido:
+                        return False, msg
+                    dados_insercao.append(dados)
+                cursor.executemany(self.SQL_INSERIR, dados_insercao)
                 
-                return True, f"{len(lista_perguntas)} perguntas inseridas com sucesso"
+            Inserir_perguntas.versao += 1
+            return True, f"{len(lista_perguntas)} perguntas inseridas com sucesso"
                 
         except Error as e:
             print(f"Erro ao inserir perguntas: {e}")
@@ -757,40 +689,215 @@ class Inserir_perguntas:
         finally:
             self.db.fechar_conexao()
 
+    def sincronizar_perguntas(self, lista_perguntas, versao):
+        """
+        Upsert idempotente de um conjunto versionado de perguntas (ex.: perguntas padrão).
+        Perguntas são identificadas pelo texto: novas são inseridas e as que
+        mudaram (opções, resposta, nível) são atualizadas, em uma transação.
+        """
+        dados = []
+        for pergunta in lista_perguntas:
+            valido, msg, tupla = self.validar_pergunta(pergunta)
+            if not valido:
+                return False, msg
+            dados.append(tupla)
+
+        conn = self.db.conectar_no_banco()
+        if conn is None:
+            return False, "Erro ao conectar ao banco"
+
+        try:
+            existentes = {}
+            textos = [d[0] for d in dados]
+            for i in range(0, len(textos), 500):
+                parte = textos[i:i + 500]
+                cursor = conn.execute(f"""
+                    SELECT pergunta, id_pergunta, classe_pergunta, dificuldade_pergunta,
+                           opcao_a, opcao_b, opcao_c, opcao_d, resposta
+                    FROM Perguntas WHERE pergunta IN ({','.join('?' * len(parte))})
+                """, parte)
+                for row in cursor:
+                    existentes.setdefault(row[0], (row[1], row[2:]))
+
+            novas = [d for d in dados if d[0] not in existentes]
+            alteradas = [
+                d[1:] + (existentes[d[0]][0],)
+                for d in dados
+                if d[0] in existentes and existentes[d[0]][1] != d[1:]
+            ]
+
+            with conn:
+                conn.executemany(self.SQL_INSERIR, novas)
+                conn.executemany("""
+                    UPDATE Perguntas SET
+                        classe_pergunta = ?, dificuldade_pergunta = ?,
+                        opcao_a = ?, opcao_b = ?, opcao_c = ?, opcao_d = ?, resposta = ?
+                    WHERE id_pergunta = ?
+                """, alteradas)
+                conn.execute("""
+                    INSERT INTO Metadados (chave, valor) VALUES ('versao_perguntas_padrao', ?)
+                    ON CONFLICT(chave) DO UPDATE SET valor = excluded.valor
+                """, (str(versao),))
+
+            if novas or alteradas:
+                Inserir_perguntas.versao += 1
+            return True, f"Perguntas padrão v{versao}: {len(novas)} inseridas, {len(alteradas)} atualizadas"
+
+        except Error as e:
+            print(f"Erro ao sincronizar perguntas: {e}")
+            return False, f"Erro ao sincronizar perguntas: {e}"
+        finally:
+            self.db.fechar_conexao()
+
+    #---------------------- importação em lote -------------------------
+
+    @staticmethod
+    def ler_arquivo(caminho):
+        """
+        Lê perguntas de um arquivo .csv, .jsonl ou .json sob demanda
+
+        Yields:
+            tuple: (numero_linha, pergunta: dict ou None, erro: str ou None)
+        """
+        extensao = os.path.splitext(caminho)[1].lower()
+
+        if extensao == '.csv':
+            with open(caminho, newline='', encoding='utf-8-sig') as arquivo:
+                leitor = csv.DictReader(arquivo)
+                # line_num é a linha do arquivo onde o registro termina (campos
+                # entre aspas podem ocupar várias linhas)
+                for linha in leitor:
+                    yield leitor.line_num, linha, None
+
+        elif extensao in ('.jsonl', '.ndjson'):
+            with open(caminho, encoding='utf-8') as arquivo:
+                for numero, linha in enumerate(arquivo, start=1):
+                    if not linha.strip():
+                        continue
+                    try:
+                        yield numero, json.loads(linha), None
+                    except json.JSONDecodeError as e:
+                        yield numero, None, f"JSON inválido: {e}"
+
+        elif extensao == '.json':
+            with open(caminho, encoding='utf-8') as arquivo:
+                conteudo = json.load(arquivo)
+            if isinstance(conteudo, dict):
+                conteudo = conteudo.get('perguntas', [])
+            for numero, pergunta in enumerate(conteudo, start=1):
+                yield numero, pergunta, None
+
+        else:
+            raise ValueError(f"Formato de arquivo não suportado: {extensao}")
+
+    def importar_perguntas(self, registros, tamanho_lote=1000):
+        """
+        Importa perguntas de um iterável de (numero_linha, pergunta, erro)
+
+        Linhas inválidas ou repetidas (mesmo texto já existente no banco ou
+        no próprio arquivo) são reportadas e puladas, sem abortar a importação.
+        Cada lote de `tamanho_lote` linhas é gravado em sua própria transação.
+
+        Returns:
+            tuple: (sucesso: bool, mensagem: str, relatorio: dict)
+        """
+        relatorio = {'lidas': 0, 'inseridas': 0, 'duplicadas': 0, 'erros': [], 'segundos': 0.0}
+        conn = self.db.conectar_no_banco()
+        if conn is None:
+            return False, "Erro ao conectar ao banco", relatorio
+
+        inicio = time.perf_counter()
+        try:
+            vistos = {self.hash_pergunta(row[0]) for row in conn.execute("SELECT pergunta FROM Perguntas")}
+            lote = []
+            for numero, pergunta, erro in registros:
+                relatorio['lidas'] += 1
+                if erro is None:
+                    _, erro, dados = self.validar_pergunta(pergunta)
+                if erro:
+                    relatorio['erros'].append((numero, erro))
+                    continue
+
+                chave = self.hash_pergunta(dados[0])
+                if chave in vistos:
+                    relatorio['duplicadas'] += 1
+                    continue
+                vistos.add(chave)
+
+                lote.append(dados)
+                if len(lote) >= tamanho_lote:
+                    with conn:
+                        conn.executemany(self.SQL_INSERIR, lote)
+                    relatorio['inseridas'] += len(lote)
+                    lote = []
+
+            if lote:
+                with conn:
+                    conn.executemany(self.SQL_INSERIR, lote)
+                relatorio['inseridas'] += len(lote)
+        except (Error, OSError, ValueError) as e:
+            print(f"Erro ao importar perguntas: {e}")
+            return False, f"Erro ao importar perguntas: {e}", relatorio
+        finally:
+            relatorio['segundos'] = time.perf_counter() - inicio
+            if relatorio['inseridas']:
+                Inserir_perguntas.versao += 1
+            self.db.fechar_conexao()
+
+        return True, (
+            f"{relatorio['inseridas']} perguntas inseridas, {relatorio['duplicadas']} duplicadas, "
+            f"{len(relatorio['erros'])} com erro"
+        ), relatorio
+
+    def importar_arquivo(self, caminho, tamanho_lote=1000):
+        """Importa um arquivo .csv, .jsonl ou .json de perguntas (ver importar_perguntas)"""
+        return self.importar_perguntas(self.ler_arquivo(caminho), tamanho_lote)
+
+def importar_perguntas_cli(caminho_db, arquivos):
+    """Importa arquivos de perguntas pela linha de comando, exibindo erros e vazão"""
+    importador = Inserir_perguntas(caminho_db)
+    for arquivo in arquivos:
+        print(f"Importando {arquivo}...")
+        sucesso, mensagem, relatorio = importador.importar_arquivo(arquivo)
+        for numero, erro in relatorio['erros']:
+            print(f"   linha {numero}: {erro}")
+        segundos = relatorio['segundos'] or 1e-9
+        print(f"{'✅' if sucesso else '❌'} {mensagem}")
+        print(f"   {relatorio['lidas']} linhas em {segundos:.2f}s ({relatorio['lidas'] / segundos:.0f} linhas/s)")
+        if not sucesso:
+            return False
+    return True
+
 if __name__ == "__main__":
+    import sys
+
     pasta_db = "database"
     nome_banco = "raizes_ocultas.db"
     caminho_completo = os.path.join(pasta_db, nome_banco)
     
+    # python database/criar_banco.py importar perguntas.csv [outras.jsonl ...]
+    if len(sys.argv) > 2 and sys.argv[1] == "importar":
+        # Em um checkout novo o banco ainda não existe: cria e migra antes de importar
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from database.esquema import garantir_esquema
+        sucesso, mensagem = garantir_esquema(caminho_completo)
+        if not sucesso:
+            print(f"❌ {mensagem}")
+            sys.exit(1)
+        sys.exit(0 if importar_perguntas_cli(caminho_completo, sys.argv[2:]) else 1)
+    
     db = Database(caminho_completo)
     funcoes = Funcoes_DataBase(caminho_completo)
     
     if not db.banco_existe():
         print("Criando banco de dados e tabelas...")
-        sucesso = db.criar_tabelas()
-        
-        if sucesso:
-            print("Tabelas criadas com sucesso!")            
-            print("Inserindo perguntas padrão...")
-            sucesso, mensagem = funcoes.inserir_perguntas_padrao()
-            print(mensagem)
-        else:
-            print("Erro ao criar tabelas.")
-            exit(1)
     else:
-        print("Banco de dados já existe.")        
-        conn = db.conectar_no_banco()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM Perguntas")
-            count = cursor.fetchone()[0]
-            if count == 0:
-                print("Inserindo perguntas padrão...")
-                sucesso, mensagem = funcoes.inserir_perguntas_padrao()
-                print(mensagem)
-            else:
-                print(f"Banco já contém {count} perguntas.")
-        except Error as e:
-            print(f"Erro ao verificar perguntas: {e}")
-        finally:
-            db.fechar_conexao()
\ No newline at end of file
+        print("Banco de dados já existe, verificando tabelas...")
+    
+    if not db.criar_tabelas():
+        print("Erro ao criar tabelas.")
+        exit(1)
+    
+    print("Verificando perguntas padrão...")
+    sucesso, mensagem = funcoes.inserir_perguntas_padrao()
+    print(mensagem)
@@ -0,0 +1,84 @@
+"""
+Registro do esquema do banco, verificado uma única vez por processo.
+
+garantir_esquema() cria as tabelas que faltarem, aplica as migrações
+pendentes e confere as tabelas obrigatórias; o resultado fica em cache por
+arquivo. Os serviços do backend consultam esquema_pronto() ao serem
+construídos, sem abrir conexão depois da primeira verificação.
+"""
+import os
+import threading
+from sqlite3 import Error
+from database.criar_banco import Database
+from database.migracoes import aplicar_migracoes
+
+TABELAS_OBRIGATORIAS = (
+    "Usuario", "Turma", "Perguntas", "Dados_do_jogador", "Turma_Estatisticas", "Metadados",
+)
+
+_estados = {}  # caminho absoluto do banco -> (sucesso, mensagem)
+_lock = threading.Lock()
+
+
+def _verificar_tabelas(db_name):
+    db = Database(db_name)
+    conn = db.conectar_no_banco()
+    if conn is None:
+        return False, "Erro ao conectar ao banco"
+    try:
+        existentes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    except Error as e:
+        return False, f"Erro ao verificar tabelas: {e}"
+    finally:
+        db.fechar_conexao()
+
+    faltando = [t for t in TABELAS_OBRIGATORIAS if t not in existentes]
+    if faltando:
+        return False, f"Tabelas ausentes: {', '.join(faltando)}"
+    return True, "Esquema verificado"
+
+
+def garantir_esquema(db_name, forcar=False):
+    """
+    Cria/migra o banco e confere as tabelas, só na primeira chamada do processo.
+
+    Returns:
+        tuple: (sucesso: bool, mensagem: str)
+    """
+    chave = os.path.abspath(db_name)
+    with _lock:
+        if not forcar and chave in _estados:
+            return _estados[chave]
+
+        # Chamadas concorrentes esperam a primeira verificação terminar
+        pasta = os.path.dirname(chave)
+        os.makedirs(pasta, exist_ok=True)
+
+        # criar_tabelas é idempotente: também cobre arquivo vazio ou criado pela metade
+        db = Database(db_name)
+        if not db.criar_tabelas():
+            estado = (False, "Erro ao criar tabelas")
+        else:
+            sucesso, mensagem = aplicar_migracoes(db_name)
+            estado = _verificar_tabelas(db_name) if sucesso else (False, mensagem)
+            if estado[0]:
+                estado = (True, mensagem)
+
+        # Uma falha não fica em cache: a próxima chamada tenta de novo
+        if estado[0]:
+            _estados[chave] = estado
+        return estado
+
+
+def esquema_pronto(db_name):
+    """True se o esquema do banco está pronto (verifica na primeira chamada)"""
+    return garantir_esquema(db_name)[0]
+
+
+def invalidar(db_name=None):
+    """Esquece a verificação (ex.: o arquivo do banco foi trocado)"""
+    with _lock:
+        if db_name is None:
+            _estados.clear()
+        else:
+            _estados.pop(os.path.abspath(db_name), None)
@@ -0,0 +1,279 @@
+import os
+import sys
+from sqlite3 import Error
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.criar_banco import Database
+from database.consultas import (
+    SQL_BUSCAR_USUARIO, SQL_LISTAR_TURMAS_USUARIO, SQL_ESTATISTICAS_TURMA,
+    SQL_ESTATISTICAS_USUARIO, sql_listar_turmas_pagina
+)
+
+
+def _colunas(conn, tabela):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({tabela})")}
+
+#---------------------------- Migrações ------------------------------------
+
+def _migrar_dados_do_jogador(conn):
+    # Bancos antigos guardavam (id_boss, flag_progresso) em vez das respostas;
+    # a tabela antiga é preservada como Dados_do_jogador_legado
+    colunas = _colunas(conn, "Dados_do_jogador")
+    if not colunas or "id_pergunta" in colunas:
+        return
+    conn.execute("ALTER TABLE Dados_do_jogador RENAME TO Dados_do_jogador_legado")
+    conn.execute("""
+        CREATE TABLE Dados_do_jogador(
+            id_progresso INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_turma INTEGER NOT NULL,
+            id_pergunta INTEGER NOT NULL,
+            acertou BOOLEAN NOT NULL,
+            tempo_resposta INTEGER,
+            data_resposta TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(id_turma) REFERENCES Turma(id_turma) ON DELETE CASCADE,
+            FOREIGN KEY(id_pergunta) REFERENCES Perguntas(id_pergunta) ON DELETE CASCADE,
+            UNIQUE(id_turma, id_pergunta)
+        )
+    """)
+
+def _criar_indices(conn):
+    # listar_turmas_usuario: filtro por usuário, ordenação e colunas cobertas pelo índice
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_turma_usuario
+        ON Turma(id_usuario, id_turma, nome_turma, quantidade_turma, serie_turma)
+    """)
+    # get_estatisticas_turma: agregação coberta pelo índice
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_dados_turma
+        ON Dados_do_jogador(id_turma, acertou, tempo_resposta)
+    """)
+    # Seleção de perguntas por nível
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_perguntas_nivel
+        ON Perguntas(dificuldade_pergunta, classe_pergunta)
+    """)
+
+def _criar_estatisticas_turma(conn):
+    # Resumo por turma mantido por gatilhos a cada resposta gravada, para que
+    # as estatísticas não precisem agregar todo o histórico de Dados_do_jogador
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS Turma_Estatisticas(
+            id_turma INTEGER PRIMARY KEY,
+            total INTEGER NOT NULL DEFAULT 0,
+            acertos INTEGER NOT NULL DEFAULT 0,
+            erros INTEGER NOT NULL DEFAULT 0,
+            soma_tempo INTEGER NOT NULL DEFAULT 0,
+            qtd_tempo INTEGER NOT NULL DEFAULT 0,
+            ultima_atividade TEXT,
+            FOREIGN KEY(id_turma) REFERENCES Turma(id_turma) ON DELETE CASCADE
+        )
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_estatisticas_insert
+        AFTER INSERT ON Dados_do_jogador
+        BEGIN
+            INSERT INTO Turma_Estatisticas (id_turma) VALUES (NEW.id_turma)
+                ON CONFLICT(id_turma) DO NOTHING;
+            UPDATE Turma_Estatisticas SET
+                total = total + 1,
+                acertos = acertos + (NEW.acertou != 0),
+                erros = erros + (NEW.acertou = 0),
+                soma_tempo = soma_tempo + COALESCE(NEW.tempo_resposta, 0),
+                qtd_tempo = qtd_tempo + (NEW.tempo_resposta IS NOT NULL),
+                ultima_atividade = COALESCE(NEW.data_resposta, CURRENT_TIMESTAMP)
+            WHERE id_turma = NEW.id_turma;
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_estatisticas_delete
+        AFTER DELETE ON Dados_do_jogador
+        BEGIN
+            UPDATE Turma_Estatisticas SET
+                total = total - 1,
+                acertos = acertos - (OLD.acertou != 0),
+                erros = erros - (OLD.acertou = 0),
+                soma_tempo = soma_tempo - COALESCE(OLD.tempo_resposta, 0),
+                qtd_tempo = qtd_tempo - (OLD.tempo_resposta IS NOT NULL)
+            WHERE id_turma = OLD.id_turma;
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_estatisticas_update
+        AFTER UPDATE OF id_turma, acertou, tempo_resposta ON Dados_do_jogador
+        BEGIN
+            UPDATE Turma_Estatisticas SET
+                total = total - 1,
+                acertos = acertos - (OLD.acertou != 0),
+                erros = erros - (OLD.acertou = 0),
+                soma_tempo = soma_tempo - COALESCE(OLD.tempo_resposta, 0),
+                qtd_tempo = qtd_tempo - (OLD.tempo_resposta IS NOT NULL)
+            WHERE id_turma = OLD.id_turma;
+            INSERT INTO Turma_Estatisticas (id_turma) VALUES (NEW.id_turma)
+                ON CONFLICT(id_turma) DO NOTHING;
+            UPDATE Turma_Estatisticas SET
+                total = total + 1,
+                acertos = acertos + (NEW.acertou != 0),
+                erros = erros + (NEW.acertou = 0),
+                soma_tempo = soma_tempo + COALESCE(NEW.tempo_resposta, 0),
+                qtd_tempo = qtd_tempo + (NEW.tempo_resposta IS NOT NULL)
+            WHERE id_turma = NEW.id_turma;
+        END
+    """)
+    # Preenche o resumo com o histórico já existente
+    conn.execute("DELETE FROM Turma_Estatisticas")
+    conn.execute("""
+        INSERT INTO Turma_Estatisticas
+            (id_turma, total, acertos, erros, soma_tempo, qtd_tempo, ultima_atividade)
+        SELECT
+            id_turma,
+            COUNT(*),
+            SUM(acertou != 0),
+            SUM(acertou = 0),
+            COALESCE(SUM(tempo_resposta), 0),
+            COUNT(tempo_resposta),
+            MAX(data_resposta)
+        FROM Dados_do_jogador
+        GROUP BY id_turma
+    """)
+
+def _criar_metadados(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS Metadados(
+            chave TEXT PRIMARY KEY,
+            valor TEXT NOT NULL
+        )
+    """)
+
+def _tempo_resposta_em_ms(conn):
+    # Até aqui o tempo era contado em segundos inteiros; o gatilho de UPDATE
+    # mantém Turma_Estatisticas.soma_tempo na nova unidade
+    conn.execute("UPDATE Dados_do_jogador SET tempo_resposta = tempo_resposta * 1000 WHERE tempo_resposta IS NOT NULL")
+
+def _remover_indice_perguntas_nivel(conn):
+    # O QuestionBank lê a tabela inteira uma vez; nenhuma consulta filtra por nível,
+    # e o índice só encarecia cada inserção do importador de perguntas
+    conn.execute("DROP INDEX IF EXISTS idx_perguntas_nivel")
+
+# Lista ordenada: (versão, descrição, função). Nunca altere uma migração já
+# publicada; acrescente uma nova versão ao final.
+MIGRACOES = [
+    (1, "Dados_do_jogador registra respostas por pergunta", _migrar_dados_do_jogador),
+    (2, "Índices para as consultas frequentes", _criar_indices),
+    (3, "Estatísticas por turma mantidas por gatilhos", _criar_estatisticas_turma),
+    (4, "Tabela de metadados (versão das perguntas padrão)", _criar_metadados),
+    (5, "tempo_resposta em milissegundos", _tempo_resposta_em_ms),
+    (6, "Remove o índice de Perguntas por nível (sem uso)", _remover_indice_perguntas_nivel),
+]
+
+#---------------------------- Execução ------------------------------------
+
+def versao_atual(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version(
+            versao INTEGER PRIMARY KEY,
+            descricao TEXT NOT NULL,
+            aplicada_em TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    return conn.execute("SELECT COALESCE(MAX(versao), 0) FROM schema_version").fetchone()[0]
+
+def aplicar_migracoes(db_name):
+    """
+    Aplica, em ordem, as migrações ainda não registradas em schema_version.
+    Cada migração roda em sua própria transação (BEGIN IMMEDIATE): outro
+    processo migrando o mesmo arquivo espera o lock de escrita, e a versão
+    é relida dentro da transação para não repetir o que ele já aplicou.
+
+    Returns:
+        tuple: (sucesso: bool, mensagem: str)
+    """
+    db = Database(db_name)
+    conn = db.conectar_no_banco()
+    if conn is None:
+        return False, "Erro ao conectar ao banco"
+
+    try:
+        versao = versao_atual(conn)
+        aplicadas = 0
+        for numero, descricao, migrar in MIGRACOES:
+            if numero <= versao:
+                continue
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                versao = versao_atual(conn)
+                if numero <= versao:
+                    conn.commit()  # aplicada por outro processo enquanto esperávamos
+                    continue
+                migrar(conn)
+                conn.execute(
+                    "INSERT INTO schema_version (versao, descricao) VALUES (?, ?)",
+                    (numero, descricao)
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            aplicadas += 1
+
+        if aplicadas:
+            return True, f"{aplicadas} migrações aplicadas (versão {MIGRACOES[-1][0]})"
+        return True, f"Esquema já está na versão {versao}"
+    except Error as e:
+        print(f"Erro ao aplicar migrações: {e}")
+        return False, f"Erro ao aplicar migrações: {e}"
+    finally:
+        db.fechar_conexao()
+
+#------------------------ Planos de consulta --------------------------------
+
+# Consultas quentes do backend, com parâmetros de exemplo: são as mesmas strings
+# que os serviços executam (database/consultas.py)
+CONSULTAS_CRITICAS = [
+    ("listar_turmas_usuario", SQL_LISTAR_TURMAS_USUARIO, (1,)),
+    ("listar_turmas_pagina", sql_listar_turmas_pagina(), (1, 1000, 50)),
+    ("listar_turmas_pagina_busca", sql_listar_turmas_pagina(com_busca=True), (1, 1000, "%a%", "%a%", 50)),
+    ("get_estatisticas_turma", SQL_ESTATISTICAS_TURMA, (1,)),
+    ("get_estatisticas_usuario", SQL_ESTATISTICAS_USUARIO, (1,)),
+    ("verificar_credenciais", SQL_BUSCAR_USUARIO, ("a@a.com",)),
+]
+
+def verificar_planos(db_name):
+    """
+    Executa EXPLAIN QUERY PLAN nas consultas críticas.
+
+    Returns:
+        list: (nome, usa_indice: bool, plano: str) para cada consulta
+    """
+    db = Database(db_name)
+    conn = db.conectar_no_banco()
+    if conn is None:
+        return []
+
+    try:
+        resultado = []
+        for nome, sql, parametros in CONSULTAS_CRITICAS:
+            linhas = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", parametros)]
+            acessos = [l for l in linhas if l.startswith(("SEARCH", "SCAN"))]
+            # Toda leitura de tabela deve ser uma busca (SEARCH) por índice, nunca um SCAN
+            usa_indice = bool(acessos) and all(
+                l.startswith("SEARCH") and ("INDEX" in l or "PRIMARY KEY" in l) for l in acessos
+            )
+            resultado.append((nome, usa_indice, " | ".join(linhas)))
+        return resultado
+    finally:
+        db.fechar_conexao()
+
+
+if __name__ == "__main__":
+    caminho = sys.argv[1] if len(sys.argv) > 1 else os.path.join("database", "raizes_ocultas.db")
+
+    sucesso, mensagem = aplicar_migracoes(caminho)
+    print(f"{'✅' if sucesso else '❌'} {mensagem}")
+
+    falhas = 0
+    for nome, usa_indice, plano in verificar_planos(caminho):
+        print(f"{'✅' if usa_indice else '❌'} {nome}: {plano}")
+        falhas += not usa_indice
+    sys.exit(1 if falhas or not sucesso else 0)
@@ -4,142 +4,22 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QPushButton, 
     QVBoxLayout, QHBoxLayout, QGraphicsOpacityEffect, QStackedWidget
 )
-from PyQt6.QtGui import QPixmap, QFont, QCursor, QPainter, QColor, QFontDatabase
+from PyQt6.QtGui import QCursor, QPainter, QColor, QPalette, QTextLayout, QTextOption
 from PyQt6.QtCore import (
     Qt, QTimer, QPropertyAnimation, QEasingCurve, 
-    pyqtSignal, QRect, QPoint
+    pyqtSignal, QRect, QPoint, QPointF, QEvent, QElapsedTimer
 )
 
-class FontManager:    
-    def __init__(self):
-        self.loaded_fonts = {}
-        self.debug_mode = True  
-    
-    def load_font(self, font_path: str, font_name: str = None) -> str:
-        """
-        Args:
-            font_path: assets/fonts/White Storm.otf)
-            font_name: FonteJogo
-        
-        Returns:
-            Nome da família da fonte carregada
-        """
-        if self.debug_mode:
-            print(f"🔍 Tentando carregar fonte: {font_path}")
-        
-        if not os.path.exists(font_path):
-            print(f"❌ ERRO: Fonte não encontrada em {font_path}")
-            print(f"📁 Diretório atual: {os.getcwd()}")
-            print(f"📁 Caminho absoluto tentado: {os.path.abspath(font_path)}")
-            return "Arial" 
-        
-
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        
-        if font_id == -1:
-            print(f"❌ ERRO: Não foi possível carregar a fonte {font_path}")
-            return "Arial"
-        
-
-        font_families = QFontDatabase.applicationFontFamilies(font_id)
-        
-        if not font_families:
-            print(f"❌ ERRO: Nenhuma família de fonte encontrada em {font_path}")
-            return "Arial"
-        
-        font_family = font_families[0]
-        
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
-        key = font_name if font_name else os.path.basename(font_path)
-        self.loaded_fonts[key] = font_family
-        
-        if self.debug_mode:
-            print(f"✅ Fonte carregada com sucesso!")
-            print(f"   📝 Família da fonte: {font_family}")
-            print(f"   🔑 Chave armazenada: {key}")
-            print(f"   📋 Todas as famílias disponíveis: {font_families}")
-        
-        return font_family
-    
-    def get_font(self, font_key: str, size: int = 12, bold: bool = False, italic: bool = False) -> QFont:
-        """
-        Args:
-            font_key: FontJogo
-            size: Tamanho da fonte
-            bold: Se a fonte deve ser negrito
-            italic: Se a fonte deve ser itálica
-        
-        Returns:
-            Objeto QFont configurado
-        """
-        if self.debug_mode:
-            print(f"🎨 Criando fonte: {font_key}, tamanho {size}")
-        
-        if font_key in self.loaded_fonts:
-            font_family = self.loaded_fonts[font_key]
-            if self.debug_mode:
-                print(f"   ✅ Fonte encontrada: {font_family}")
-        else:
-            print(f"   ❌ Fonte {font_key} não encontrada, usando Arial")
-            print(f"   📋 Fontes disponíveis: {list(self.loaded_fonts.keys())}")
-            font_family = "Arial"
-        
-        font = QFont(font_family, size)
-        font.setBold(bold)
-        font.setItalic(italic)
-        
-        if self.debug_mode:
-            print(f"   🔧 Fonte criada: {font.family()}, {font.pointSize()}px")
-            print(f"   ⚡ Fonte exata disponível: {font.exactMatch()}")
-        
-        return font
-    
-    def list_system_fonts(self):
-        if self.debug_mode:
-            families = QFontDatabase.families()
-            print(f"📚 Fontes do sistema ({len(families)} disponíveis):")
-            for i, family in enumerate(families[:10]):  # Mostrar apenas as 10 primeiras
-                print(f"   {i+1}. {family}")
-            if len(families) > 10:
-                print(f"   ... e mais {len(families) - 10} fontes")
-
-class MapButton(QPushButton):
-    location_clicked = pyqtSignal(str, int)  
-    
-    def __init__(self, location_name: str, level: int, x: int, y: int, parent=None):
-        super().__init__(parent)
-        self.location_name = location_name
-        self.level = level
-        self.setFixedSize(40, 40)
-        self.move(x, y)
-        
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(spread:pad, x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #FFD700, stop:1 #FFA500);
-                color: #8B4513;
-                border: 3px solid #8B4513;
-                border-radius: 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(spread:pad, x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #FFFF00, stop:1 #FFD700);
-                transform: scale(1.1);
-            }}
-            QPushButton:pressed {{
-                background: qlineargradient(spread:pad, x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #FFA500, stop:1 #FF8C00);
-            }}
-        """)
-        
-        self.setText(str(level))
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.clicked.connect(self.on_clicked)
-        
-    def on_clicked(self):
-        self.location_clicked.emit(self.location_name, self.level)
+from front.servico_assets import carregar_pixmap
+from front.cache_imagens import CAPIVARA_GUIA
+from front.fontes import FontManager, obter_font_manager  # FontManager reexportado por compatibilidade
+from front.navegacao import obter_navegador
+from front.tema import aplicar_tema
+from front.mapa import MapaWidget, MAPA_PRINCIPAL
+from backend.roteiro import MotorRoteiro, FALA, ESCOLHA, QUIZ
 
 class MenuScreen(QMainWindow):
     
@@ -297,91 +177,45 @@ class MenuScreen(QMainWindow):
     def exit_to_game_screen(self):
         """Sai para a tela inicial (game_screen)"""
         self.close()
-        
-        # Buscar o GameManager (parent do MapScreen)
-        game_manager = None
-        if hasattr(self.map_screen, 'parent') and self.map_screen.parent():
-            game_manager = self.map_screen.parent()
-        
-        if game_manager and hasattr(game_manager, 'show_game_screen'):
-            # Usar o método do GameManager para mostrar game_screen
-            game_manager.show_game_screen()
-        else:
-            # Fallback: tentar encontrar uma instância existente na aplicação
-            from PyQt6.QtWidgets import QApplication
-            app = QApplication.instance()
-            if app:
-                for widget in app.allWidgets():
-                    if widget.__class__.__name__ == 'GameScreen' and hasattr(widget, 'show'):
-                        # Fechar o GameManager
-                        if game_manager:
-                            game_manager.close()
-                        widget.show()
-                        return
-            
-            # Último recurso: criar nova instância com parâmetros padrão
-            print("⚠️ Criando nova instância do GameScreen")
-            import sys
-            import os
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-            from game_screen import GameScreen
-            
-            # Fechar a janela atual do mapa/jogo
-            if game_manager:
-                game_manager.close()
-            
-            # Mostrar a tela inicial com parâmetros padrão
-            game_screen = GameScreen(tela_login=None, id_usuario=None)
-            game_screen.show()
+        obter_navegador().ir_para("jogo")
 
 class MapScreen(QMainWindow):
+    # Locais do mapa: (x, y) é o canto do marcador no mapa base de 1000x700
+    LOCAIS = [
+        # Lado esquerdo (aldeias indígenas)
+        {"name": "Aldeia Bororo", "level": 1, "x": 225, "y": 240},
+        {"name": "Aldeia Xavante", "level": 2, "x": 180, "y": 230},
+        {"name": "Aldeia Karajá", "level": 3, "x": 160, "y": 300},
+        {"name": "Aldeia Terena", "level": 4, "x": 180, "y": 370},
+        
+        # lado esquerdo inferior
+        {"name": "Centro Geodésico", "level": 1, "x": 257, "y": 480},
+        {"name": "Chapada dos Guimarães", "level": 2, "x": 310, "y": 515},
+        {"name": "Porto de Cáceres", "level": 3, "x": 115, "y": 492},
+        {"name": "Vila Bela", "level": 4, "x": 170, "y": 503},
+        
+        # Lado direito (castelo e vilas)
+        {"name": "Castelo dos Bandeirantes", "level": 1, "x": 810, "y": 250},            
+        # lado direito inferior
+        {"name": "Pantanal Norte", "level": 1, "x": 725, "y": 572},
+        {"name": "Pantanal Sul", "level": 2, "x": 788, "y": 543},
+        {"name": "Pantanal Ancestral", "level": 3, "x": 840, "y": 500},
+        {"name": "Corumbá", "level": 4, "x": 758, "y": 437},
+    ]
 
     def __init__(self, font_manager=None, parent=None):
         super().__init__(parent)
         self.font_manager = font_manager
+        self.local_selecionado = None  # (nome, nível) do último local clicado
         self.setup_map_ui()
 
     def setup_background(self, main_widget):
-        background_path = "assets/ScreenElements/gamescreen/Map/game-map-3.png"
-        
-        print(f"🔍 Verificando imagem de fundo:")
-        print(f"   📁 Caminho: {background_path}")
-        print(f"   ✅ Arquivo existe: {os.path.exists(background_path)}")
-        
-        if os.path.exists(background_path):            
-            original_pixmap = QPixmap(background_path)
-            self.background_label = QLabel(main_widget)
-            self.background_label.setGeometry(0, 0, 1000, 700)
-            self.background_label.lower()
-            scaled_pixmap = original_pixmap.scaled(
-                1000, 700, 
-                Qt.AspectRatioMode.IgnoreAspectRatio,  
-                Qt.TransformationMode.SmoothTransformation  
-            )
-            
-            self.background_label.setPixmap(scaled_pixmap)
-            
-            # Estilo apenas para a borda do widget principal
-            main_widget.setStyleSheet("""
-                QWidget {
-                    border: 10px solid #8B4513;
-                    border-radius: 15px;
-                    background: transparent;
-                }
-            """)
-            
-            return True
-        else:
-            print(f"❌ Imagem não encontrada: {background_path}")
-            main_widget.setStyleSheet("""
-                QWidget {
-                    background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #4A7C8B, stop:0.3 #5A8C6B, stop:0.7 #6A9C5B, stop:1 #7AAC4B);
-                    border: 10px solid #8B4513;
-                    border-radius: 15px;
-                }
-            """)
-            return False
+        """Mapa em tiles com os locais desenhados na mesma pintura (front/mapa.py)"""
+        fonte = self.font_manager.get_font("botoes", size=12, bold=True) if self.font_manager else None
+        self.mapa = MapaWidget(MAPA_PRINCIPAL, self.LOCAIS, fonte, main_widget)
+        self.mapa.setGeometry(0, 0, 1000, 700)
+        self.mapa.lower()
+        self.mapa.local_clicado.connect(self.on_location_selected)
             
     def setup_map_ui(self):
         self.setWindowTitle("Raízes Ocultas - Mapa")
@@ -402,9 +236,6 @@ class MapScreen(QMainWindow):
         # === FUNDO DO MAPA ===
         self.setup_background(main_widget)
         
-        # === CRIAR LOCAIS NO MAPA (círculos amarelos) ===
-        self.create_map_locations()
-        
         # === BOTÕES DO MAPA ===
         # Adicionar mais espaço antes dos botões para empurrá-los para baixo
         main_layout.addStretch(3)  # Adiciona espaço flexível maior
@@ -479,46 +310,9 @@ class MapScreen(QMainWindow):
         # Adicionar um pequeno espaço no final (margem inferior)
         main_layout.addSpacing(20)
         
-    def create_map_locations(self):
-
-        locations = [
-            # Lado esquerdo (aldeias indígenas)
-            {"name": "Aldeia Bororo", "level": 1, "x": 225, "y": 240},
-            {"name": "Aldeia Xavante", "level": 2, "x": 180, "y": 230},
-            {"name": "Aldeia Karajá", "level": 3, "x": 160, "y": 300},
-            {"name": "Aldeia Terena", "level": 4, "x": 180, "y": 370},
-            
-            # lado esquerdo inferior
-            {"name": "Centro Geodésico", "level": 1, "x": 257, "y": 480},
-            {"name": "Chapada dos Guimarães", "level": 2, "x": 310, "y": 515},
-            {"name": "Porto de Cáceres", "level": 3, "x": 115, "y": 492},
-            {"name": "Vila Bela", "level": 4, "x": 170, "y": 503},
-            
-            # Lado direito (castelo e vilas)
-            {"name": "Castelo dos Bandeirantes", "level": 1, "x": 810, "y": 250},            
-            # lado direito inferior
-            {"name": "Pantanal Norte", "level": 1, "x": 725, "y": 572},
-            {"name": "Pantanal Sul", "level": 2, "x": 788, "y": 543},
-            {"name": "Pantanal Ancestral", "level": 3, "x": 840, "y": 500},
-            {"name": "Corumbá", "level": 4, "x": 758, "y": 437},
-        ]
-        
-        for location in locations:
-            map_button = MapButton(
-                location["name"], 
-                location["level"], 
-                location["x"], 
-                location["y"], 
-                self.map_area
-            )
-            map_button.location_clicked.connect(self.on_location_selected)
-            
-            if self.font_manager:
-                button_font = self.font_manager.get_font("botoes", size=12, bold=True)
-                map_button.setFont(button_font)
-    
     def on_location_selected(self, location_name: str, level: int):
         print(f"🗺️ Local selecionado: {location_name} (Nível {level})")        
+        self.local_selecionado = (location_name, level)
         self.show_location_info(location_name, level)
     
     def show_location_info(self, location_name: str, level: int):
@@ -568,6 +362,8 @@ class MapScreen(QMainWindow):
         self.menu_screen.show()
 
 class GameManager(QMainWindow):
+    CLASSE_MAPA = 3  # classe das perguntas do mapa inicial (Ato I)
+    
     def __init__(self, original_game_screen=None, tela_login=None, id_usuario=None):
         super().__init__()
         self.setWindowTitle("Raízes Ocultas")
@@ -576,36 +372,42 @@ class GameManager(QMainWindow):
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
         
-        self.font_manager = FontManager()
-        self.load_fonts()
+        self.font_manager = obter_font_manager()
         
         # Armazenar referência para o GameScreen original (se fornecido)
         self.original_game_screen = original_game_screen
         self.tela_login = tela_login
         self.id_usuario = id_usuario
+        self.id_turma = None
         
-        self.prologue_screen = PrologoRPG(self.show_map)
-        self.map_screen = MapScreen(self.font_manager, parent=self)
-        
+        self.prologue_screen = PrologoRPG(self.show_map, on_quiz=self.abrir_quiz)
         self.stacked_widget.addWidget(self.prologue_screen)
-        self.stacked_widget.addWidget(self.map_screen)
-        
-        # Conectar botão menu ao método show_menu
-        self.map_screen.back_button.clicked.connect(self.map_screen.show_menu)
-        self.map_screen.skip_button.clicked.connect(self.start_game)
         
-        self.show_prologue()
+        # O mapa só é construído ao sair do prólogo; enquanto isso suas imagens
+        # são decodificadas em segundo plano
+        self.map_screen = None
+        MAPA_PRINCIPAL.pre_carregar()
+        self.prologo_iniciado = False
     
-    def load_fonts(self):
-        font_paths = {
-            "titulo": "assets/fonts/Ghost theory 2.ttf",
-            "narração": "assets/fonts/White Storm.otf",
-            "botoes": "assets/fonts/firstorder.ttf",
-            "dialogo": "assets/fonts/Elementary_Gothic_Bookhand.ttf",
-        }
-        
-        for font_name, font_path in font_paths.items():
-            self.font_manager.load_font(font_path, font_name)
+    def ao_exibir(self, contexto):
+        """Chamado pelo navegador: na primeira vez exibe o prólogo, depois volta ao mapa"""
+        self.id_usuario = contexto.get("id_usuario", self.id_usuario)
+        self.id_turma = contexto.get("id_turma")
+        if not self.prologo_iniciado:
+            self.prologo_iniciado = True
+            self.show_prologue()
+        elif self.stacked_widget.currentWidget() is not self.prologue_screen:
+            self.show_map()
+    
+    def criar_mapa(self):
+        if self.map_screen is None:
+            self.map_screen = MapScreen(self.font_manager, parent=self)
+            self.stacked_widget.addWidget(self.map_screen)
+            
+            # Conectar botão menu ao método show_menu
+            self.map_screen.back_button.clicked.connect(self.map_screen.show_menu)
+            self.map_screen.skip_button.clicked.connect(self.start_game)
+        return self.map_screen
     
     def show_prologue(self):
         self.stacked_widget.setCurrentWidget(self.prologue_screen)
@@ -613,27 +415,42 @@ class GameManager(QMainWindow):
     
     def show_map(self):
         print("🗺️ Abrindo mapa...")
-        self.stacked_widget.setCurrentWidget(self.map_screen)
+        self.stacked_widget.setCurrentWidget(self.criar_mapa())
     
     def start_game(self):
-        print("🎮 Iniciando o jogo...")
+        """Abre o quiz do local escolhido no mapa (sem escolha, o primeiro nível)"""
+        from backend.jogo import PERGUNTAS_POR_PARTIDA
+        
+        nome, nivel = self.criar_mapa().local_selecionado or (None, 1)
+        print(f"🎮 Iniciando o jogo{f' em {nome}' if nome else ''} (nível {nivel})...")
+        
+        def terminar(venceu):
+            print(f"{'🏆' if venceu else '💀'} Quiz do nível {nivel} {'vencido' if venceu else 'encerrado'}")
+        
+        self.abrir_quiz(nivel, self.CLASSE_MAPA, PERGUNTAS_POR_PARTIDA, ao_terminar=terminar)
+    
+    def abrir_quiz(self, dificuldade, classe, quantidade, ao_terminar=None):
+        """Exibe o quiz do nível sobre a tela atual e volta para ela ao terminar"""
+        from front.Screens.tela_quiz import TelaQuiz
+        
+        anterior = self.stacked_widget.currentWidget()
+        
+        def terminar(venceu):
+            self.stacked_widget.setCurrentWidget(anterior)
+            self.stacked_widget.removeWidget(tela)
+            tela.deleteLater()
+            if ao_terminar:
+                ao_terminar(venceu)
+        
+        tela = TelaQuiz(f"{dificuldade}-{classe}", self.id_turma, quantidade, ao_terminar=terminar)
+        self.stacked_widget.addWidget(tela)
+        self.stacked_widget.setCurrentWidget(tela)
+        tela.iniciar()
+        return tela
     
     def show_game_screen(self):
         """Mostra a tela inicial do jogo (game_screen)"""
-        self.close()
-        
-        if self.original_game_screen:
-            # Usar a instância original do GameScreen
-            self.original_game_screen.show()
-        else:
-            # Criar uma nova instância com os parâmetros corretos
-            import sys
-            import os
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-            from game_screen import GameScreen
-            
-            game_screen = GameScreen(tela_login=self.tela_login, id_usuario=self.id_usuario)
-            game_screen.show()
+        obter_navegador().ir_para("jogo")
 
 class BubbleWidget(QWidget):
     def __init__(self, parent=None):
@@ -665,108 +482,149 @@ class BubbleWidget(QWidget):
         ])
 
 class TypewriterLabel(QLabel):
+    """
+    Label com efeito de máquina de escrever.
+
+    O texto completo vai para o QLabel uma única vez (o tamanho não muda
+    durante a digitação) e é diagramado em um QTextLayout reaproveitado.
+    A cada quadro só muda `visible_chars`: o paintEvent desenha as linhas já
+    completas e recorta a linha parcial, sem montar strings por caractere.
+    Os caracteres visíveis vêm do tempo decorrido, então vários saem no
+    mesmo quadro quando `speed` é menor que um quadro ou um tique atrasa.
+    """
     typing_finished = pyqtSignal()
+    QUADRO_MS = 16
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.full_text = ""
-        self.current_text = ""
-        self.current_index = 0
+        self.visible_chars = 0
         self.typing_speed = 50  # ms entre cada caractere
-        self.timer = QTimer()
+        self._relogio = QElapsedTimer()
+        self._layout = None
+        self._largura_layout = -1
+        self._altura_texto = 0.0
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self.add_next_character)
+    
+    @property
+    def current_text(self):
+        return self.full_text[:self.visible_chars]
         
     def start_typing(self, text: str, speed: int = 50):
         self.full_text = text
-        self.current_text = ""
-        self.current_index = 0
-        self.typing_speed = speed
-        self.setText("")
-        self.timer.start(self.typing_speed)
+        self.visible_chars = 0
+        self.typing_speed = max(1, speed)
+        self._layout = None
+        self.setText(text)
+        self._relogio.start()
+        self.timer.start(max(self.QUADRO_MS, self.typing_speed))
+        self.update()
     
     def add_next_character(self):
-        if self.current_index < len(self.full_text):
-            self.current_text += self.full_text[self.current_index]
-            self.setText(self.current_text)
-            self.current_index += 1
-        else:
+        alvo = min(len(self.full_text), self._relogio.elapsed() // self.typing_speed)
+        if alvo != self.visible_chars:
+            self.visible_chars = alvo
+            self.update()
+        if self.visible_chars >= len(self.full_text):
             self.timer.stop()
             self.typing_finished.emit()
     
     def skip_typing(self):
         if self.timer.isActive():
             self.timer.stop()
-            self.current_text = self.full_text
-            self.setText(self.current_text)
+            self.visible_chars = len(self.full_text)
+            self.update()
             self.typing_finished.emit()
+    
+    def _diagramar(self, largura):
+        if self._layout is not None and self._largura_layout == largura:
+            return self._layout
+        
+        opcao = QTextOption(self.alignment() & Qt.AlignmentFlag.AlignHorizontal_Mask)
+        opcao.setWrapMode(
+            QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere if self.wordWrap()
+            else QTextOption.WrapMode.NoWrap
+        )
+        layout = QTextLayout(self.full_text, self.font())
+        layout.setTextOption(opcao)
+        layout.beginLayout()
+        altura = 0.0
+        while True:
+            linha = layout.createLine()
+            if not linha.isValid():
+                break
+            linha.setLineWidth(largura)
+            linha.setPosition(QPointF(0, altura))
+            altura += linha.height()
+        layout.endLayout()
+        
+        self._layout, self._largura_layout, self._altura_texto = layout, largura, altura
+        return layout
+    
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.FontChange:
+            self._layout = None
+        super().changeEvent(event)
+    
+    def paintEvent(self, event):
+        if not self.visible_chars:
+            return
+        
+        area = self.contentsRect()
+        layout = self._diagramar(area.width())
+        topo = area.top()
+        if self.alignment() & Qt.AlignmentFlag.AlignVCenter:
+            topo += (area.height() - self._altura_texto) / 2
+        elif self.alignment() & Qt.AlignmentFlag.AlignBottom:
+            topo += area.height() - self._altura_texto
+        origem = QPointF(area.left(), topo)
+        
+        painter = QPainter(self)
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        for i in range(layout.lineCount()):
+            linha = layout.lineAt(i)
+            inicio = linha.textStart()
+            if inicio >= self.visible_chars:
+                break
+            if inicio + linha.textLength() <= self.visible_chars:
+                linha.draw(painter, origem)
+                continue
+            # Linha parcial: desenha a linha inteira recortada no último caractere visível
+            x = linha.cursorToX(self.visible_chars)
+            if isinstance(x, tuple):
+                x = x[0]
+            recorte = linha.rect().translated(origem)
+            recorte.setRight(origem.x() + x)
+            painter.save()
+            painter.setClipRect(recorte)
+            linha.draw(painter, origem)
+            painter.restore()
+        painter.end()
 
 class PrologoRPG(QMainWindow):
     
-    def __init__(self, on_finish_callback=None):
+    def __init__(self, on_finish_callback=None, roteiro="0:inicio", on_quiz=None):
         super().__init__()
         self.on_finish_callback = on_finish_callback
-        self.current_text_index = 0
+        # on_quiz(dificuldade, classe, quantidade, ao_terminar) abre o quiz e chama ao_terminar(acertou)
+        self.on_quiz = on_quiz
         
         print("🚀 Iniciando Prólogo RPG...")
         
-        # Inicializar gerenciador de fontes (será passado pelo GameManager)
-        self.font_manager = FontManager()
+        # Registro de fontes compartilhado com o GameManager e as demais telas
+        self.font_manager = obter_font_manager()
         
-        # Carregar fontes personalizadas
-        self.load_custom_fonts()
-        
-        # Textos do prólogo
-        self.prologo_texts = [
-            "Há muito tempo, nas terras místicas de Mato Grosso...",
-            "Onde as raízes da cultura se entrelaçam com os segredos da natureza...",
-            "Um jovem professor descobriu que o conhecimento ancestral estava desaparecendo...",
-            "As tradições dos povos originários, quilombolas e pantaneiros corriam perigo...",
-            "Apenas através da educação e da aventura seria possível preservar essa sabedoria...",
-            "Sua jornada começa agora... Você está pronto para desvendar as Raízes Ocultas?"
-        ]
+        # Textos do prólogo vêm de assets/roteiros/ato_0.txt
+        self.roteiro = roteiro
+        self.motor = MotorRoteiro()
+        self.motor.iniciar(roteiro)
+        self.escolha_atual = None
         
         self.setup_ui()
         self.setup_animations()
     
-    def load_custom_fonts(self):
-        print("\n📂 Carregando fontes personalizadas...")
-        
-        # Verificar se o diretório de fontes existe
-        fonts_dir = "assets/fonts"
-        if not os.path.exists(fonts_dir):
-            print(f"❌ Diretório de fontes não existe: {fonts_dir}")
-            print(f"📁 Criando diretório...")
-            try:
-                os.makedirs(fonts_dir, exist_ok=True)
-                print(f"✅ Diretório criado: {fonts_dir}")
-            except:
-                print(f"❌ Não foi possível criar o diretório")
-        
-        # Lista de arquivos no diretório de fontes
-        if os.path.exists(fonts_dir):
-            print(f"📋 Arquivos em {fonts_dir}:")
-            for file in os.listdir(fonts_dir):
-                print(f"   📄 {file}")
-        
-        # Defina aqui os caminhos para suas fontes
-        font_paths = {
-            "titulo": "assets/fonts/Ghost theory 2.ttf",          # Para título do jogo
-            "narração": "assets/fonts/White Storm.otf",      # Para texto de narração
-            "botoes": "assets/fonts/firstorder.ttf",        # Para texto dos botões
-            "dialogo": "assets/fonts/Elementary_Gothic_Bookhand.ttf",   # Para diálogos de personagens
-        }
-        
-        # Carregar cada fonte (se existir)
-        for font_name, font_path in font_paths.items():
-            self.font_manager.load_font(font_path, font_name)
-        
-        print(f"🎯 Fontes carregadas: {list(self.font_manager.loaded_fonts.keys())}")
-        
-        # Lista final de fontes carregadas
-        print(f"📚 RESUMO - Fontes finais carregadas:")
-        for key, family in self.font_manager.loaded_fonts.items():
-            print(f"   🔑 {key} -> {family}")
-        
     def setup_ui(self):
         self.setWindowTitle("Raízes Ocultas - Prólogo")
         self.setFixedSize(1000, 700)
@@ -839,16 +697,12 @@ class PrologoRPG(QMainWindow):
         # Imagem do personagem (ou placeholder)
         self.character_image = QLabel()
         self.character_image.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.character_image.setFixedSize(180, 200)
+        self.character_image.setFixedSize(CAPIVARA_GUIA[1], CAPIVARA_GUIA[2])
         
         # Tentar carregar imagem do personagem
-        character_path = "assets/ScreenElements/gamescreen/NPCs/capivara-guia.png"
+        character_path = CAPIVARA_GUIA[0]
         if os.path.exists(character_path):
-            pixmap = QPixmap(character_path).scaled(
-                180, 200, 
-                Qt.AspectRatioMode.KeepAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
-            )
+            pixmap = carregar_pixmap(*CAPIVARA_GUIA)
             self.character_image.setPixmap(pixmap)
 
         else:
@@ -988,6 +842,13 @@ class PrologoRPG(QMainWindow):
         button_layout.addStretch()
         
         main_layout.addLayout(button_layout)
+        
+        # Opções das escolhas do roteiro (botões criados a cada escolha)
+        self.choices_container = QWidget()
+        self.choices_layout = QHBoxLayout(self.choices_container)
+        self.choices_layout.setSpacing(20)
+        self.choices_container.hide()
+        main_layout.addWidget(self.choices_container, alignment=Qt.AlignmentFlag.AlignCenter)
         main_layout.addStretch()
         
     def setup_animations(self):
@@ -1019,24 +880,65 @@ class PrologoRPG(QMainWindow):
         QTimer.singleShot(1000, self.show_first_text)
     
     def show_first_text(self):
-        if self.current_text_index < len(self.prologo_texts):
-            text = self.prologo_texts[self.current_text_index]
-            self.text_label.start_typing(text, 50)  # 50ms entre caracteres
+        self.executar_roteiro()
+    
+    def executar_roteiro(self):
+        """Exibe a próxima instrução do roteiro (fala, escolha, quiz ou fim)"""
+        instrucao = self.motor.proximo()
+        op = instrucao[0]
+        
+        if op == FALA:
+            self.text_label.start_typing(instrucao[2], 50)  # 50ms entre caracteres
+        elif op == ESCOLHA:
+            self.escolha_atual = instrucao[3]
+            self.text_label.start_typing(instrucao[2], 50)
+        elif op == QUIZ:
+            _, dificuldade, classe, quantidade, _, _ = instrucao
+            if self.on_quiz:
+                self.on_quiz(dificuldade, classe, quantidade, self.ao_terminar_quiz)
+            else:
+                print(f"⚠️ Quiz (dificuldade {dificuldade}, classe {classe}) sem tela associada, seguindo o roteiro")
+                self.ao_terminar_quiz(True)
+        else:
+            # Fim do roteiro - adicionar botão "Começar"
+            self.show_start_button()
+    
+    def ao_terminar_quiz(self, acertou):
+        self.motor.resultado_quiz(acertou)
+        self.executar_roteiro()
     
     def on_typing_finished(self):
+        if self.escolha_atual:
+            self.mostrar_escolhas(self.escolha_atual)
+            return
         self.continue_button.show()
         self.button_animation.start()
     
+    def mostrar_escolhas(self, opcoes):
+        while self.choices_layout.count():
+            item = self.choices_layout.takeAt(0)
+            item.widget().deleteLater()
+        
+        fonte = self.font_manager.get_font("botoes", size=13, bold=True)
+        for indice, (rotulo, _) in enumerate(opcoes):
+            botao = QPushButton(rotulo)
+            botao.setMinimumSize(200, 45)
+            botao.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+            botao.setFont(fonte)
+            botao.setStyleSheet(self.continue_button.styleSheet())
+            botao.clicked.connect(lambda _=False, i=indice: self.escolher(i))
+            self.choices_layout.addWidget(botao)
+        self.choices_container.show()
+    
+    def escolher(self, indice):
+        self.choices_container.hide()
+        self.escolha_atual = None
+        self.motor.escolher(indice)
+        QTimer.singleShot(500, self.executar_roteiro)
+    
     def next_text(self):
         self.continue_button.hide()
-        self.current_text_index += 1
-        
-        if self.current_text_index < len(self.prologo_texts):
-            # Próximo texto
-            QTimer.singleShot(500, self.show_first_text)
-        else:
-            # Fim do prólogo - adicionar botão "Começar"
-            self.show_start_button()
+        QTimer.singleShot(500, self.executar_roteiro)
     
     def show_start_button(self):
         # Esconder o bubble de texto
@@ -1153,18 +1055,12 @@ def show_prologue(parent=None, on_finish=None):
 
 def start_game_with_prologue(original_game_screen=None, tela_login=None, id_usuario=None):
     """Função para iniciar o jogo com prólogo, preservando a instância original do GameScreen"""
-    game_manager = GameManager(
-        original_game_screen=original_game_screen,
-        tela_login=tela_login,
-        id_usuario=id_usuario
-    )
-    game_manager.show()
-    return game_manager
+    return obter_navegador().ir_para("aventura", id_usuario=id_usuario)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    aplicar_tema(app)
     
-    game = GameManager()
-    game.show()
+    obter_navegador().ir_para("aventura")
     
     sys.exit(app.exec())
\ No newline at end of file
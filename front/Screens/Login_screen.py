@@ -5,12 +5,18 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QPushButton, QMessageBox,
     QLineEdit, QCheckBox, QWidget, QVBoxLayout, QGraphicsOpacityEffect,
 )
-from PyQt6.QtGui import QPixmap, QCursor, QIcon
+from PyQt6.QtGui import QCursor, QIcon
 from PyQt6.QtCore import Qt, QPropertyAnimation
 import random
+from front.cache_imagens import (
+    ICONE_EMAIL, ICONE_SENHA, LOGO_LOGIN, LOGO_CADASTRO,
+    DECORACAO_VIOLA, DECORACAO_CHITA_2, DECORACAO_CHITA, DECORACAO_DANCA
+)
+from front.servico_assets import carregar_pixmap
+from front.tema import aplicar_tema, definir_papel, definir_estado, marcar_erro
+from front.tarefas import executar_em_segundo_plano
 
-# Import das telas
-from game_screen import GameScreen
+# A tela do jogo é importada só depois do login (ver ir_game_screen)
 
 class HoverLabel(QLabel):
     def __init__(self, parent=None):
@@ -54,67 +60,45 @@ class TelaLogin(QMainWindow):
         super().__init__()
         self.setWindowTitle("Raízes Ocultas - Login")
         self.setFixedSize(1000, 700)
-        self.setStyleSheet("background-color: white;")
+        self.setObjectName("telaLogin")
         self.id_usuario = None  # Para armazenar o ID do usuário logado
 
         # Container central
         central_widget = QWidget()
+        central_widget.setObjectName("telaLoginCentral")
         self.setCentralWidget(central_widget)
         layout = QVBoxLayout(central_widget)
         layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
 
         # Logo
         self.logo = QLabel()
-        self.logo.setPixmap(
-            QPixmap("assets/ScreenElements/MT-bandeira-logo.png")
-            .scaledToWidth(250, Qt.TransformationMode.SmoothTransformation)
-        )
+        self.logo.setPixmap(carregar_pixmap(*LOGO_LOGIN))
         self.logo.setAlignment(Qt.AlignmentFlag.AlignHCenter)
         layout.addWidget(self.logo)
         layout.addSpacing(40)
 
         # --- Email ---
-        label_email = QLabel("E-mail")
-        label_email.setStyleSheet("font-size: 13px; color: #333; font-weight: bold;")
+        label_email = definir_papel(QLabel("E-mail"), "rotulo")
         layout.addWidget(label_email, alignment=Qt.AlignmentFlag.AlignLeft)
 
         self.input_email = QLineEdit()
         self.input_email.setPlaceholderText("E-mail")
         self.input_email.setFixedSize(300, 40)
-        self.input_email.setStyleSheet("""
-            QLineEdit {
-                padding-left: 10px;
-                font-size: 14px;
-                color: #979797;
-                background-color: white;
-                border: 1px solid #ccc;
-                border-radius: 5px;
-            }
-        """)
-        icone_email = QIcon(QPixmap("assets/ScreenElements/icons/mail_vector.png").scaled(24, 24, Qt.AspectRatioMode.KeepAspectRatio))
+        definir_papel(self.input_email, "campoLogin")
+        icone_email = QIcon(carregar_pixmap(*ICONE_EMAIL))
         self.input_email.addAction(icone_email, QLineEdit.ActionPosition.LeadingPosition)
         layout.addWidget(self.input_email, alignment=Qt.AlignmentFlag.AlignLeft)
 
         # --- Senha ---
-        label_senha = QLabel("Senha")
-        label_senha.setStyleSheet("font-size: 13px; color: #333; font-weight: bold;")
+        label_senha = definir_papel(QLabel("Senha"), "rotulo")
         layout.addWidget(label_senha, alignment=Qt.AlignmentFlag.AlignLeft)
 
         self.input_senha = QLineEdit()
         self.input_senha.setPlaceholderText("Senha")
         self.input_senha.setEchoMode(QLineEdit.EchoMode.Password)
         self.input_senha.setFixedSize(300, 40)
-        self.input_senha.setStyleSheet("""
-            QLineEdit {
-                padding-left: 10px;
-                font-size: 14px;
-                color: #979797;
-                background-color: white;
-                border: 1px solid #ccc;
-                border-radius: 5px;
-            }
-        """)
-        icone_senha = QIcon(QPixmap("assets/ScreenElements/icons/password_vector.png").scaled(24, 24, Qt.AspectRatioMode.KeepAspectRatio))
+        definir_papel(self.input_senha, "campoLogin")
+        icone_senha = QIcon(carregar_pixmap(*ICONE_SENHA))
         self.input_senha.addAction(icone_senha, QLineEdit.ActionPosition.LeadingPosition)
         layout.addWidget(self.input_senha, alignment=Qt.AlignmentFlag.AlignLeft)
 
@@ -122,20 +106,14 @@ class TelaLogin(QMainWindow):
         self.botao_acessar = QPushButton("Acessar")
         self.botao_acessar.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.botao_acessar.setFixedHeight(40)
-        self.botao_acessar.setStyleSheet("""
-            background-color: #2B1D61;
-            color: white;
-            font-weight: bold;
-            font-size: 16px;
-            border-radius: 5px;
-        """)
+        definir_papel(self.botao_acessar, "acessar")
         layout.addWidget(self.botao_acessar)
         self.botao_acessar.clicked.connect(self.validar_e_abrir_jogo)
 
         # Label para mensagens de erro
         self.label_mensagem = QLabel("")
         self.label_mensagem.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        self.label_mensagem.setStyleSheet("color: red; font-size: 12px; margin-top: 10px;")
+        definir_papel(self.label_mensagem, "mensagemErro")
         self.label_mensagem.setWordWrap(True)
         layout.addWidget(self.label_mensagem)
 
@@ -164,46 +142,56 @@ class TelaLogin(QMainWindow):
             self.label_mensagem.setText("Por favor, digite sua senha.")
             return None  # Retorna None quando não há senha
         
-        # Validar credenciais usando o backend
+        # O hash da senha (KDF) é caro: a verificação roda fora da thread da interface
         try:
-            # Adicionar o caminho do backend
-            sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-            from backend.login import Login
-            
-            # Criar instância do sistema de login
-            login_system = Login()
-            
-            # Validar as credenciais
-            sucesso, mensagem, id_usuario = login_system.realizar_login(email, senha)
-            self.id_usuario = id_usuario
-            if sucesso:
-                # Salvar o ID do usuário
-                self.id_usuario = id_usuario
-                print(f"Login bem-sucedido! ID do usuário: {id_usuario}")
-                
-                # Abrir o jogo com animação
-                self.abrir_game_animacao()
-                return id_usuario  # Retorna o id_usuario em caso de sucesso
-            else:
-                # Mostrar mensagem de erro
-                self.label_mensagem.setText(mensagem)
-                
-                # Oferecer cadastro se o email não existir
-                if "não cadastrado" in mensagem.lower():
-                    resposta = QMessageBox.question(
-                        self,
-                        "Cadastro",
-                        "E-mail não encontrado. Deseja criar uma nova conta?",
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                    )
-                    if resposta == QMessageBox.StandardButton.Yes:
-                        self.abrir_tela_cadastro()
-                return None  # Retorna None quando o login falha
-                        
+            from backend.login import obter_login
+            login_system = obter_login()
         except Exception as e:
             print(f"Erro ao fazer login: {e}")
             self.label_mensagem.setText("Erro interno. Tente novamente.")
-            return None  # Retorna None em caso de exceção
+            return None
+
+        executar_em_segundo_plano(
+            login_system.realizar_login, email, senha,
+            ao_concluir=self.ao_verificar_login,
+            ao_falhar=self.ao_falhar_login,
+            ocupado=self.definir_verificando,
+            dono=self
+        )
+        return None
+
+    def definir_verificando(self, verificando):
+        self.botao_acessar.setEnabled(not verificando)
+        self.botao_acessar.setText("Verificando..." if verificando else "Acessar")
+
+    def ao_verificar_login(self, resultado):
+        """Recebe (sucesso, mensagem, id_usuario) de Login.realizar_login"""
+        sucesso, mensagem, id_usuario = resultado
+        self.id_usuario = id_usuario
+        if sucesso:
+            print(f"Login bem-sucedido! ID do usuário: {id_usuario}")
+            
+            # Abrir o jogo com animação
+            self.abrir_game_animacao()
+            return
+
+        # Mostrar mensagem de erro
+        self.label_mensagem.setText(mensagem)
+        
+        # Oferecer cadastro se o email não existir
+        if "não cadastrado" in mensagem.lower():
+            resposta = QMessageBox.question(
+                self,
+                "Cadastro",
+                "E-mail não encontrado. Deseja criar uma nova conta?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if resposta == QMessageBox.StandardButton.Yes:
+                self.abrir_tela_cadastro()
+
+    def ao_falhar_login(self, erro):
+        print(f"Erro ao fazer login: {erro}")
+        self.label_mensagem.setText("Erro interno. Tente novamente.")
     
     def abrir_tela_cadastro(self):
         self.tela_cadastro = TelaCadastro(tela_login_callback=self.show)
@@ -211,17 +199,15 @@ class TelaLogin(QMainWindow):
         self.hide()
 
     def dec_imagens(self):
-        self.decorar("Viola-com-chita.png", -400, -400, 900, 2000)
-        self.decorar("organic-chita-2.png", -120, -70, 600, 350)
-        self.decorar("organic-chita.png", 780, 550, 400, 550)
-        self.decorar("dance-chita.png", 700, -250, 900, 2000)
+        self.decorar(DECORACAO_VIOLA, -400, -400)
+        self.decorar(DECORACAO_CHITA_2, -120, -70)
+        self.decorar(DECORACAO_CHITA, 780, 550)
+        self.decorar(DECORACAO_DANCA, 700, -250)
 
-    def decorar(self, nome_img, x, y, w, h):
+    def decorar(self, asset, x, y):
         label = QLabel(self)
         label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        label.setStyleSheet("background: transparent;")
-        pixmap = QPixmap(f"assets/ScreenElements/{nome_img}").scaled(
-            w, h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        pixmap = carregar_pixmap(*asset)
         label.setPixmap(pixmap)
         label.resize(pixmap.size())
         label.move(x, y)
@@ -247,8 +233,9 @@ class TelaLogin(QMainWindow):
         self.animacao.start()
 
     def ir_game_screen(self, fade_in=False):
-        self.tela_game = GameScreen(tela_login=self, id_usuario=self.id_usuario)  # Passa o id_usuario
-        self.tela_game.show()
+        # A tela do jogo é mantida pelo navegador e reaproveitada entre logins
+        from front.navegacao import obter_navegador
+        self.tela_game = obter_navegador().ir_para("jogo", id_usuario=self.id_usuario)
 
         if fade_in:
             effect_new = QGraphicsOpacityEffect(self.tela_game)
@@ -258,11 +245,12 @@ class TelaLogin(QMainWindow):
             self.anim_in.setDuration(700)
             self.anim_in.setStartValue(0.0)
             self.anim_in.setEndValue(1.0)
+            # Sem o efeito, a tela volta a ser pintada diretamente
+            self.anim_in.finished.connect(lambda: self.tela_game.setGraphicsEffect(None))
             self.anim_in.start()
 
-            self.close()
-        else:
-            self.close()
+    def ao_exibir(self, contexto):
+        self.input_senha.clear()
 
 # ---------------------------------- cadastro ---------------
 
@@ -271,10 +259,11 @@ class TelaCadastro(QMainWindow):
         super().__init__()
         self.setWindowTitle("Raízes Ocultas - Cadastro")
         self.setFixedSize(420, 640)
-        self.setStyleSheet("background-color: #F8F8F8;")
+        self.setObjectName("telaCadastro")
         self.tela_login_callback = tela_login_callback
 
         central = QWidget()
+        central.setObjectName("telaCadastroCentral")
         self.setCentralWidget(central)
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
@@ -284,28 +273,13 @@ class TelaCadastro(QMainWindow):
         # Logo
         self.logo = QLabel()
         self.logo.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        pixmap = QPixmap("assets/ScreenElements/MT-bandeira-logo.png")
+        pixmap = carregar_pixmap(*LOGO_CADASTRO)
         if not pixmap.isNull():
-            self.logo.setPixmap(pixmap.scaled(160, 80, Qt.AspectRatioMode.KeepAspectRatio))
+            self.logo.setPixmap(pixmap)
         layout.addWidget(self.logo)
 
-        estilo_input = """
-            QLineEdit {
-                padding: 9px;
-                font-size: 14px;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                background-color: white;
-                color: black;
-            }
-            QLineEdit::placeholder {
-                color: #aaa;
-            }
-        """
-
         def add_input(label_text, line_edit):
-            label = QLabel(label_text)
-            label.setStyleSheet("font-size: 13px; color: #333;")
+            label = definir_papel(QLabel(label_text), "rotuloCampo")
             layout.addWidget(label)
             layout.addWidget(line_edit)
 
@@ -313,7 +287,8 @@ class TelaCadastro(QMainWindow):
         self.input_email = QLineEdit()
         self.input_email.setPlaceholderText("exemplo@email.com")
         self.input_email.setFixedSize(360, 40)
-        self.input_email.setStyleSheet(estilo_input)
+        definir_papel(self.input_email, "campo")
+        self.input_email.textChanged.connect(self.valida_ao_digitar)
         add_input("E-mail:", self.input_email)
 
         # Senha
@@ -321,13 +296,14 @@ class TelaCadastro(QMainWindow):
         self.input_senha.setPlaceholderText("Digite sua senha")
         self.input_senha.setEchoMode(QLineEdit.EchoMode.Password)
         self.input_senha.setFixedSize(360, 40)
-        self.input_senha.setStyleSheet(estilo_input)
+        definir_papel(self.input_senha, "campo")
         self.input_senha.textChanged.connect(self.atualiza_forca_senha)
+        self.input_senha.textChanged.connect(self.valida_ao_digitar)
         add_input("Senha:", self.input_senha)
 
         # Força da senha
         self.label_forca_senha = QLabel("")
-        self.label_forca_senha.setStyleSheet("font-size: 12px; color: #666;")
+        definir_papel(self.label_forca_senha, "dica")
         layout.addWidget(self.label_forca_senha)
 
         # Repetir Senha
@@ -335,41 +311,13 @@ class TelaCadastro(QMainWindow):
         self.input_repetir_senha.setPlaceholderText("Repita a senha")
         self.input_repetir_senha.setEchoMode(QLineEdit.EchoMode.Password)
         self.input_repetir_senha.setFixedSize(360, 40)
-        self.input_repetir_senha.setStyleSheet(estilo_input)
+        definir_papel(self.input_repetir_senha, "campo")
+        self.input_repetir_senha.textChanged.connect(self.valida_ao_digitar)
         add_input("Confirmar senha:", self.input_repetir_senha)
 
         # Checkbox Termos
         self.checkbox_termos = QCheckBox("Li e aceito os Termos de Uso e Política de Privacidade.")
-        self.checkbox_termos.setStyleSheet("""
-            QCheckBox {
-                font-size: 13px;
-                color: #444;
-                margin-top: 8px;
-                margin-bottom: 8px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #130060;
-                border-radius: 4px;
-                background-color: #fff;
-                image: url('assets/ScreenElements/checked-icon.png');
-                text-align: center;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #130060;
-                border: 2px solid #130060;
-                image: url('assets/ScreenElements/checked-icon.png');
-            }
-            QCheckBox::indicator:unchecked {
-                background-color: #fff;
-                border: 2px solid #130060;
-                image: url('assets/ScreenElements/unchecked-icon.png');
-            }
-            QCheckBox:hover {
-                color: #130060;
-            }
-        """)
+        definir_papel(self.checkbox_termos, "termos")
         layout.addWidget(self.checkbox_termos)
 
         # Captcha
@@ -378,30 +326,20 @@ class TelaCadastro(QMainWindow):
         self.resultado_captcha = self.num1 + self.num2
 
         self.label_captcha = QLabel(f"Pergunta de segurança: Quanto é {self.num1} + {self.num2}?")
-        self.label_captcha.setStyleSheet("font-size: 13px; color: #333;")
+        definir_papel(self.label_captcha, "rotuloCampo")
         layout.addWidget(self.label_captcha)
 
         self.input_captcha = QLineEdit()
         self.input_captcha.setPlaceholderText("Sua resposta")
         self.input_captcha.setFixedSize(360, 40)
-        self.input_captcha.setStyleSheet(estilo_input)
+        definir_papel(self.input_captcha, "campo")
         layout.addWidget(self.input_captcha)
 
         # Botão Cadastrar
         self.btn_cadastrar = QPushButton("Cadastrar")
         self.btn_cadastrar.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_cadastrar.setFixedSize(360, 45)
-        self.btn_cadastrar.setStyleSheet("""
-            QPushButton {
-                background-color: #130060;
-                color: white;
-                border-radius: 6px;
-                font-size: 15px;
-            }
-            QPushButton:hover {
-                background-color: #110444;
-            }
-        """)
+        definir_papel(self.btn_cadastrar, "primario")
         self.btn_cadastrar.clicked.connect(self.tentar_cadastrar)
         layout.addWidget(self.btn_cadastrar)
 
@@ -409,17 +347,7 @@ class TelaCadastro(QMainWindow):
         self.btn_voltar = QPushButton("Voltar para Login")
         self.btn_voltar.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_voltar.setFixedSize(360, 35)
-        self.btn_voltar.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #110444;
-                font-size: 13px;
-                border: none;
-            }
-            QPushButton:hover {
-                text-decoration: underline;
-            }
-        """)
+        definir_papel(self.btn_voltar, "link")
         self.btn_voltar.clicked.connect(self.voltar_login)
         layout.addWidget(self.btn_voltar)
 
@@ -427,6 +355,7 @@ class TelaCadastro(QMainWindow):
         self.label_msg = QLabel("")
         self.label_msg.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.label_msg.setWordWrap(True)
+        definir_papel(self.label_msg, "mensagem")
         layout.addWidget(self.label_msg)
 
     def voltar_login(self):
@@ -436,34 +365,17 @@ class TelaCadastro(QMainWindow):
 
     def limpa_erro_estilo(self):
         for campo in [self.input_email, self.input_senha, self.input_repetir_senha, self.input_captcha]:
-            campo.setStyleSheet("""
-                QLineEdit {
-                    padding: 9px;
-                    font-size: 14px;
-                    border: 1px solid #ccc;
-                    border-radius: 6px;
-                    background-color: white;
-                    color: #000;
-                }
-                QLineEdit::placeholder {
-                    color: #aaa;
-                }
-            """)
+            marcar_erro(campo, False)
 
     def set_erro_estilo(self, widget):
-        widget.setStyleSheet("""
-            QLineEdit {
-                padding: 9px;
-                font-size: 14px;
-                border: 2px solid red;
-                border-radius: 6px;
-                background-color: white;
-                color: #000;
-            }
-            QLineEdit::placeholder {
-                color: #aaa;
-            }
-        """)
+        marcar_erro(widget)
+
+    def valida_ao_digitar(self):
+        """Marca e-mail inválido e senhas diferentes enquanto o usuário digita"""
+        email = self.input_email.text().strip()
+        marcar_erro(self.input_email, bool(email) and not self.valida_email(email))
+        repetir = self.input_repetir_senha.text()
+        marcar_erro(self.input_repetir_senha, bool(repetir) and repetir != self.input_senha.text())
 
     def valida_email(self, email):
         return re.match(r'^[\w\.-]+@[\w\.-]+\.\w+$', email) is not None
@@ -522,47 +434,54 @@ class TelaCadastro(QMainWindow):
 
         if erros:
             self.label_msg.setText("<br>".join(erros))
-            self.label_msg.setStyleSheet("color: red; font-size: 12px;")
+            definir_estado(self.label_msg, "erro")
             return
 
-        # Tentar cadastrar o usuário
-        try:
-            # Importar a função de cadastro
-            sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-            from backend.cadastrar import cadastrar_usuario_simples
-            
-            # Usar parte do email como nome (ou poderia adicionar um campo de nome no formulário)
-            nome = email.split('@')[0]
+        # Tentar cadastrar o usuário (o hash da senha roda fora da thread da interface)
+        from backend.cadastrar import cadastrar_usuario_simples
+
+        # Usar parte do email como nome (ou poderia adicionar um campo de nome no formulário)
+        nome = email.split('@')[0]
+
+        executar_em_segundo_plano(
+            cadastrar_usuario_simples, nome, email, senha,
+            ao_concluir=self.ao_cadastrar,
+            ao_falhar=self.ao_falhar_cadastro,
+            ocupado=lambda ocupado: self.btn_cadastrar.setEnabled(not ocupado),
+            dono=self
+        )
+
+    def ao_cadastrar(self, resultado):
+        """Recebe (sucesso, mensagem, id_usuario) de cadastrar_usuario_simples"""
+        sucesso, mensagem, _ = resultado
+        
+        if sucesso:
+            self.label_msg.setText("Cadastro realizado com sucesso!")
+            definir_estado(self.label_msg, "sucesso")
             
-            # Chamar a função de cadastro
-            sucesso, mensagem, _ = cadastrar_usuario_simples(nome, email, senha)
+            # Limpar campos após cadastro bem-sucedido
+            self.input_email.clear()
+            self.input_senha.clear()
+            self.input_repetir_senha.clear()
+            self.input_captcha.clear()
+            self.checkbox_termos.setChecked(False)
             
-            if sucesso:
-                self.label_msg.setText("Cadastro realizado com sucesso!")
-                self.label_msg.setStyleSheet("color: green; font-size: 13px;")
-                
-                # Limpar campos após cadastro bem-sucedido
-                self.input_email.clear()
-                self.input_senha.clear()
-                self.input_repetir_senha.clear()
-                self.input_captcha.clear()
-                self.checkbox_termos.setChecked(False)
-                
-                # Gerar novo captcha
-                self.num1 = random.randint(1, 10)
-                self.num2 = random.randint(1, 10)
-                self.resultado_captcha = self.num1 + self.num2
-                self.label_captcha.setText(f"Pergunta de segurança: Quanto é {self.num1} + {self.num2}?")
-            else:
-                self.label_msg.setText(mensagem)
-                self.label_msg.setStyleSheet("color: red; font-size: 12px;")
-                
-        except Exception as e:
-            self.label_msg.setText(f"Erro ao cadastrar: {str(e)}")
-            self.label_msg.setStyleSheet("color: red; font-size: 12px;")
+            # Gerar novo captcha
+            self.num1 = random.randint(1, 10)
+            self.num2 = random.randint(1, 10)
+            self.resultado_captcha = self.num1 + self.num2
+            self.label_captcha.setText(f"Pergunta de segurança: Quanto é {self.num1} + {self.num2}?")
+        else:
+            self.label_msg.setText(mensagem)
+            definir_estado(self.label_msg, "erro")
+
+    def ao_falhar_cadastro(self, erro):
+        self.label_msg.setText(f"Erro ao cadastrar: {str(erro)}")
+        definir_estado(self.label_msg, "erro")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    aplicar_tema(app)
     janela = TelaLogin()
     janela.show()
     sys.exit(app.exec())
\ No newline at end of file
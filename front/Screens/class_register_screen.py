@@ -1,11 +1,17 @@
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QLineEdit, QComboBox,
-    QPushButton, QHBoxLayout, QWidget, QMessageBox
+    QPushButton, QHBoxLayout, QWidget, QMessageBox, QFileDialog
 )
-from PyQt6.QtGui import QPixmap, QCursor
+from PyQt6.QtGui import QCursor
 from PyQt6.QtCore import Qt
 import sqlite3
-from backend.cadastrar_turma import CadastrarTurma  # Moved import to top level
+from backend.cadastrar_turma import obter_cadastro_turma
+from front.servico_assets import carregar_pixmap
+from front.cache_imagens import LOGO_CADASTRO_TURMA
+from front.tema import definir_papel
+from front.tarefas import executar_em_segundo_plano
+
+MAX_PROBLEMAS_EXIBIDOS = 10  # linhas com erro listadas no resumo da importação
 
 
 class ClassRegisterDialog(QDialog):
@@ -13,8 +19,8 @@ class ClassRegisterDialog(QDialog):
         super().__init__(parent)
         self.id_usuario = id_usuario  # Armazena o id_usuario
         self.setWindowTitle("Criar Nova Turma")
-        self.setFixedSize(420, 580)
-        self.setStyleSheet("background-color: #F8F8F8;")
+        self.setFixedSize(420, 620)
+        self.setObjectName("cadastroTurma")
         self.id_usuario = id_usuario  # Armazenar o ID do usuário
 
         main_widget = QWidget()
@@ -28,10 +34,9 @@ class ClassRegisterDialog(QDialog):
         self.logo_label = QLabel()
         self.logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        pixmap = QPixmap("assets/ScreenElements/gamescreen/logo-temp.png")
+        pixmap = carregar_pixmap(*LOGO_CADASTRO_TURMA)
         if not pixmap.isNull():
-            scaled_pixmap = pixmap.scaledToWidth(130, Qt.TransformationMode.SmoothTransformation)
-            self.logo_label.setPixmap(scaled_pixmap)
+            self.logo_label.setPixmap(pixmap)
 
         logo_container = QWidget()
         logo_layout = QHBoxLayout(logo_container)
@@ -39,46 +44,26 @@ class ClassRegisterDialog(QDialog):
         logo_layout.addWidget(self.logo_label, alignment=Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(logo_container)
 
-        estilo_input = """
-            QLineEdit, QComboBox {
-                padding: 1px;
-                font-size: 14px;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                background-color: white;
-                color: black;
-            }
-            QLineEdit::placeholder {
-                color: #aaa;
-            }
-            QComboBox QAbstractItemView {
-                color: #000;
-                background-color: white;
-                selection-background-color: #e0e0e0;
-            }
-        """
-
         def add_input(label_text, widget):
-            label = QLabel(label_text)
-            label.setStyleSheet("font-size: 13px; color: #333; font-weight: bold;")
+            label = definir_papel(QLabel(label_text), "rotulo")
             layout.addWidget(label)
             layout.addWidget(widget)
 
         self.id_label = QLabel("ID da Turma: 001")
-        self.id_label.setStyleSheet("font-size: 14px; color: #333; font-weight: bold;")
+        definir_papel(self.id_label, "rotuloDestaque")
         self.id_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
         layout.addWidget(self.id_label)
 
         self.nome_turma_input = QLineEdit()
         self.nome_turma_input.setPlaceholderText("Digite o nome da turma")
         self.nome_turma_input.setFixedSize(360, 40)
-        self.nome_turma_input.setStyleSheet(estilo_input)
+        definir_papel(self.nome_turma_input, "campoTurma")
         add_input("Nome da Turma:", self.nome_turma_input)
 
         self.combo_qtd_alunos = QComboBox()
         self.combo_qtd_alunos.addItems([str(i) for i in range(10, 51)])
         self.combo_qtd_alunos.setFixedSize(360, 40)
-        self.combo_qtd_alunos.setStyleSheet(estilo_input)
+        definir_papel(self.combo_qtd_alunos, "campoTurma")
         add_input("Quantidade de Alunos:", self.combo_qtd_alunos)
 
         self.combo_serie = QComboBox()
@@ -88,41 +73,28 @@ class ClassRegisterDialog(QDialog):
         ]
         self.combo_serie.addItems(series)
         self.combo_serie.setFixedSize(360, 40)
-        self.combo_serie.setStyleSheet(estilo_input)
+        definir_papel(self.combo_serie, "campoTurma")
         add_input("Série da Turma:", self.combo_serie)
 
         self.btn_criar = QPushButton("Criar Turma")
         self.btn_criar.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_criar.setFixedSize(360, 45)
-        self.btn_criar.setStyleSheet("""
-            QPushButton {
-                background-color: #130060;
-                color: white;
-                border-radius: 6px;
-                font-size: 15px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #110444;
-            }
-        """)
+        definir_papel(self.btn_criar, "primario")
         layout.addWidget(self.btn_criar)
         self.btn_criar.clicked.connect(self.cadastrar_turma)
 
+        # Várias turmas de uma vez (colunas nome, quantidade e serie)
+        self.btn_importar = QPushButton("Importar turmas de um arquivo CSV")
+        self.btn_importar.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.btn_importar.setFixedSize(360, 30)
+        definir_papel(self.btn_importar, "link")
+        self.btn_importar.clicked.connect(self.importar_csv)
+        layout.addWidget(self.btn_importar)
+
         self.btn_voltar = QPushButton("Voltar")
         self.btn_voltar.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_voltar.setFixedSize(360, 35)
-        self.btn_voltar.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #110444;
-                font-size: 13px;
-                border: none;
-            }
-            QPushButton:hover {
-                text-decoration: underline;
-            }
-        """)
+        definir_papel(self.btn_voltar, "link")
         self.btn_voltar.clicked.connect(self.reject)
         layout.addWidget(self.btn_voltar)
 
@@ -142,9 +114,53 @@ class ClassRegisterDialog(QDialog):
             QMessageBox.critical(self, "Erro", "Usuário não identificado. Faça login novamente.")
             return
 
-        # Usar a classe CadastrarTurma para cadastrar
-        cadastro = CadastrarTurma(self.id_usuario)
-        sucesso, mensagem, turma_id = cadastro.cadastrar_turma(nome, quantidade, serie)
+        # O cadastro grava no banco: roda fora da thread da interface
+        executar_em_segundo_plano(
+            cadastrar_turma_no_banco, self.id_usuario, nome, quantidade, serie,
+            ao_concluir=self.ao_cadastrar_turma,
+            ao_falhar=lambda erro: self.ao_cadastrar_turma((False, f"Erro ao cadastrar turma: {erro}", None)),
+            ocupado=lambda ocupado: self.btn_criar.setEnabled(not ocupado),
+            dono=self
+        )
+
+    def importar_csv(self):
+        if self.id_usuario is None:
+            QMessageBox.critical(self, "Erro", "Usuário não identificado. Faça login novamente.")
+            return
+
+        caminho, _ = QFileDialog.getOpenFileName(
+            self, "Importar turmas", "", "Planilhas CSV (*.csv);;Todos os arquivos (*)"
+        )
+        if not caminho:
+            return
+
+        executar_em_segundo_plano(
+            importar_turmas_no_banco, self.id_usuario, caminho,
+            ao_concluir=self.ao_importar_csv,
+            ao_falhar=lambda erro: self.ao_importar_csv((False, f"Erro ao importar turmas: {erro}", None)),
+            ocupado=lambda ocupado: (self.btn_importar.setEnabled(not ocupado), self.btn_criar.setEnabled(not ocupado)),
+            dono=self
+        )
+
+    def ao_importar_csv(self, resultado):
+        """Recebe (sucesso, mensagem, relatorio) de CadastrarTurma.importar_csv"""
+        sucesso, mensagem, relatorio = resultado
+        linhas = [mensagem]
+        if relatorio:
+            problemas = relatorio['erros'] + relatorio['conflitos']
+            linhas += [f"Linha {numero}: {erro}" for numero, erro in problemas[:MAX_PROBLEMAS_EXIBIDOS]]
+            if len(problemas) > MAX_PROBLEMAS_EXIBIDOS:
+                linhas.append(f"... e mais {len(problemas) - MAX_PROBLEMAS_EXIBIDOS} linha(s)")
+
+        if sucesso and relatorio['inseridas']:
+            QMessageBox.information(self, "Importação concluída", "\n".join(linhas))
+            self.accept()
+        else:
+            QMessageBox.warning(self, "Importação de turmas", "\n".join(linhas))
+
+    def ao_cadastrar_turma(self, resultado):
+        """Recebe (sucesso, mensagem, turma_id) de CadastrarTurma.cadastrar_turma"""
+        sucesso, mensagem, turma_id = resultado
 
         if sucesso:
             QMessageBox.information(self, "Sucesso", mensagem)
@@ -155,4 +171,14 @@ class ClassRegisterDialog(QDialog):
             msg_box.setWindowTitle("Erro")
             msg_box.setText(mensagem)
             msg_box.setStyleSheet("QLabel{color: red;}")
-            msg_box.exec()
\ No newline at end of file
+            msg_box.exec()
+
+
+def importar_turmas_no_banco(id_usuario, caminho):
+    # Executada no pool de threads (ver front/tarefas.py)
+    return obter_cadastro_turma(id_usuario).importar_csv(caminho)
+
+
+def cadastrar_turma_no_banco(id_usuario, nome, quantidade, serie):
+    # Executada no pool de threads (ver front/tarefas.py)
+    return obter_cadastro_turma(id_usuario).cadastrar_turma(nome, quantidade, serie)
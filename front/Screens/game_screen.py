@@ -2,15 +2,14 @@ from PyQt6.QtWidgets import (
     QMainWindow, QLabel, QPushButton, QWidget, QVBoxLayout, QHBoxLayout,
     QSpacerItem, QSizePolicy, QFrame
 )
-from PyQt6.QtGui import QPixmap, QCursor, QFontDatabase, QFont
+from PyQt6.QtGui import QCursor
 from PyQt6.QtCore import Qt
 import os
-from tela_das_turmas import ListarTurmasDialog
-try:
-    from class_register_screen import ClassRegisterDialog
-except ImportError:
-    print("⚠️  class_register_screen não encontrado - funcionalidade limitada")
-    ClassRegisterDialog = None
+from front.servico_assets import carregar_pixmap
+from front.cache_imagens import LOGO_JOGO, ICONE_RUNA
+from front.fontes import obter_font_manager
+from front.tema import definir_papel
+# As telas de turma só são importadas quando abertas (ver abrir_tela_criar_turma e carregar_turma)
 
 class GameScreen(QMainWindow):
     def __init__(self, tela_login=None, id_usuario=None):
@@ -21,27 +20,9 @@ class GameScreen(QMainWindow):
         self.setWindowTitle("Raízes Ocultas - Jogo")
         self.setFixedSize(1000, 700)
 
-        # --- Fonte
-
-        font_path = "assets/fonts/Ghost theory 2.ttf"
-        font_path = font_path.replace("\\", "/")  
-        abs_font_path = os.path.abspath(font_path)
-
-        if os.path.exists(abs_font_path):
-            print(f"A fonte foi encontrada: {abs_font_path}")
-        else:
-            print(f"Erro: Arquivo de fonte não encontrado em {abs_font_path}")
-
-        font_id = QFontDatabase.addApplicationFont(abs_font_path)
-        print(f"Font ID: {font_id}")
-
-        if font_id != -1:
-            families = QFontDatabase.applicationFontFamilies(font_id)
-            print(f"Families found: {families}")
-            self.fonte_medieval = families[0] if families else "Georgia"
-        else:
-            print("Falha ao carregar a fonte!")
-            self.fonte_medieval = "Georgia"
+        # --- Fonte (registrada uma única vez por processo em front/fontes.py)
+        self.font_manager = obter_font_manager()
+        self.fonte_medieval = self.font_manager.family("titulo", "Georgia")
 
         # --- Central 
         central_widget = QWidget(self)
@@ -52,7 +33,7 @@ class GameScreen(QMainWindow):
         
         background_path = "assets/ScreenElements/gamescreen/background-game.png"
         if os.path.exists(background_path):
-            self.background_label.setPixmap(QPixmap(background_path))
+            self.background_label.setPixmap(carregar_pixmap(background_path))
             self.background_label.setScaledContents(True)
         else:
             print(f"⚠️  Background não encontrado: {background_path}")
@@ -76,26 +57,7 @@ class GameScreen(QMainWindow):
 
         self.adjust_button_font(self.btn_voltar)
 
-        self.btn_voltar.setStyleSheet("""
-            QPushButton {
-                background-repeat: repeat;
-                color: #d9c27f;
-                font-weight: bold;
-                padding: 10px 10px;
-                border-radius: 14px;
-                border: 3px solid #7a6f44;
-            }
-            QPushButton:hover {
-                background-color: #556b2f88;
-                border-color: #f5e86c;
-                color: #fff8dc;
-            }
-            QPushButton:pressed {
-                background-color: #3e4f1eaa;
-                border-color: #cfc28c;
-                color: #b9a75b;
-            }
-        """)
+        definir_papel(self.btn_voltar, "sair")
 
         self.btn_voltar.clicked.connect(self.voltar_para_login)
         topo_layout.addWidget(self.btn_voltar, alignment=Qt.AlignmentFlag.AlignLeft)
@@ -112,12 +74,12 @@ class GameScreen(QMainWindow):
         logo_layout.addItem(spacer_logo)
 
         self.logo_top = QLabel()
-        logo_path = "assets/ScreenElements/gamescreen/logo-temp.png"
+        logo_path = LOGO_JOGO[0]
         
         if os.path.exists(logo_path):
-            pixmap_logo = QPixmap(logo_path)
+            pixmap_logo = carregar_pixmap(*LOGO_JOGO)
             if not pixmap_logo.isNull():
-                self.logo_top.setPixmap(pixmap_logo.scaledToWidth(250, Qt.TransformationMode.SmoothTransformation))
+                self.logo_top.setPixmap(pixmap_logo)
         else:
             # caso a logo suma dessa budega
             self.logo_top.setText("🎮 RAÍZES OCULTAS 🎮")
@@ -138,30 +100,6 @@ class GameScreen(QMainWindow):
         botoes_layout.setSpacing(25)
         botoes_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter)
 
-        # Estilo dos botões
-        estilo_botao = f"""
-            QPushButton {{
-                background-color: #8B4513;
-                color: #f5e9c3;
-                font-weight: bold;
-                font-size: 20px;
-                padding: 14px 60px;
-                border-radius: 18px;
-                border: 3px solid #5a452b;
-                font-family: "{self.fonte_medieval}";
-            }}
-            QPushButton:hover {{
-                border: 3px solid #f2d372;
-                color: #fff8dc;
-                background-color: #A0522D;
-            }}
-            QPushButton:pressed {{
-                border: 3px solid #d4b95a;
-                color: #bba56e;
-                background-color: #654321;
-            }}
-        """
-
         def criar_botao_com_icone(texto):
             botao_frame = QFrame()
             botao_frame.setFixedWidth(360)
@@ -172,22 +110,22 @@ class GameScreen(QMainWindow):
             botao_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
 
             lbl_icone = QLabel()
-            icone_path = "assets/ScreenElements/icons/runa.png"
+            icone_path = ICONE_RUNA[0]
             
             if os.path.exists(icone_path):
-                pixmap_icone = QPixmap(icone_path).scaled(36, 36, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                pixmap_icone = carregar_pixmap(*ICONE_RUNA)
                 lbl_icone.setPixmap(pixmap_icone)
             else:
                 
                 lbl_icone.setText("⚡")
-                lbl_icone.setStyleSheet("font-size: 24px; color: #f5e9c3;")
+                definir_papel(lbl_icone, "iconeRuna")
             
             lbl_icone.setFixedSize(36, 36)
             botao_layout.addWidget(lbl_icone)
 
             btn = QPushButton(texto)
             btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-            btn.setStyleSheet(estilo_botao)
+            definir_papel(btn, "runa")
             btn.setFixedHeight(56)
             btn.setMinimumWidth(300) 
             btn.setMaximumWidth(300)
@@ -214,38 +152,15 @@ class GameScreen(QMainWindow):
         botoes_inferiores_layout.setContentsMargins(0, 0, 0, 0)
         botoes_inferiores_layout.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom)
 
-        estilo_botao_pequeno = f"""
-            QPushButton {{
-                background-color: #654321;
-                color: #d9c27f;
-                font-weight: bold;
-                font-size: 15px;
-                padding: 10px 10px;
-                border-radius: 12px;
-                border: 2px solid #7a6f44;
-                font-family: "{self.fonte_medieval}";
-            }}
-            QPushButton:hover {{
-                background-color: #8B4513;
-                border-color: #f5e86c;
-                color: #fff8dc;
-            }}
-            QPushButton:pressed {{
-                background-color: #5D4037;
-                border-color: #cfc28c;
-                color: #b9a75b;
-            }}
-        """
-
         self.btn_equipe = QPushButton("Equipe")
         self.btn_equipe.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.btn_equipe.setStyleSheet(estilo_botao_pequeno)
+        definir_papel(self.btn_equipe, "rodape")
         self.btn_equipe.setFixedSize(100, 40)
         self.adjust_button_font(self.btn_equipe)
 
         self.btn_projeto = QPushButton("Projeto")
         self.btn_projeto.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.btn_projeto.setStyleSheet(estilo_botao_pequeno)
+        definir_papel(self.btn_projeto, "rodape")
         self.btn_projeto.setFixedSize(100, 40)
         self.adjust_button_font(self.btn_projeto)
 
@@ -265,6 +180,12 @@ class GameScreen(QMainWindow):
         self.btn_projeto.clicked.connect(self.mostrar_projeto)
 
     def abrir_tela_criar_turma(self):
+        try:
+            from front.Screens.class_register_screen import ClassRegisterDialog
+        except ImportError:
+            print("⚠️  class_register_screen não encontrado - funcionalidade limitada")
+            ClassRegisterDialog = None
+
         if ClassRegisterDialog:
             self.class_register_screen = ClassRegisterDialog(self, id_usuario=self.id_usuario)  # Passa o id_usuario
             self.class_register_screen.exec()
@@ -274,13 +195,35 @@ class GameScreen(QMainWindow):
             QMessageBox.information(self, "Info", "Funcionalidade em desenvolvimento!")
     
     def carregar_turma(self):
-        # Substitua o método existente por este:
+        from front.Screens.tela_das_turmas import ListarTurmasDialog
         dialog = ListarTurmasDialog(self, self.id_usuario)
-        dialog.exec()
+        if dialog.exec() and dialog.turma_selecionada:
+            from front.navegacao import obter_navegador
+            obter_navegador().ir_para("aventura", id_usuario=self.id_usuario, id_turma=dialog.turma_selecionada)
 
     def mostrar_estatisticas(self):
+        from front.tarefas import executar_em_segundo_plano
+        executar_em_segundo_plano(
+            estatisticas_no_banco, self.id_usuario,
+            ao_concluir=self.exibir_estatisticas,
+            ocupado=lambda ocupado: self.btn_estatisticas.setEnabled(not ocupado),
+            dono=self
+        )
+
+    def exibir_estatisticas(self, estatisticas):
         from PyQt6.QtWidgets import QMessageBox
-        QMessageBox.information(self, "Estatísticas", "Funcionalidade em desenvolvimento!")
+
+        if not estatisticas:
+            QMessageBox.information(self, "Estatísticas", "Você ainda não criou nenhuma turma.")
+            return
+
+        linhas = []
+        for _, nome, est in estatisticas:
+            linhas.append(
+                f"{nome}: {est['total']} respostas | {est['acertos']} acertos | "
+                f"{est['erros']} erros | tempo médio {est['tempo_medio']:.1f}s"
+            )
+        QMessageBox.information(self, "Estatísticas", "\n".join(linhas))
 
     def mostrar_equipe(self):
         from PyQt6.QtWidgets import QMessageBox
@@ -298,10 +241,18 @@ class GameScreen(QMainWindow):
         else:
             font_size = int(screen_width * 0.02)  
 
-        font = QFont(self.fonte_medieval, font_size)
-        button.setFont(font)
+        button.setFont(self.font_manager.get_font("titulo", font_size))
+
+    def ao_exibir(self, contexto):
+        # A mesma instância é reaproveitada entre logins
+        self.id_usuario = contexto.get("id_usuario")
 
     def voltar_para_login(self):
-        self.close()
-        if self.tela_login:
-            self.tela_login.show()
\ No newline at end of file
+        from front.navegacao import obter_navegador
+        obter_navegador().ir_para("login")
+
+
+def estatisticas_no_banco(id_usuario):
+    # Executada no pool de threads (ver front/tarefas.py)
+    from backend.cadastrar_turma import obter_cadastro_turma
+    return obter_cadastro_turma(id_usuario).get_estatisticas_usuario(id_usuario)
@@ -1,10 +1,134 @@
-# Crie um novo arquivo listar_turmas_screen.py
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QLabel, QPushButton, 
-    QScrollArea, QWidget, QMessageBox,QHBoxLayout,QButtonGroup,
-    QRadioButton
+    QDialog, QVBoxLayout, QLabel, QPushButton, QMessageBox, QHBoxLayout,
+    QLineEdit, QTableView, QHeaderView, QAbstractItemView
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont
+from front.tema import definir_papel
+from front.tarefas import executar_em_segundo_plano
+
+TAMANHO_PAGINA = 50
+ESPERA_BUSCA_MS = 250  # a busca só vai ao banco quando o usuário para de digitar
+
+
+class ModeloTurmas(QAbstractTableModel):
+    """
+    Turmas do usuário, buscadas no banco em páginas conforme a lista rola.
+
+    Cada página é pedida com paginação por chave (listar_turmas_pagina) em uma
+    thread do pool; a view só pinta as linhas visíveis, sem um widget por turma.
+    Trocar a busca descarta as linhas carregadas e recomeça da primeira página.
+    """
+
+    COLUNAS = ("Turma", "Série", "Alunos")
+    carregamento_iniciado = pyqtSignal()   # ao pedir uma página
+    carregamento_concluido = pyqtSignal()  # depois de cada página (ou erro)
+
+    def __init__(self, id_usuario, tamanho_pagina=TAMANHO_PAGINA, parent=None):
+        super().__init__(parent)
+        self.id_usuario = id_usuario
+        self.tamanho_pagina = tamanho_pagina
+        self.busca = ""
+        self.erro = None
+        self._linhas = []
+        self._fim = False
+        self._tarefa = None
+        self._negrito = QFont()
+        self._negrito.setBold(True)
+
+    # ------------------------- dados -------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._linhas)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUNAS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        turma_id, nome, quantidade, serie = self._linhas[index.row()]
+        coluna = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return (nome, serie, quantidade)[coluna]
+        if role == Qt.ItemDataRole.FontRole and coluna == 0:
+            return self._negrito
+        if role == Qt.ItemDataRole.TextAlignmentRole and coluna == 2:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.UserRole:
+            return turma_id
+        return None
+
+    def headerData(self, secao, orientacao, role=Qt.ItemDataRole.DisplayRole):
+        if orientacao == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUNAS[secao]
+        return None
+
+    def id_turma(self, linha):
+        return self._linhas[linha][0]
+
+    @property
+    def carregando(self):
+        return self._tarefa is not None
+
+    @property
+    def completo(self):
+        """True quando todas as turmas da busca atual já foram carregadas"""
+        return self._fim
+
+    # ----------------------- paginação -----------------------
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._fim and self._tarefa is None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        apos_id = self._linhas[-1][0] if self._linhas else None
+        self._tarefa = executar_em_segundo_plano(
+            buscar_pagina, self.id_usuario, apos_id, self.tamanho_pagina, self.busca,
+            ao_concluir=self._receber_pagina,
+            ao_falhar=self._falhar,
+            dono=self
+        )
+        self.carregamento_iniciado.emit()
+
+    def definir_busca(self, texto):
+        """Recomeça a lista filtrando por nome ou série (filtro aplicado no SQL)"""
+        texto = texto.strip()
+        if texto == self.busca and (self._linhas or self._tarefa is not None):
+            return
+        if self._tarefa is not None:
+            self._tarefa.cancelar()  # a página da busca anterior não interessa mais
+            self._tarefa = None
+        self.beginResetModel()
+        self.busca = texto
+        self._linhas = []
+        self._fim = False
+        self.erro = None
+        self.endResetModel()
+        self.fetchMore()
+
+    def _receber_pagina(self, linhas):
+        self._tarefa = None
+        self._fim = len(linhas) < self.tamanho_pagina
+        if linhas:
+            inicio = len(self._linhas)
+            self.beginInsertRows(QModelIndex(), inicio, inicio + len(linhas) - 1)
+            self._linhas.extend(linhas)
+            self.endInsertRows()
+        self.carregamento_concluido.emit()
+
+    def _falhar(self, erro):
+        self._tarefa = None
+        self._fim = True
+        self.erro = erro
+        self.carregamento_concluido.emit()
+
+
+def buscar_pagina(id_usuario, apos_id, limite, busca):
+    # Executada no pool de threads (ver front/tarefas.py)
+    from backend.cadastrar_turma import obter_cadastro_turma
+    return obter_cadastro_turma(id_usuario).listar_turmas_pagina(id_usuario, apos_id, limite, busca)
+
 
 class ListarTurmasDialog(QDialog):
     def __init__(self, parent=None, id_usuario=None):
@@ -13,97 +137,113 @@ class ListarTurmasDialog(QDialog):
         self.setFixedSize(500, 400)
         self.id_usuario = id_usuario
         self.turma_selecionada = None
-        
+
         # Layout principal
         layout = QVBoxLayout()
         self.setLayout(layout)
-        
+
         # Título
-        lbl_titulo = QLabel("Selecione uma Turma para Jogar")
-        lbl_titulo.setStyleSheet("font-size: 18px; font-weight: bold;")
+        lbl_titulo = definir_papel(QLabel("Selecione uma Turma para Jogar"), "tituloDialogo")
         lbl_titulo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(lbl_titulo)
-        
-        # Área de scroll
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        # Carrega as turmas
-        self.carregar_turmas(scroll_layout)
-        
-        scroll.setWidget(scroll_content)
-        layout.addWidget(scroll)
-        
+
+        # Busca por nome ou série
+        self.input_busca = QLineEdit()
+        self.input_busca.setPlaceholderText("Buscar por nome ou série")
+        self.input_busca.setClearButtonEnabled(True)
+        layout.addWidget(self.input_busca)
+
+        self.timer_busca = QTimer(self)
+        self.timer_busca.setSingleShot(True)
+        self.timer_busca.setInterval(ESPERA_BUSCA_MS)
+        self.timer_busca.timeout.connect(lambda: self.modelo.definir_busca(self.input_busca.text()))
+        self.input_busca.textChanged.connect(self.timer_busca.start)
+
+        # Lista de turmas (model/view: as páginas chegam conforme a rolagem)
+        self.modelo = ModeloTurmas(id_usuario, parent=self)
+        self.modelo.carregamento_iniciado.connect(self.mostrar_carregando)
+        self.modelo.carregamento_concluido.connect(self.atualizar_estado)
+        self.modelo.modelReset.connect(self.limpar_selecao)
+
+        self.tabela = QTableView()
+        self.tabela.setModel(self.modelo)
+        self.tabela.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.tabela.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.tabela.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.tabela.setShowGrid(False)
+        self.tabela.setAlternatingRowColors(True)
+        self.tabela.setWordWrap(False)
+        self.tabela.verticalHeader().hide()
+        # Altura fixa: a view calcula a posição de qualquer linha sem medir o conteúdo
+        self.tabela.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.tabela.verticalHeader().setDefaultSectionSize(32)
+        cabecalho = self.tabela.horizontalHeader()
+        cabecalho.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        cabecalho.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        cabecalho.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        self.tabela.selectionModel().currentRowChanged.connect(self.turma_selecionada_handler)
+        self.tabela.doubleClicked.connect(self.selecionar_turma)
+        layout.addWidget(self.tabela)
+
+        self.lbl_estado = QLabel("Carregando turmas...")
+        self.lbl_estado.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.lbl_estado)
+
         # Botões
         btn_layout = QHBoxLayout()
-        
+
         self.btn_selecionar = QPushButton("Selecionar Turma")
         self.btn_selecionar.clicked.connect(self.selecionar_turma)
         self.btn_selecionar.setEnabled(False)
         btn_layout.addWidget(self.btn_selecionar)
-        
+
         btn_fechar = QPushButton("Fechar")
         btn_fechar.clicked.connect(self.close)
         btn_layout.addWidget(btn_fechar)
-        
+
         layout.addLayout(btn_layout)
-    
-    def carregar_turmas(self, layout):
-        from backend.cadastrar_turma import CadastrarTurma
-        
-        cadastro = CadastrarTurma(self.id_usuario)
-        turmas = cadastro.listar_turmas_usuario(self.id_usuario)
-        
-        if not turmas:
-            lbl_vazio = QLabel("Você ainda não criou nenhuma turma.")
-            lbl_vazio.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(lbl_vazio)
-            return
-        
-        self.radio_group = QButtonGroup(self)
-        
-        for turma in turmas:
-            turma_id, nome, quantidade, serie = turma
-            
-            widget_turma = QWidget()
-            widget_turma.setStyleSheet("""
-                QWidget {
-                    border: 1px solid #ccc;
-                    border-radius: 5px;
-                    padding: 10px;
-                    margin: 5px;
-                }
-            """)
-            
-            turma_layout = QHBoxLayout(widget_turma)
-            
-            radio = QRadioButton()
-            radio.toggled.connect(lambda checked, tid=turma_id: self.turma_selecionada_handler(checked, tid))
-            self.radio_group.addButton(radio, turma_id)
-            
-            lbl_nome = QLabel(f"<b>{nome}</b> - Série: {serie} | Alunos: {quantidade}")
-            
-            turma_layout.addWidget(radio)
-            turma_layout.addWidget(lbl_nome)
-            turma_layout.addStretch()
-            
-            layout.addWidget(widget_turma)
-    
-    def turma_selecionada_handler(self, checked, turma_id):
-        self.turma_selecionada = turma_id if checked else None
-        self.btn_selecionar.setEnabled(checked)
-    
+
+        # Primeira página
+        self.modelo.fetchMore()
+
+    def atualizar_estado(self):
+        modelo = self.modelo
+        if modelo.erro is not None:
+            self.lbl_estado.setText(f"Erro ao carregar turmas: {modelo.erro}")
+        elif modelo.rowCount() == 0:
+            self.lbl_estado.setText(
+                "Nenhuma turma encontrada." if modelo.busca else "Você ainda não criou nenhuma turma."
+            )
+        else:
+            self.lbl_estado.setText("")
+        self.lbl_estado.setVisible(bool(self.lbl_estado.text()))
+
+        # Se a página não encheu a área visível, a view não rola e não pediria mais
+        barra = self.tabela.verticalScrollBar()
+        if modelo.canFetchMore() and barra.maximum() == 0:
+            modelo.fetchMore()
+
+    def mostrar_carregando(self):
+        # Só a primeira página (lista vazia); as seguintes chegam durante a rolagem
+        if self.modelo.rowCount() == 0:
+            self.lbl_estado.setText("Carregando turmas...")
+            self.lbl_estado.show()
+
+    def limpar_selecao(self):
+        self.turma_selecionada_handler(QModelIndex())
+
+    def turma_selecionada_handler(self, atual, anterior=None):
+        self.turma_selecionada = self.modelo.id_turma(atual.row()) if atual.isValid() else None
+        self.btn_selecionar.setEnabled(self.turma_selecionada is not None)
+
     def selecionar_turma(self):
         if self.turma_selecionada:
             self.accept()  # Fecha o diálogo com resultado positivo
         else:
             QMessageBox.warning(self, "Aviso", "Selecione uma turma para continuar")
-    
+
     @staticmethod
     def get_turma_selecionada(parent=None, id_usuario=None):
         dialog = ListarTurmasDialog(parent, id_usuario)
         result = dialog.exec()
-        return dialog.turma_selecionada if result == QDialog.DialogCode.Accepted else None
\ No newline at end of file
+        return dialog.turma_selecionada if result == QDialog.DialogCode.Accepted else None
@@ -0,0 +1,238 @@
+import math
+from PyQt6.QtWidgets import QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QProgressBar
+from PyQt6.QtGui import QCursor
+from PyQt6.QtCore import Qt, QTimer
+from backend.jogo import QuizGame, PERGUNTAS_POR_PARTIDA
+from front.fontes import obter_font_manager
+from front.tema import definir_papel, definir_estado
+from front.tarefas import executar_em_segundo_plano
+
+PAUSA_FEEDBACK_MS = 1500  # tempo para ler o resultado antes da próxima pergunta
+QUADRO_MS = 16            # usado quando a tela não informa a taxa de atualização
+
+
+class TelaQuiz(QWidget):
+    """
+    Tela do quiz sobre o QuizGame (backend/jogo.py).
+
+    Só exibe o estado do jogo e repassa as ações do jogador; as regras
+    (vidas, bônus, sequência de acertos, gravação) ficam no motor. As
+    mensagens aparecem na própria tela, sem janelas modais.
+
+    O cronômetro só desenha o tempo: a cada quadro pergunta ao motor quanto
+    falta (relógio monotônico) e se o prazo passou, então atrasos do loop de
+    eventos não se acumulam no tempo exibido nem no tempo gravado.
+    """
+
+    def __init__(self, nivel="1-1", id_turma=None, quantidade=PERGUNTAS_POR_PARTIDA,
+                 ao_terminar=None, parent=None):
+        """
+        Args:
+            nivel: "dificuldade-classe"
+            ao_terminar: callback(venceu: bool) chamado ao clicar em "Voltar"
+        """
+        super().__init__(parent)
+        self.setObjectName("telaQuiz")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.ao_terminar = ao_terminar
+        self.font_manager = obter_font_manager()
+
+        self.jogo = QuizGame(nivel, id_turma, quantidade)
+        self.jogo.ouvir('pergunta', self.exibir_pergunta)
+        self.jogo.ouvir('resposta', self.exibir_resposta)
+        self.jogo.ouvir('bonus', self.exibir_bonus)
+        self.jogo.ouvir('vida_perdida', self.exibir_vida_perdida)
+        self.jogo.ouvir('segunda_chance', self.exibir_segunda_chance)
+        self.jogo.ouvir('fim', self.exibir_fim)
+        self.jogo.ouvir('erro', self.exibir_fim_com_erro)
+
+        self.segundos_exibidos = None
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.atualizar_timer)
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(60, 40, 60, 40)
+        layout.setSpacing(16)
+
+        info_layout = QHBoxLayout()
+        self.label_vidas = definir_papel(QLabel(), "infoQuiz")
+        self.label_timer = definir_papel(QLabel(), "infoQuiz")
+        self.label_timer.setAlignment(Qt.AlignmentFlag.AlignRight)
+        info_layout.addWidget(self.label_vidas)
+        info_layout.addStretch()
+        info_layout.addWidget(self.label_timer)
+        layout.addLayout(info_layout)
+
+        self.barra_tempo = definir_papel(QProgressBar(), "tempoQuiz")
+        self.barra_tempo.setTextVisible(False)
+        self.barra_tempo.setFixedHeight(8)
+        layout.addWidget(self.barra_tempo)
+
+        self.label_pergunta = definir_papel(QLabel(), "perguntaQuiz")
+        self.label_pergunta.setWordWrap(True)
+        self.label_pergunta.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.label_pergunta.setFont(self.font_manager.get_font("narração", size=18))
+        layout.addWidget(self.label_pergunta, stretch=1)
+
+        fonte_opcoes = self.font_manager.get_font("botoes", size=13, bold=True)
+        self.botoes = []
+        for i in range(4):
+            btn = definir_papel(QPushButton(), "opcaoQuiz")
+            btn.setMinimumHeight(50)
+            btn.setFont(fonte_opcoes)
+            btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+            btn.clicked.connect(lambda _=False, i=i: self.verificar_resposta(i))
+            layout.addWidget(btn)
+            self.botoes.append(btn)
+
+        self.label_feedback = definir_papel(QLabel(), "feedbackQuiz")
+        self.label_feedback.setWordWrap(True)
+        self.label_feedback.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.label_feedback)
+
+        self.btn_voltar = definir_papel(QPushButton("Voltar"), "rodape")
+        self.btn_voltar.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.btn_voltar.clicked.connect(self.voltar)
+        self.btn_voltar.hide()
+        layout.addWidget(self.btn_voltar, alignment=Qt.AlignmentFlag.AlignCenter)
+
+    def iniciar(self):
+        """Sorteia as perguntas e exibe a primeira"""
+        self.atualizar_vidas()
+        if self.jogo.iniciar():
+            self.jogo.proxima_pergunta()
+
+    # ---------------------------- ações ----------------------------
+    def verificar_resposta(self, indice):
+        if self.jogo.terminado or self.jogo.pergunta is None:
+            return
+        self.timer.stop()
+        self.habilitar_opcoes(False)
+        self.jogo.responder(indice)  # o motor mede o tempo gasto
+        self.continuar()
+
+    def atualizar_timer(self):
+        """Chamado a cada quadro: redesenha o tempo restante e verifica o prazo"""
+        if self.jogo.verificar_prazo():
+            self.timer.stop()
+            self.habilitar_opcoes(False)
+            self.exibir_tempo(0.0)
+            self.continuar()
+            return
+        self.exibir_tempo(self.jogo.tempo_restante())
+
+    def exibir_tempo(self, restante):
+        self.barra_tempo.setValue(round(restante * 1000))
+        # O texto só muda quando o segundo exibido muda (evita relayout a cada quadro)
+        segundos = math.ceil(restante)
+        if segundos != self.segundos_exibidos:
+            self.segundos_exibidos = segundos
+            self.label_timer.setText(f"Tempo restante: {segundos} segundos")
+
+    def intervalo_quadro(self):
+        tela = self.screen()
+        frequencia = tela.refreshRate() if tela is not None else 0
+        return max(1, round(1000 / frequencia)) if frequencia > 0 else QUADRO_MS
+
+    def continuar(self):
+        if not self.jogo.terminado:
+            QTimer.singleShot(PAUSA_FEEDBACK_MS, self.jogo.proxima_pergunta)
+
+    def voltar(self):
+        self.timer.stop()
+        # A gravação das respostas pendentes termina no pool, sem travar a janela
+        self.jogo.encerrar(aguardar=False)
+        executar_em_segundo_plano(
+            self.jogo.gravador.descarregar,
+            ao_concluir=_avisar_respostas_pendentes,
+            nome="descarregar respostas do quiz"
+        )
+        if self.ao_terminar:
+            self.ao_terminar(self.jogo.venceu)
+
+    # --------------------------- eventos ---------------------------
+    def exibir_pergunta(self, numero, pergunta, tempo_limite):
+        self.label_pergunta.setText(f"{numero}. {pergunta['pergunta']}")
+        for btn, opcao in zip(self.botoes, pergunta['opcoes']):
+            btn.setText(opcao)
+        self.habilitar_opcoes(True)
+        self.mostrar_feedback("")
+
+        self.barra_tempo.setRange(0, tempo_limite * 1000)
+        self.segundos_exibidos = None
+        self.exibir_tempo(self.jogo.tempo_restante())
+        self.timer.start(self.intervalo_quadro())
+
+    def exibir_resposta(self, acertou, tempo_gasto_ms, resposta_correta):
+        if acertou:
+            self.mostrar_feedback(f"Você acertou! ({tempo_gasto_ms / 1000:.2f} s)", "sucesso")
+        else:
+            self.mostrar_feedback(f"A resposta correta era a {resposta_correta}.", "erro")
+
+    def exibir_bonus(self, tipo, mensagem):
+        self.atualizar_vidas()
+        self.acrescentar_feedback(f"✨ {mensagem}")
+
+    def exibir_vida_perdida(self, motivo, vidas):
+        self.atualizar_vidas()
+        self.acrescentar_feedback(f"{motivo} Você perdeu uma vida.", "erro")
+
+    def exibir_segunda_chance(self, mensagem):
+        self.acrescentar_feedback(mensagem)
+
+    def exibir_fim(self, venceu, pontuacao, mensagem):
+        self.timer.stop()
+        self.habilitar_opcoes(False)
+        self.acrescentar_feedback(mensagem, "sucesso" if venceu else "erro")
+        self.btn_voltar.show()
+
+    def exibir_fim_com_erro(self, mensagem):
+        self.label_pergunta.setText(mensagem)
+        for btn in self.botoes:
+            btn.hide()
+        self.btn_voltar.show()
+
+    # --------------------------- auxiliares ---------------------------
+    def habilitar_opcoes(self, habilitar):
+        for btn in self.botoes:
+            btn.setEnabled(habilitar)
+
+    def atualizar_vidas(self):
+        self.label_vidas.setText(f"Vidas: {'❤️' * max(self.jogo.vidas, 0)}")
+
+    def mostrar_feedback(self, texto, estado=None):
+        self.label_feedback.setText(texto)
+        definir_estado(self.label_feedback, estado)
+
+    def acrescentar_feedback(self, texto, estado=None):
+        """Adiciona uma linha ao feedback da resposta atual (estado None mantém a cor)"""
+        atual = self.label_feedback.text()
+        self.label_feedback.setText(f"{atual}\n{texto}" if atual else texto)
+        if estado:
+            definir_estado(self.label_feedback, estado)
+
+
+def _avisar_respostas_pendentes(gravadas):
+    # Sem referência à tela: ela pode já ter sido destruída quando a gravação terminar
+    if not gravadas:
+        print("⚠️ Algumas respostas do quiz ainda não foram gravadas (ver estatísticas do gravador)")
+
+
+if __name__ == "__main__":
+    import sys
+    from PyQt6.QtWidgets import QApplication
+    from front.tema import aplicar_tema
+
+    app = QApplication(sys.argv)
+    aplicar_tema(app)
+
+    # Ato II (Classe 4) - Fase Média (Dificuldade 2)
+    tela = TelaQuiz(nivel="2-4", ao_terminar=lambda venceu: app.quit())
+    tela.resize(1000, 700)
+    tela.show()
+    tela.iniciar()
+    sys.exit(app.exec())
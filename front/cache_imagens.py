@@ -0,0 +1,143 @@
+import os
+import sys
+import hashlib
+import threading
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtCore import Qt
+
+RAIZ_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_CACHE = os.path.join(RAIZ_PROJETO, "assets", ".cache", "escaladas")
+
+MANTER = Qt.AspectRatioMode.KeepAspectRatio
+IGNORAR = Qt.AspectRatioMode.IgnoreAspectRatio
+SUAVE = Qt.TransformationMode.SmoothTransformation
+RAPIDA = Qt.TransformationMode.FastTransformation
+
+# Imagens escaladas usadas pelas telas: (caminho, largura, altura, aspecto, transformação).
+# altura None equivale a scaledToWidth. As telas passam estas tuplas para
+# carregar_pixmap(*ASSET); o cache pré-gerado (ASSETS_ESCALADOS) usa as mesmas.
+
+# Login_screen.TelaLogin
+ICONE_EMAIL = ("assets/ScreenElements/icons/mail_vector.png", 24, 24, MANTER, RAPIDA)
+ICONE_SENHA = ("assets/ScreenElements/icons/password_vector.png", 24, 24, MANTER, RAPIDA)
+DECORACAO_VIOLA = ("assets/ScreenElements/Viola-com-chita.png", 900, 2000, MANTER, SUAVE)
+DECORACAO_CHITA_2 = ("assets/ScreenElements/organic-chita-2.png", 600, 350, MANTER, SUAVE)
+DECORACAO_CHITA = ("assets/ScreenElements/organic-chita.png", 400, 550, MANTER, SUAVE)
+DECORACAO_DANCA = ("assets/ScreenElements/dance-chita.png", 900, 2000, MANTER, SUAVE)
+LOGO_LOGIN = ("assets/ScreenElements/MT-bandeira-logo.png", 250, None, MANTER, SUAVE)
+# Login_screen.TelaCadastro
+LOGO_CADASTRO = ("assets/ScreenElements/MT-bandeira-logo.png", 160, 80, MANTER, RAPIDA)
+# game_screen.GameScreen
+LOGO_JOGO = ("assets/ScreenElements/gamescreen/logo-temp.png", 250, None, MANTER, SUAVE)
+ICONE_RUNA = ("assets/ScreenElements/icons/runa.png", 36, 36, MANTER, SUAVE)
+# class_register_screen.ClassRegisterDialog
+LOGO_CADASTRO_TURMA = ("assets/ScreenElements/gamescreen/logo-temp.png", 130, None, MANTER, SUAVE)
+# GameScreen/prologo.py (o mapa usa a pirâmide de tiles de front/mapa.py)
+CAPIVARA_GUIA = ("assets/ScreenElements/gamescreen/NPCs/capivara-guia.png", 180, 200, MANTER, SUAVE)
+
+ASSETS_ESCALADOS = [
+    ICONE_EMAIL, ICONE_SENHA,
+    DECORACAO_VIOLA, DECORACAO_CHITA_2, DECORACAO_CHITA, DECORACAO_DANCA,
+    LOGO_LOGIN, LOGO_CADASTRO, LOGO_JOGO, ICONE_RUNA, LOGO_CADASTRO_TURMA, CAPIVARA_GUIA,
+]
+
+
+def _caminho_absoluto(caminho):
+    return caminho if os.path.isabs(caminho) else os.path.join(RAIZ_PROJETO, caminho)
+
+def chave_cache(caminho, largura, altura=None, aspecto=MANTER, transformacao=SUAVE):
+    """
+    Nome do arquivo em cache para a imagem escalada.
+
+    A chave inclui o mtime e o tamanho do original, então editar o PNG
+    gera uma nova entrada em vez de reaproveitar uma versão desatualizada.
+
+    Returns:
+        str: nome do arquivo, ou None se o original não existir
+    """
+    try:
+        info = os.stat(_caminho_absoluto(caminho))
+    except OSError:
+        return None
+    relativo = os.path.relpath(_caminho_absoluto(caminho), RAIZ_PROJETO).replace(os.sep, "/")
+    tamanho = f"{largura}x{altura or 0}"
+    assinatura = f"{relativo}|{info.st_mtime_ns}|{info.st_size}|{tamanho}|{aspecto.name}|{transformacao.name}"
+    resumo = hashlib.blake2b(assinatura.encode("utf-8"), digest_size=8).hexdigest()
+    nome = os.path.splitext(os.path.basename(relativo))[0]
+    return f"{nome}-{tamanho}-{resumo}.png"
+
+def imagem_escalada(caminho, largura, altura=None, aspecto=MANTER, transformacao=SUAVE):
+    """
+    Retorna a QImage já escalada, lendo do cache em disco quando possível.
+    Na primeira vez o original é decodificado, escalado e gravado no cache.
+
+    Returns:
+        QImage: imagem escalada (nula se o original não existir)
+    """
+    nome = chave_cache(caminho, largura, altura, aspecto, transformacao)
+    if nome is None:
+        return QImage()
+
+    destino = os.path.join(PASTA_CACHE, nome)
+    if os.path.exists(destino):
+        imagem = QImage(destino)
+        if not imagem.isNull():
+            return imagem
+
+    original = QImage(_caminho_absoluto(caminho))
+    if original.isNull():
+        return original
+    if altura is None:
+        imagem = original.scaledToWidth(largura, transformacao)
+    else:
+        imagem = original.scaled(largura, altura, aspecto, transformacao)
+    del original  # libera o original decodificado antes de gravar
+
+    try:
+        os.makedirs(PASTA_CACHE, exist_ok=True)
+        temporario = f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp"
+        if imagem.save(temporario, "PNG"):
+            os.replace(temporario, destino)
+    except OSError as e:
+        print(f"⚠️ Não foi possível gravar {nome} no cache de imagens: {e}")
+    return imagem
+
+def pixmap_escalado(caminho, largura, altura=None, aspecto=MANTER, transformacao=SUAVE):
+    """Equivalente a QPixmap(caminho).scaled(...) ou .scaledToWidth(...), usando o cache em disco"""
+    imagem = imagem_escalada(caminho, largura, altura, aspecto, transformacao)
+    if imagem.isNull():
+        return QPixmap()
+    return QPixmap.fromImage(imagem)
+
+def construir_cache():
+    """
+    Gera todas as entradas de ASSETS_ESCALADOS e remove as desatualizadas.
+
+    Returns:
+        tuple: (geradas: int, removidas: int)
+    """
+    validos = set()
+    geradas = 0
+    for caminho, largura, altura, aspecto, transformacao in ASSETS_ESCALADOS:
+        nome = chave_cache(caminho, largura, altura, aspecto, transformacao)
+        if nome is None:
+            print(f"⚠️ Imagem não encontrada: {caminho}")
+            continue
+        validos.add(nome)
+        if not os.path.exists(os.path.join(PASTA_CACHE, nome)):
+            if not imagem_escalada(caminho, largura, altura, aspecto, transformacao).isNull():
+                geradas += 1
+
+    removidas = 0
+    if os.path.isdir(PASTA_CACHE):
+        for nome in os.listdir(PASTA_CACHE):
+            if nome not in validos:
+                os.remove(os.path.join(PASTA_CACHE, nome))
+                removidas += 1
+    return geradas, removidas
+
+
+if __name__ == "__main__":
+    geradas, removidas = construir_cache()
+    print(f"✅ Cache de imagens em {PASTA_CACHE}: {geradas} geradas, {removidas} removidas")
+    sys.exit(0)
@@ -0,0 +1,134 @@
+import os
+import time
+from PyQt6.QtGui import QFont, QFontDatabase
+
+# Fontes do jogo: chave -> arquivo
+FONTES_JOGO = {
+    "titulo": "assets/fonts/Ghost theory 2.ttf",                # Para título do jogo
+    "narração": "assets/fonts/White Storm.otf",                 # Para texto de narração
+    "botoes": "assets/fonts/firstorder.ttf",                    # Para texto dos botões
+    "dialogo": "assets/fonts/Elementary_Gothic_Bookhand.ttf",   # Para diálogos de personagens
+}
+
+
+class FontManager:
+    """
+    Registro das fontes da aplicação.
+
+    Cada arquivo é registrado no QFontDatabase uma única vez por processo e
+    os QFont são memorizados por (chave, tamanho, negrito, itálico). Os QFont
+    retornados são compartilhados: use QFont(fonte) antes de alterá-los.
+    """
+
+    def __init__(self, debug_mode=False):
+        self.loaded_fonts = {}   # chave -> família
+        self._familias = {}      # caminho absoluto -> família
+        self._fontes = {}        # (chave, tamanho, negrito, itálico) -> QFont
+        self.debug_mode = debug_mode
+        self.tempo_carregamento_ms = 0.0
+
+    def load_font(self, font_path: str, font_name: str = None) -> str:
+        """
+        Args:
+            font_path: assets/fonts/White Storm.otf)
+            font_name: FonteJogo
+
+        Returns:
+            Nome da família da fonte carregada
+        """
+        key = font_name if font_name else os.path.basename(font_path)
+        caminho = os.path.abspath(font_path)
+
+        font_family = self._familias.get(caminho)
+        if font_family is None:
+            inicio = time.perf_counter()
+            font_family = self._registrar(caminho)
+            self.tempo_carregamento_ms += (time.perf_counter() - inicio) * 1000
+            if font_family is None:
+                return "Arial"
+            self._familias[caminho] = font_family
+
+        self.loaded_fonts[key] = font_family
+        if self.debug_mode:
+            print(f"✅ Fonte {key}: {font_family} ({font_path})")
+        return font_family
+
+    def _registrar(self, caminho):
+        if not os.path.exists(caminho):
+            print(f"❌ ERRO: Fonte não encontrada em {caminho}")
+            return None
+
+        font_id = QFontDatabase.addApplicationFont(caminho)
+        if font_id == -1:
+            print(f"❌ ERRO: Não foi possível carregar a fonte {caminho}")
+            return None
+
+        font_families = QFontDatabase.applicationFontFamilies(font_id)
+        if not font_families:
+            print(f"❌ ERRO: Nenhuma família de fonte encontrada em {caminho}")
+            return None
+        return font_families[0]
+
+    def load_fonts(self, fontes=FONTES_JOGO):
+        """Registra as fontes informadas (chave -> caminho) e informa o tempo gasto"""
+        for font_name, font_path in fontes.items():
+            self.load_font(font_path, font_name)
+        print(f"🔤 {len(self._familias)} fontes registradas em {self.tempo_carregamento_ms:.1f} ms")
+
+    def family(self, font_key: str, fallback: str = "Arial") -> str:
+        """Nome da família registrada para a chave (útil em folhas de estilo)"""
+        return self.loaded_fonts.get(font_key, fallback)
+
+    def get_font(self, font_key: str, size: int = 12, bold: bool = False, italic: bool = False) -> QFont:
+        """
+        Args:
+            font_key: FontJogo
+            size: Tamanho da fonte
+            bold: Se a fonte deve ser negrito
+            italic: Se a fonte deve ser itálica
+
+        Returns:
+            Objeto QFont configurado
+        """
+        chave = (font_key, size, bold, italic)
+        font = self._fontes.get(chave)
+        if font is not None:
+            return font
+
+        if font_key in self.loaded_fonts:
+            font_family = self.loaded_fonts[font_key]
+        else:
+            print(f"❌ Fonte {font_key} não encontrada, usando Arial")
+            font_family = "Arial"
+
+        font = QFont(font_family, size)
+        font.setBold(bold)
+        font.setItalic(italic)
+        self._fontes[chave] = font
+
+        if self.debug_mode:
+            print(f"🎨 Fonte criada: {font.family()}, {font.pointSize()}px (exata: {font.exactMatch()})")
+        return font
+
+    def list_system_fonts(self):
+        if self.debug_mode:
+            families = QFontDatabase.families()
+            print(f"📚 Fontes do sistema ({len(families)} disponíveis):")
+            for i, family in enumerate(families[:10]):  # Mostrar apenas as 10 primeiras
+                print(f"   {i+1}. {family}")
+            if len(families) > 10:
+                print(f"   ... e mais {len(families) - 10} fontes")
+
+
+_font_manager = None
+
+def obter_font_manager():
+    """
+    Retorna o FontManager da aplicação, registrando FONTES_JOGO na primeira chamada.
+    Requer uma QApplication já criada.
+    """
+    global _font_manager
+    if _font_manager is None:
+        _font_manager = FontManager()
+        _font_manager.load_fonts()
+    return _font_manager
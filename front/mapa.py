@@ -0,0 +1,384 @@
+import os
+import sys
+import shutil
+import threading
+from collections import defaultdict
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtGui import QImage, QPainter, QColor, QPen, QLinearGradient, QBrush
+from PyQt6.QtCore import Qt, QRect, QRectF, QPointF, pyqtSignal
+from front.cache_imagens import chave_cache, IGNORAR, SUAVE, RAIZ_PROJETO
+from front.servico_assets import carregar_pixmap, obter_servico_assets
+
+PASTA_TILES = os.path.join(RAIZ_PROJETO, "assets", ".cache", "tiles")
+TAMANHO_TILE = 256
+MARCA_COMPLETO = "completo"
+
+
+class PiramideTiles:
+    """
+    Pirâmide de tiles pré-escalados de uma imagem grande.
+
+    Cada nível é a imagem escalada para (largura_base, altura_base) * escala,
+    cortada em tiles de TAMANHO_TILE gravados em assets/.cache/tiles. O nível
+    é gerado uma única vez por versão do original (mesma chave do cache de
+    imagens); depois disso só os tiles visíveis são decodificados, via
+    ServicoAssets.
+    """
+
+    def __init__(self, caminho, largura_base, altura_base, escalas=(1.0, 1.5)):
+        self.caminho = caminho
+        self.largura_base = largura_base
+        self.altura_base = altura_base
+        self.escalas = tuple(sorted(escalas))
+        self._lock = threading.Lock()
+        self._prontos = set()
+
+    def tamanho(self, nivel):
+        escala = self.escalas[nivel]
+        return round(self.largura_base * escala), round(self.altura_base * escala)
+
+    def pasta(self, nivel):
+        """Pasta dos tiles do nível, ou None se o original não existir"""
+        largura, altura = self.tamanho(nivel)
+        nome = chave_cache(self.caminho, largura, altura, IGNORAR, SUAVE)
+        if nome is None:
+            return None
+        return os.path.join(PASTA_TILES, os.path.splitext(nome)[0])
+
+    def nivel_para(self, zoom):
+        """Menor nível com resolução suficiente para o zoom (ou o maior disponível)"""
+        for nivel, escala in enumerate(self.escalas):
+            if escala >= zoom:
+                return nivel
+        return len(self.escalas) - 1
+
+    def preparar(self, nivel):
+        """
+        Garante que os tiles do nível existam em disco, gerando-os se preciso.
+
+        Returns:
+            bool: True se o nível está disponível
+        """
+        if nivel in self._prontos:
+            return True
+        with self._lock:
+            pasta = self.pasta(nivel)
+            if pasta is None:
+                return False
+            if not os.path.exists(os.path.join(pasta, MARCA_COMPLETO)):
+                if not self._gerar(nivel, pasta):
+                    return False
+            self._prontos.add(nivel)
+            return True
+
+    def _gerar(self, nivel, pasta):
+        original = QImage(os.path.join(RAIZ_PROJETO, self.caminho))
+        if original.isNull():
+            print(f"❌ Não foi possível decodificar {self.caminho}")
+            return False
+        largura, altura = self.tamanho(nivel)
+        imagem = original.scaled(largura, altura, IGNORAR, SUAVE)
+        del original
+
+        try:
+            os.makedirs(pasta, exist_ok=True)
+            for ty in range(0, altura, TAMANHO_TILE):
+                for tx in range(0, largura, TAMANHO_TILE):
+                    tile = imagem.copy(tx, ty, min(TAMANHO_TILE, largura - tx), min(TAMANHO_TILE, altura - ty))
+                    destino = os.path.join(pasta, f"{tx // TAMANHO_TILE}_{ty // TAMANHO_TILE}.png")
+                    temporario = f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp"
+                    if tile.save(temporario, "PNG"):
+                        os.replace(temporario, destino)
+            # A marca só é gravada depois de todos os tiles
+            open(os.path.join(pasta, MARCA_COMPLETO), "w").close()
+        except OSError as e:
+            print(f"⚠️ Não foi possível gravar os tiles de {self.caminho}: {e}")
+            return False
+        return True
+
+    def tiles(self, nivel, area):
+        """
+        Tiles do nível que cobrem a área (em pixels do nível).
+
+        Returns:
+            list: tuplas (tx, ty, caminho)
+        """
+        largura, altura = self.tamanho(nivel)
+        area = area.intersected(QRect(0, 0, largura, altura))
+        if area.isEmpty():
+            return []
+        pasta = self.pasta(nivel)
+        return [
+            (tx, ty, os.path.join(pasta, f"{tx}_{ty}.png"))
+            for ty in range(area.top() // TAMANHO_TILE, area.bottom() // TAMANHO_TILE + 1)
+            for tx in range(area.left() // TAMANHO_TILE, area.right() // TAMANHO_TILE + 1)
+        ]
+
+    def pre_carregar(self, nivel=0):
+        """
+        Em segundo plano, gera o nível (se preciso) e decodifica seus tiles;
+        os demais níveis só são gerados em disco, para o zoom não travar a interface.
+        """
+        def executar():
+            if self.preparar(nivel):
+                largura, altura = self.tamanho(nivel)
+                itens = [caminho for _, _, caminho in self.tiles(nivel, QRect(0, 0, largura, altura))]
+                obter_servico_assets().pre_carregar(itens)
+            for outro in range(len(self.escalas)):
+                self.preparar(outro)
+        threading.Thread(target=executar, name="PiramideTiles", daemon=True).start()
+
+
+class IndiceEspacial:
+    """
+    Grade uniforme de pontos para consultas por área.
+
+    Cada ponto fica na célula (x // celula, y // celula); uma consulta só
+    percorre as células que a área cobre, então o custo depende de quantos
+    pontos estão perto, não do total de pontos no mapa.
+    """
+
+    def __init__(self, celula=64):
+        self.celula = celula
+        self._celulas = defaultdict(list)
+        self.total = 0
+
+    def inserir(self, x, y, dado):
+        self._celulas[(int(x // self.celula), int(y // self.celula))].append((x, y, dado))
+        self.total += 1
+
+    def consultar(self, x, y, largura, altura):
+        """
+        Returns:
+            list: tuplas (x, y, dado) dos pontos dentro do retângulo
+        """
+        c = self.celula
+        encontrados = []
+        for cy in range(int(y // c), int((y + altura) // c) + 1):
+            for cx in range(int(x // c), int((x + largura) // c) + 1):
+                for ponto in self._celulas.get((cx, cy), ()):
+                    if x <= ponto[0] <= x + largura and y <= ponto[1] <= y + altura:
+                        encontrados.append(ponto)
+        return encontrados
+
+
+class MapaWidget(QWidget):
+    """
+    Mapa desenhado em uma única passada de pintura.
+
+    Só os tiles da área exposta são desenhados (e decodificados), e os locais
+    vêm do IndiceEspacial, tanto para pintar quanto para clique e hover.
+    Roda do mouse aproxima até a maior escala da pirâmide; arrastar move o mapa.
+    """
+
+    local_clicado = pyqtSignal(str, int)
+
+    RAIO = 20       # raio do marcador, em pixels da tela
+    BORDA = 10
+
+    def __init__(self, piramide, locais, fonte=None, parent=None):
+        """
+        Args:
+            piramide: PiramideTiles do fundo
+            locais: dicts com "name", "level", "x", "y" (canto do marcador no mapa base)
+            fonte: QFont dos números dos marcadores
+        """
+        super().__init__(parent)
+        self.piramide = piramide
+        self.fonte = fonte
+        self.zoom = 1.0
+        self.zoom_maximo = max(1.0, piramide.escalas[-1])
+        self.deslocamento = QPointF(0, 0)
+        self.destacado = None
+        self._arrasto = None
+        self.setMouseTracking(True)
+
+        self.indice = IndiceEspacial()
+        for local in locais:
+            self.indice.inserir(local["x"] + self.RAIO, local["y"] + self.RAIO, local)
+
+    # ---------------------------- coordenadas ----------------------------
+    def _na_tela(self, x, y):
+        return QPointF(x * self.zoom - self.deslocamento.x(), y * self.zoom - self.deslocamento.y())
+
+    def _no_mapa(self, ponto):
+        return ((ponto.x() + self.deslocamento.x()) / self.zoom,
+                (ponto.y() + self.deslocamento.y()) / self.zoom)
+
+    def _retangulo_marcador(self, x, y):
+        centro = self._na_tela(x, y)
+        r = self.RAIO + 2
+        return QRect(int(centro.x() - r), int(centro.y() - r), 2 * r + 1, 2 * r + 1)
+
+    def local_em(self, ponto):
+        """Local sob o ponto da tela, ou None"""
+        mx, my = self._no_mapa(ponto)
+        r = self.RAIO / self.zoom
+        melhor = None
+        for x, y, local in self.indice.consultar(mx - r, my - r, 2 * r, 2 * r):
+            if (x - mx) ** 2 + (y - my) ** 2 <= r * r:
+                melhor = (x, y, local)
+        return melhor
+
+    def _limitar_deslocamento(self):
+        maximo_x = max(0.0, self.piramide.largura_base * self.zoom - self.width())
+        maximo_y = max(0.0, self.piramide.altura_base * self.zoom - self.height())
+        self.deslocamento = QPointF(min(max(self.deslocamento.x(), 0.0), maximo_x),
+                                    min(max(self.deslocamento.y(), 0.0), maximo_y))
+
+    # ------------------------------ pintura ------------------------------
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        exposto = event.rect()
+
+        if not self._pintar_tiles(painter, exposto):
+            gradiente = QLinearGradient(0, 0, self.width(), self.height())
+            for posicao, cor in ((0, "#4A7C8B"), (0.3, "#5A8C6B"), (0.7, "#6A9C5B"), (1, "#7AAC4B")):
+                gradiente.setColorAt(posicao, QColor(cor))
+            painter.fillRect(exposto, QBrush(gradiente))
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._pintar_locais(painter, exposto)
+
+        painter.setPen(QPen(QColor("#8B4513"), self.BORDA))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        metade = self.BORDA / 2
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(metade, metade, -metade, -metade), 15, 15)
+        painter.end()
+
+    def _pintar_tiles(self, painter, exposto):
+        nivel = self.piramide.nivel_para(self.zoom)
+        if not self.piramide.preparar(nivel):
+            return False
+
+        # Pixels do nível por pixel da tela
+        fator = self.piramide.escalas[nivel] / self.zoom
+        area = QRect(
+            int((exposto.left() + self.deslocamento.x()) * fator),
+            int((exposto.top() + self.deslocamento.y()) * fator),
+            int(exposto.width() * fator) + 2,
+            int(exposto.height() * fator) + 2,
+        )
+        if fator != 1.0:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        for tx, ty, caminho in self.piramide.tiles(nivel, area):
+            pixmap = carregar_pixmap(caminho)
+            if pixmap.isNull():
+                continue
+            # Bordas arredondadas em inteiros compartilhados, para não abrir frestas entre tiles
+            x0 = round(tx * TAMANHO_TILE / fator - self.deslocamento.x())
+            y0 = round(ty * TAMANHO_TILE / fator - self.deslocamento.y())
+            x1 = round((tx * TAMANHO_TILE + pixmap.width()) / fator - self.deslocamento.x())
+            y1 = round((ty * TAMANHO_TILE + pixmap.height()) / fator - self.deslocamento.y())
+            painter.drawPixmap(QRect(x0, y0, x1 - x0, y1 - y0), pixmap)
+        return True
+
+    def _pintar_locais(self, painter, exposto):
+        mx, my = self._no_mapa(exposto.topLeft())
+        margem = (self.RAIO + 2) / self.zoom
+        visiveis = self.indice.consultar(mx - margem, my - margem,
+                                         exposto.width() / self.zoom + 2 * margem,
+                                         exposto.height() / self.zoom + 2 * margem)
+        if not visiveis:
+            return
+
+        if self.fonte is not None:
+            painter.setFont(self.fonte)
+        for x, y, local in visiveis:
+            centro = self._na_tela(x, y)
+            destacado = self.destacado is not None and self.destacado[2] is local
+            gradiente = QLinearGradient(0, centro.y() - self.RAIO, 0, centro.y() + self.RAIO)
+            gradiente.setColorAt(0, QColor("#FFFF00" if destacado else "#FFD700"))
+            gradiente.setColorAt(1, QColor("#FFD700" if destacado else "#FFA500"))
+            painter.setBrush(QBrush(gradiente))
+            painter.setPen(QPen(QColor("#8B4513"), 3))
+            painter.drawEllipse(centro, self.RAIO - 1.5, self.RAIO - 1.5)
+            painter.drawText(self._retangulo_marcador(x, y), Qt.AlignmentFlag.AlignCenter, str(local["level"]))
+
+    # ------------------------------- mouse -------------------------------
+    def mouseMoveEvent(self, event):
+        ponto = event.position()
+        if self._arrasto is not None:
+            self.deslocamento = self._arrasto - ponto
+            self._limitar_deslocamento()
+            self.update()
+            return
+
+        encontrado = self.local_em(ponto)
+        anterior = self.destacado
+        if (encontrado and encontrado[2]) is (anterior and anterior[2]):
+            return
+        self.destacado = encontrado
+        for item in (anterior, encontrado):
+            if item is not None:
+                self.update(self._retangulo_marcador(item[0], item[1]))
+        if encontrado:
+            self.setCursor(Qt.CursorShape.PointingHandCursor)
+        else:
+            self.unsetCursor()
+
+    def mousePressEvent(self, event):
+        if event.button() != Qt.MouseButton.LeftButton:
+            return super().mousePressEvent(event)
+        encontrado = self.local_em(event.position())
+        if encontrado:
+            local = encontrado[2]
+            self.local_clicado.emit(local["name"], local["level"])
+        elif self.zoom > 1.0:
+            self._arrasto = event.position() + self.deslocamento
+
+    def mouseReleaseEvent(self, event):
+        self._arrasto = None
+
+    def wheelEvent(self, event):
+        passos = event.angleDelta().y() / 120
+        zoom = min(max(self.zoom * (1.25 ** passos), 1.0), self.zoom_maximo)
+        if zoom == self.zoom:
+            return
+        # Mantém fixo o ponto do mapa sob o cursor
+        ponto = event.position()
+        mx, my = self._no_mapa(ponto)
+        self.zoom = zoom
+        self.deslocamento = QPointF(mx * zoom - ponto.x(), my * zoom - ponto.y())
+        self._limitar_deslocamento()
+        self.destacado = None
+        self.update()
+
+
+def construir_tiles(piramides):
+    """
+    Gera todos os níveis das pirâmides e remove pastas de tiles desatualizadas.
+
+    Returns:
+        tuple: (niveis_gerados: int, pastas_removidas: int)
+    """
+    validas = set()
+    gerados = 0
+    for piramide in piramides:
+        for nivel in range(len(piramide.escalas)):
+            pasta = piramide.pasta(nivel)
+            if pasta is None:
+                print(f"⚠️ Imagem não encontrada: {piramide.caminho}")
+                break
+            validas.add(os.path.basename(pasta))
+            existia = os.path.exists(os.path.join(pasta, MARCA_COMPLETO))
+            if piramide.preparar(nivel) and not existia:
+                gerados += 1
+
+    removidas = 0
+    if os.path.isdir(PASTA_TILES):
+        for nome in os.listdir(PASTA_TILES):
+            if nome not in validas:
+                shutil.rmtree(os.path.join(PASTA_TILES, nome), ignore_errors=True)
+                removidas += 1
+    return gerados, removidas
+
+
+# Mapa principal (front/Screens/GameScreen/prologo.py, MapScreen)
+MAPA_PRINCIPAL = PiramideTiles("assets/ScreenElements/gamescreen/Map/game-map-3.png", 1000, 700)
+
+
+if __name__ == "__main__":
+    gerados, removidas = construir_tiles([MAPA_PRINCIPAL])
+    print(f"✅ Tiles em {PASTA_TILES}: {gerados} níveis gerados, {removidas} pastas removidas")
+    sys.exit(0)
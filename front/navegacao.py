@@ -0,0 +1,138 @@
+import time
+from collections import OrderedDict
+from PyQt6.QtCore import QTimer
+
+
+class Navegador:
+    """
+    Controla a troca entre as janelas principais do jogo.
+
+    As telas são construídas uma única vez e mantidas vivas (escondidas) em
+    uma pilha LRU de até `max_telas`; navegar apenas mostra a tela destino e
+    esconde a atual. Depois de cada transição, a próxima tela provável é
+    construída no loop ocioso, e a latência (até o próximo ciclo do loop de
+    eventos, após a pintura) fica registrada em `latencias`.
+
+    Telas podem definir ao_exibir(contexto) para receber o contexto da
+    navegação (id_usuario, id_turma, ...) sempre que forem exibidas.
+    """
+
+    def __init__(self, max_telas=4):
+        self.max_telas = max_telas
+        self._fabricas = {}        # nome -> fabrica(navegador) -> janela
+        self._proximas = {}        # nome -> próxima tela provável
+        self._telas = OrderedDict()
+        self.contexto = {}
+        self.atual = None
+        self.latencias = []        # (origem, destino, ms, construida_agora)
+
+    def registrar(self, nome, fabrica, proxima=None):
+        self._fabricas[nome] = fabrica
+        self._proximas[nome] = proxima
+
+    def tela(self, nome):
+        """Retorna a janela da tela, construindo-a se ainda não existir"""
+        janela = self._telas.get(nome)
+        if janela is None:
+            janela = self._fabricas[nome](self)
+            self._telas[nome] = janela
+            self._limitar()
+        self._telas.move_to_end(nome)
+        return janela
+
+    def _limitar(self):
+        while len(self._telas) > self.max_telas:
+            nome = next((n for n in self._telas if n != self.atual), None)
+            if nome is None:
+                return
+            self.descartar(nome)
+
+    def descartar(self, nome):
+        """Destroi a tela; ela será reconstruída na próxima navegação"""
+        janela = self._telas.pop(nome, None)
+        if janela is not None:
+            janela.hide()
+            janela.deleteLater()
+
+    def ir_para(self, nome, **contexto):
+        """
+        Mostra a tela `nome` e esconde a atual.
+
+        Returns:
+            A janela exibida
+        """
+        inicio = time.perf_counter()
+        construida_agora = nome not in self._telas
+        self.contexto.update(contexto)
+
+        destino = self.tela(nome)
+        origem = self._telas.get(self.atual) if self.atual != nome else None
+
+        if origem is not None:
+            # Mantém a janela no mesmo lugar da anterior
+            geometria = destino.frameGeometry()
+            geometria.moveCenter(origem.frameGeometry().center())
+            destino.move(geometria.topLeft())
+
+        if hasattr(destino, 'ao_exibir'):
+            destino.ao_exibir(self.contexto)
+        destino.show()
+        destino.raise_()
+        destino.activateWindow()
+        if origem is not None:
+            origem.hide()
+
+        anterior, self.atual = self.atual, nome
+        QTimer.singleShot(0, lambda: self._transicao_concluida(anterior, nome, inicio, construida_agora))
+        return destino
+
+    def _transicao_concluida(self, origem, destino, inicio, construida_agora):
+        ms = (time.perf_counter() - inicio) * 1000
+        self.latencias.append((origem, destino, ms, construida_agora))
+        QTimer.singleShot(0, lambda: self.pre_construir(self._proximas.get(destino)))
+
+    def pre_construir(self, nome):
+        """Constrói a tela (escondida) para que a próxima navegação seja imediata"""
+        if nome and nome not in self._telas and nome in self._fabricas:
+            self.tela(nome)
+            # A tela atual continua sendo a mais recente na pilha
+            if self.atual in self._telas:
+                self._telas.move_to_end(self.atual)
+
+    def relatorio(self):
+        if not self.latencias:
+            return "Navegação: nenhuma transição"
+        linhas = ["Navegação (ms até o próximo ciclo após exibir):"]
+        for origem, destino, ms, construida_agora in self.latencias:
+            estado = "construída" if construida_agora else "pronta"
+            linhas.append(f"  {origem or '-'} -> {destino}: {ms:.1f} ms ({estado})")
+        prontas = [ms for _, _, ms, construida in self.latencias if not construida]
+        if prontas:
+            linhas.append(f"  telas prontas: média {sum(prontas) / len(prontas):.1f} ms, máx {max(prontas):.1f} ms")
+        return "\n".join(linhas)
+
+
+def _criar_login(navegador):
+    from front.Screens.Login_screen import TelaLogin
+    return TelaLogin()
+
+def _criar_jogo(navegador):
+    from front.Screens.game_screen import GameScreen
+    return GameScreen(tela_login=navegador.tela("login"), id_usuario=navegador.contexto.get("id_usuario"))
+
+def _criar_aventura(navegador):
+    from front.Screens.GameScreen.prologo import GameManager
+    return GameManager(id_usuario=navegador.contexto.get("id_usuario"))
+
+
+_navegador = None
+
+def obter_navegador():
+    """Retorna o Navegador da aplicação com as telas principais já registradas"""
+    global _navegador
+    if _navegador is None:
+        _navegador = Navegador()
+        _navegador.registrar("login", _criar_login, proxima="jogo")
+        _navegador.registrar("jogo", _criar_jogo, proxima="aventura")
+        _navegador.registrar("aventura", _criar_aventura, proxima="jogo")
+    return _navegador
@@ -0,0 +1,152 @@
+import queue
+import threading
+from collections import OrderedDict
+from PyQt6.QtGui import QImage, QPixmap, QPixmapCache
+from front.cache_imagens import imagem_escalada, MANTER, SUAVE
+
+
+class ServicoAssets:
+    """
+    Cache de pixmaps compartilhado por todas as telas.
+
+    Usa o QPixmapCache do Qt (LRU limitado em bytes), então cada imagem é
+    decodificada uma única vez por sessão enquanto couber no orçamento.
+    As imagens de pre_carregar são decodificadas em uma thread de segundo
+    plano e só viram QPixmap na thread da interface, no primeiro pixmap().
+    Enquanto esperam, elas ocupam uma fração (FRACAO_PRONTAS) do mesmo
+    limite_kb; as mais antigas são descartadas quando essa fração estoura.
+    """
+
+    FRACAO_PRONTAS = 4  # 1/4 do orçamento para imagens pré-carregadas
+
+    def __init__(self, limite_kb=96 * 1024):
+        self.limite_kb = limite_kb
+        self._limite_prontas = limite_kb * 1024 // self.FRACAO_PRONTAS
+        QPixmapCache.setCacheLimit(limite_kb - self._limite_prontas // 1024)
+        self.estatisticas = {
+            'acertos': 0,
+            'falhas': 0,
+            'despejos': 0,
+            'pre_carregadas': 0,
+        }
+        self._inseridas = set()  # chaves já colocadas no QPixmapCache
+        self._prontas = OrderedDict()  # chave -> QImage decodificada em segundo plano
+        self._bytes_prontas = 0
+        self._lock = threading.Lock()
+        self._fila = None
+        self._thread = None
+
+    @staticmethod
+    def _chave(caminho, largura, altura, aspecto, transformacao):
+        if largura is None:
+            return caminho
+        return f"{caminho}|{largura}x{altura or 0}|{aspecto.name}|{transformacao.name}"
+
+    @staticmethod
+    def _decodificar(caminho, largura, altura, aspecto, transformacao):
+        if largura is None:
+            return QImage(caminho)
+        # Imagens escaladas passam pelo cache em disco (front/cache_imagens.py)
+        return imagem_escalada(caminho, largura, altura, aspecto, transformacao)
+
+    def pixmap(self, caminho, largura=None, altura=None, aspecto=MANTER, transformacao=SUAVE):
+        """
+        Retorna o QPixmap da imagem, no tamanho original (largura None) ou escalada.
+        Deve ser chamado na thread da interface.
+
+        Returns:
+            QPixmap: pixmap (nulo se a imagem não existir)
+        """
+        chave = self._chave(caminho, largura, altura, aspecto, transformacao)
+        pixmap = QPixmapCache.find(chave)
+        if pixmap is not None and not pixmap.isNull():
+            self.estatisticas['acertos'] += 1
+            return pixmap
+
+        self.estatisticas['falhas'] += 1
+        if chave in self._inseridas:
+            # Já esteve no cache: o LRU a descartou para respeitar o limite
+            self.estatisticas['despejos'] += 1
+
+        with self._lock:
+            imagem = self._prontas.pop(chave, None)
+            if imagem is not None:
+                self._bytes_prontas -= imagem.sizeInBytes()
+        if imagem is None:
+            imagem = self._decodificar(caminho, largura, altura, aspecto, transformacao)
+        if imagem.isNull():
+            return QPixmap()
+
+        pixmap = QPixmap.fromImage(imagem)
+        if QPixmapCache.insert(chave, pixmap):
+            self._inseridas.add(chave)
+        return pixmap
+
+    def pre_carregar(self, itens):
+        """
+        Decodifica imagens em segundo plano para que o próximo pixmap() seja imediato.
+
+        Args:
+            itens: caminhos ou tuplas (caminho, largura, altura[, aspecto, transformação])
+        """
+        if self._thread is None:
+            self._fila = queue.Queue()
+            self._thread = threading.Thread(target=self._executar, name="ServicoAssets", daemon=True)
+            self._thread.start()
+        for item in itens:
+            if isinstance(item, str):
+                item = (item, None, None)
+            caminho, largura, altura, *modos = item
+            aspecto, transformacao = (modos + [MANTER, SUAVE][len(modos):])[:2]
+            self._fila.put((caminho, largura, altura, aspecto, transformacao))
+
+    def _executar(self):
+        while True:
+            caminho, largura, altura, aspecto, transformacao = self._fila.get()
+            chave = self._chave(caminho, largura, altura, aspecto, transformacao)
+            with self._lock:
+                if chave in self._prontas:
+                    continue
+            imagem = self._decodificar(caminho, largura, altura, aspecto, transformacao)
+            if imagem.isNull():
+                print(f"⚠️ Imagem não encontrada para pré-carregar: {caminho}")
+                continue
+            with self._lock:
+                self._prontas[chave] = imagem
+                self._bytes_prontas += imagem.sizeInBytes()
+                self.estatisticas['pre_carregadas'] += 1
+                # Descarta as pré-carregadas mais antigas que nunca foram usadas
+                while self._bytes_prontas > self._limite_prontas and len(self._prontas) > 1:
+                    _, antiga = self._prontas.popitem(last=False)
+                    self._bytes_prontas -= antiga.sizeInBytes()
+                    self.estatisticas['despejos'] += 1
+
+    def limpar(self):
+        """Esvazia o cache (por exemplo, ao voltar para a tela de login)"""
+        QPixmapCache.clear()
+        self._inseridas.clear()
+        with self._lock:
+            self._prontas.clear()
+            self._bytes_prontas = 0
+
+    def relatorio(self):
+        e = self.estatisticas
+        consultas = e['acertos'] + e['falhas']
+        taxa = e['acertos'] / consultas * 100 if consultas else 0.0
+        return (f"Assets: {e['acertos']} acertos, {e['falhas']} falhas ({taxa:.0f}% acerto), "
+                f"{e['despejos']} despejos, {e['pre_carregadas']} pré-carregadas, "
+                f"limite {self.limite_kb // 1024} MB")
+
+
+_servico = None
+
+def obter_servico_assets():
+    """Retorna o ServicoAssets compartilhado pelo processo"""
+    global _servico
+    if _servico is None:
+        _servico = ServicoAssets()
+    return _servico
+
+def carregar_pixmap(caminho, largura=None, altura=None, aspecto=MANTER, transformacao=SUAVE):
+    """Atalho para obter_servico_assets().pixmap(...)"""
+    return obter_servico_assets().pixmap(caminho, largura, altura, aspecto, transformacao)
@@ -0,0 +1,184 @@
+"""
+Ponte entre as telas e as chamadas do backend que tocam o banco.
+
+O banco é aberto com timeout=10: uma chamada feita na thread da interface
+pode congelar a janela enquanto espera o lock de escrita. As telas agendam
+essas chamadas na ponte, que as executa no QThreadPool e devolve o
+resultado por sinal, na thread da interface:
+
+    obter_ponte_backend().executar(
+        login.realizar_login, email, senha,
+        ao_concluir=self.ao_verificar_login,   # callback(resultado)
+        ao_falhar=self.ao_falhar_login,        # callback(excecao)
+        ocupado=self.definir_verificando,      # callback(bool) ao começar/terminar
+        dono=self,                             # cancela se o widget for destruído
+    )
+
+Cada chamada é medida (Tarefa.duracao_ms; chamadas lentas são avisadas no
+console) e pode ser cancelada com Tarefa.cancelar(): se ainda não começou,
+não roda; se já está rodando, o resultado é descartado. O sinal
+ocupado_alterado da ponte indica se há alguma chamada em andamento (usado
+para o cursor de espera da aplicação, ver main.py).
+"""
+import time
+import traceback
+import threading
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+LIMITE_LENTO_MS = 500  # chamadas acima disso são avisadas no console
+
+
+class _SinaisTarefa(QObject):
+    concluida = pyqtSignal(object)
+    falhou = pyqtSignal(object)
+    finalizada = pyqtSignal()
+
+
+class Tarefa(QRunnable):
+    """
+    Executa funcao(*args, **kwargs) em uma thread do pool.
+
+    Os sinais (em tarefa.sinais) são entregues na thread da interface:
+    concluida(resultado), falhou(excecao) e finalizada() — este último sempre,
+    inclusive quando a tarefa é cancelada.
+    """
+
+    def __init__(self, funcao, *args, nome=None, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.funcao = funcao
+        self.args = args
+        self.kwargs = kwargs
+        self.nome = nome or getattr(funcao, "__qualname__", repr(funcao))
+        self.duracao_ms = None
+        self.espera_ms = None  # tempo na fila do pool antes de começar
+        self.terminada = False
+        self._cancelada = threading.Event()
+        self._agendada_em = time.perf_counter()
+        # Criado na thread da interface: os sinais emitidos pelo pool chegam nela
+        self.sinais = _SinaisTarefa()
+
+    @property
+    def cancelada(self):
+        return self._cancelada.is_set()
+
+    def cancelar(self):
+        """Impede a execução ou descarta o resultado (os callbacks não são chamados)"""
+        self._cancelada.set()
+
+    def run(self):
+        inicio = time.perf_counter()
+        self.espera_ms = (inicio - self._agendada_em) * 1000
+        try:
+            if self.cancelada:
+                return
+            try:
+                resultado = self.funcao(*self.args, **self.kwargs)
+            except Exception as e:
+                self.duracao_ms = (time.perf_counter() - inicio) * 1000
+                if not self.cancelada:
+                    traceback.print_exc()
+                    self.sinais.falhou.emit(e)
+            else:
+                self.duracao_ms = (time.perf_counter() - inicio) * 1000
+                if not self.cancelada:
+                    self.sinais.concluida.emit(resultado)
+        finally:
+            self.sinais.finalizada.emit()
+
+
+class PonteBackend(QObject):
+    """Agenda chamadas do backend no QThreadPool e acompanha as que estão em andamento"""
+
+    ocupado_alterado = pyqtSignal(bool)
+
+    def __init__(self, pool=None):
+        super().__init__()
+        self.pool = pool or QThreadPool.globalInstance()
+        self._ativas = set()  # mantém as tarefas vivas até finalizada() ser entregue
+        self.estatisticas = {'concluidas': 0, 'falhas': 0, 'canceladas': 0, 'lentas': 0}
+
+    @property
+    def ocupado(self):
+        return bool(self._ativas)
+
+    def executar(self, funcao, *args, ao_concluir=None, ao_falhar=None,
+                 ocupado=None, dono=None, nome=None, **kwargs):
+        """
+        Agenda funcao(*args, **kwargs) no pool.
+
+        Args:
+            ao_concluir: callback(resultado)
+            ao_falhar: callback(excecao)
+            ocupado: callback(bool), com True agora e False quando a tarefa terminar
+            dono: QObject cuja destruição cancela a tarefa
+
+        Returns:
+            Tarefa: permite cancelar() e consultar duracao_ms
+        """
+        tarefa = Tarefa(funcao, *args, nome=nome, **kwargs)
+
+        def concluida(resultado):
+            if tarefa.cancelada:
+                return
+            self.estatisticas['concluidas'] += 1
+            if ao_concluir:
+                ao_concluir(resultado)
+
+        def falhou(erro):
+            if tarefa.cancelada:
+                return
+            self.estatisticas['falhas'] += 1
+            if ao_falhar:
+                ao_falhar(erro)
+            else:
+                print(f"❌ Erro em {tarefa.nome}: {erro}")
+
+        tarefa.sinais.concluida.connect(concluida)
+        tarefa.sinais.falhou.connect(falhou)
+        tarefa.sinais.finalizada.connect(lambda: self._finalizar(tarefa, ocupado))
+        if dono is not None:
+            dono.destroyed.connect(tarefa.cancelar)
+
+        self._ativas.add(tarefa)
+        if len(self._ativas) == 1:
+            self.ocupado_alterado.emit(True)
+        if ocupado:
+            ocupado(True)
+        self.pool.start(tarefa)
+        return tarefa
+
+    def _finalizar(self, tarefa, ocupado):
+        tarefa.terminada = True
+        self._ativas.discard(tarefa)
+        if tarefa.cancelada:
+            self.estatisticas['canceladas'] += 1
+        elif tarefa.duracao_ms is not None and tarefa.duracao_ms > LIMITE_LENTO_MS:
+            self.estatisticas['lentas'] += 1
+            print(f"🐢 {tarefa.nome} levou {tarefa.duracao_ms:.0f} ms "
+                  f"(+{tarefa.espera_ms:.0f} ms na fila)")
+        # O widget do callback pode já ter sido destruído junto com o dono
+        if ocupado and not tarefa.cancelada:
+            ocupado(False)
+        if not self._ativas:
+            self.ocupado_alterado.emit(False)
+
+    def cancelar_todas(self):
+        for tarefa in list(self._ativas):
+            tarefa.cancelar()
+
+
+_ponte = None
+
+
+def obter_ponte_backend():
+    """Ponte compartilhada pela aplicação (criada na thread da interface)"""
+    global _ponte
+    if _ponte is None:
+        _ponte = PonteBackend()
+    return _ponte
+
+
+def executar_em_segundo_plano(funcao, *args, **kwargs):
+    """Atalho para obter_ponte_backend().executar (mesmos argumentos)"""
+    return obter_ponte_backend().executar(funcao, *args, **kwargs)
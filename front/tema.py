@@ -0,0 +1,293 @@
+"""
+Tema visual da aplicação.
+
+Os estilos repetidos pelas telas ficam em uma única folha de estilo aplicada
+na QApplication e são selecionados pela propriedade dinâmica "papel" (ou pelo
+objectName da janela). Assim o Qt interpreta o CSS uma única vez, em vez de
+a cada setStyleSheet de cada widget.
+
+Estados como erro de validação usam a propriedade "erro": trocar o valor só
+repolê o widget, sem interpretar CSS novamente (ver marcar_erro).
+"""
+
+FOLHA_APLICACAO = """
+/* ---------------------------- Login ---------------------------- */
+QMainWindow#telaLogin, QWidget#telaLoginCentral {
+    background-color: white;
+}
+QLabel[papel="rotulo"] {
+    font-size: 13px;
+    color: #333;
+    font-weight: bold;
+}
+QLineEdit[papel="campoLogin"] {
+    padding-left: 10px;
+    font-size: 14px;
+    color: #979797;
+    background-color: white;
+    border: 1px solid #ccc;
+    border-radius: 5px;
+}
+QPushButton[papel="acessar"] {
+    background-color: #2B1D61;
+    color: white;
+    font-weight: bold;
+    font-size: 16px;
+    border-radius: 5px;
+}
+QLabel[papel="mensagemErro"] {
+    color: red;
+    font-size: 12px;
+    margin-top: 10px;
+}
+QLabel[papel="mensagem"][estado="erro"] {
+    color: red;
+    font-size: 12px;
+}
+QLabel[papel="mensagem"][estado="sucesso"] {
+    color: green;
+    font-size: 13px;
+}
+
+/* --------------------------- Cadastro -------------------------- */
+QMainWindow#telaCadastro, QWidget#telaCadastroCentral, QDialog#cadastroTurma {
+    background-color: #F8F8F8;
+}
+QLabel[papel="rotuloCampo"] {
+    font-size: 13px;
+    color: #333;
+}
+QLabel[papel="rotuloDestaque"] {
+    font-size: 14px;
+    color: #333;
+    font-weight: bold;
+}
+QLabel[papel="dica"] {
+    font-size: 12px;
+    color: #666;
+}
+QLineEdit[papel="campo"] {
+    padding: 9px;
+    font-size: 14px;
+    border: 1px solid #ccc;
+    border-radius: 6px;
+    background-color: white;
+    color: black;
+}
+QLineEdit[papel="campoTurma"], QComboBox[papel="campoTurma"] {
+    padding: 1px;
+    font-size: 14px;
+    border: 1px solid #ccc;
+    border-radius: 6px;
+    background-color: white;
+    color: black;
+}
+QComboBox[papel="campoTurma"] QAbstractItemView {
+    color: #000;
+    background-color: white;
+    selection-background-color: #e0e0e0;
+}
+QLineEdit[papel="campo"][erro="true"],
+QLineEdit[papel="campoLogin"][erro="true"],
+QLineEdit[papel="campoTurma"][erro="true"] {
+    border: 2px solid red;
+}
+QCheckBox[papel="termos"] {
+    font-size: 13px;
+    color: #444;
+    margin-top: 8px;
+    margin-bottom: 8px;
+}
+QCheckBox[papel="termos"]::indicator {
+    width: 20px;
+    height: 20px;
+    border: 2px solid #130060;
+    border-radius: 4px;
+    background-color: #fff;
+    image: url('assets/ScreenElements/checked-icon.png');
+}
+QCheckBox[papel="termos"]::indicator:checked {
+    background-color: #130060;
+    border: 2px solid #130060;
+    image: url('assets/ScreenElements/checked-icon.png');
+}
+QCheckBox[papel="termos"]::indicator:unchecked {
+    background-color: #fff;
+    border: 2px solid #130060;
+    image: url('assets/ScreenElements/unchecked-icon.png');
+}
+QCheckBox[papel="termos"]:hover {
+    color: #130060;
+}
+QPushButton[papel="primario"] {
+    background-color: #130060;
+    color: white;
+    border-radius: 6px;
+    font-size: 15px;
+}
+QDialog#cadastroTurma QPushButton[papel="primario"] {
+    font-weight: bold;
+}
+QPushButton[papel="primario"]:hover {
+    background-color: #110444;
+}
+QPushButton[papel="link"] {
+    background-color: transparent;
+    color: #110444;
+    font-size: 13px;
+    border: none;
+}
+QPushButton[papel="link"]:hover {
+    text-decoration: underline;
+}
+
+/* ------------------------- Tela do jogo ------------------------ */
+/* A família da fonte vem de FontManager (setFont), não do CSS */
+QPushButton[papel="sair"] {
+    color: #d9c27f;
+    font-weight: bold;
+    padding: 10px 10px;
+    border-radius: 14px;
+    border: 3px solid #7a6f44;
+}
+QPushButton[papel="sair"]:hover {
+    background-color: #556b2f88;
+    border-color: #f5e86c;
+    color: #fff8dc;
+}
+QPushButton[papel="sair"]:pressed {
+    background-color: #3e4f1eaa;
+    border-color: #cfc28c;
+    color: #b9a75b;
+}
+QPushButton[papel="runa"] {
+    background-color: #8B4513;
+    color: #f5e9c3;
+    font-weight: bold;
+    font-size: 20px;
+    padding: 14px 60px;
+    border-radius: 18px;
+    border: 3px solid #5a452b;
+}
+QPushButton[papel="runa"]:hover {
+    border: 3px solid #f2d372;
+    color: #fff8dc;
+    background-color: #A0522D;
+}
+QPushButton[papel="runa"]:pressed {
+    border: 3px solid #d4b95a;
+    color: #bba56e;
+    background-color: #654321;
+}
+QPushButton[papel="rodape"] {
+    background-color: #654321;
+    color: #d9c27f;
+    font-weight: bold;
+    font-size: 15px;
+    padding: 10px 10px;
+    border-radius: 12px;
+    border: 2px solid #7a6f44;
+}
+QPushButton[papel="rodape"]:hover {
+    background-color: #8B4513;
+    border-color: #f5e86c;
+    color: #fff8dc;
+}
+QPushButton[papel="rodape"]:pressed {
+    background-color: #5D4037;
+    border-color: #cfc28c;
+    color: #b9a75b;
+}
+QLabel[papel="iconeRuna"] {
+    font-size: 24px;
+    color: #f5e9c3;
+}
+
+/* ---------------------------- Turmas --------------------------- */
+QLabel[papel="tituloDialogo"] {
+    font-size: 18px;
+    font-weight: bold;
+}
+
+/* ----------------------------- Quiz ---------------------------- */
+QWidget#telaQuiz {
+    background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
+        stop:0 #1a1a2e, stop:0.5 #16213e, stop:1 #533a7d);
+}
+QLabel[papel="perguntaQuiz"] {
+    color: #f5e9c3;
+}
+QLabel[papel="infoQuiz"] {
+    color: #d9c27f;
+    font-size: 15px;
+    font-weight: bold;
+}
+QProgressBar[papel="tempoQuiz"] {
+    background-color: #3e2f5b;
+    border: none;
+    border-radius: 4px;
+}
+QProgressBar[papel="tempoQuiz"]::chunk {
+    background-color: #d9c27f;
+    border-radius: 4px;
+}
+QPushButton[papel="opcaoQuiz"] {
+    background-color: #8B4513;
+    color: #f5e9c3;
+    border-radius: 12px;
+    border: 2px solid #5a452b;
+    padding: 8px 16px;
+}
+QPushButton[papel="opcaoQuiz"]:hover {
+    background-color: #A0522D;
+    border-color: #f2d372;
+}
+QPushButton[papel="opcaoQuiz"]:disabled {
+    background-color: #5D4037;
+    color: #bba56e;
+}
+QLabel[papel="feedbackQuiz"] {
+    font-size: 15px;
+    font-weight: bold;
+    color: #f5e9c3;
+}
+QLabel[papel="feedbackQuiz"][estado="erro"] {
+    color: #ff8a80;
+}
+QLabel[papel="feedbackQuiz"][estado="sucesso"] {
+    color: #b9f6ca;
+}
+
+"""
+
+
+def aplicar_tema(app):
+    """Instala a folha de estilo da aplicação (uma única vez, na inicialização)"""
+    app.setStyleSheet(FOLHA_APLICACAO)
+
+
+def definir_papel(widget, papel):
+    """Associa o widget a um dos estilos nomeados de FOLHA_APLICACAO"""
+    widget.setProperty("papel", papel)
+    return widget
+
+
+def _trocar_propriedade(widget, nome, valor):
+    # Repole só quando o valor muda: o CSS da aplicação já está interpretado
+    if widget.property(nome) == valor:
+        return
+    widget.setProperty(nome, valor)
+    estilo = widget.style()
+    estilo.unpolish(widget)
+    estilo.polish(widget)
+
+
+def marcar_erro(widget, erro=True):
+    """Liga/desliga o estado de erro trocando a propriedade, sem reinterpretar CSS"""
+    if bool(widget.property("erro")) != bool(erro):
+        _trocar_propriedade(widget, "erro", bool(erro))
+
+
+def definir_estado(widget, estado):
+    """Troca o estado visual nomeado do widget (ex.: "erro", "sucesso")"""
+    _trocar_propriedade(widget, "estado", estado)
@@ -1,15 +1,38 @@
 import sys
 import os
-from PyQt6.QtWidgets import QApplication, QMessageBox, QMainWindow
-from PyQt6.QtGui import QIcon
+import time
+import traceback
 
-def setup_paths():
+# Os imports do PyQt6 e das telas ficam dentro das funções: antes da primeira
+# janela só é carregado o necessário para a tela de login.
+
+class PerfilInicializacao:
+    """Mede o tempo de cada fase da inicialização (--profile-startup)"""
+    def __init__(self, ativo=False):
+        self.ativo = ativo
+        self.inicio = time.perf_counter()
+        self.ultimo = self.inicio
+        self.fases = []
+
+    def marcar(self, fase):
+        agora = time.perf_counter()
+        self.fases.append((fase, agora - self.ultimo))
+        self.ultimo = agora
+
+    def relatorio(self):
+        if not self.ativo:
+            return
+        total = self.ultimo - self.inicio
+        print("\n⏱️ Tempo até a primeira janela:")
+        for fase, duracao in self.fases:
+            print(f"  {fase:<28} {duracao * 1000:8.1f} ms")
+        print(f"  {'TOTAL':<28} {total * 1000:8.1f} ms")
+
+def setup_paths(verbose=False):
     project_root = os.path.dirname(os.path.abspath(__file__))
     
     paths_to_add = [
-        project_root,                                    
-        os.path.join(project_root, 'front'),            # front
-        os.path.join(project_root, 'front', 'Screens'), # telas
+        project_root,                                    # pacotes front, backend e database
         os.path.join(project_root, 'assets')           # assets
     ]
     
@@ -17,21 +40,21 @@ def setup_paths():
         if path not in sys.path:
             sys.path.insert(0, path)
     
-    print(f"📁 Diretório do projeto: {project_root}")
-    print("📂 Caminhos configurados:")
-    for path in paths_to_add:
-        exists = "✅" if os.path.exists(path) else "❌"
-        print(f"  {exists} {path}")
+    if verbose:
+        print(f"📁 Diretório do projeto: {project_root}")
+        print("📂 Caminhos configurados:")
+        for path in paths_to_add:
+            exists = "✅" if os.path.exists(path) else "❌"
+            print(f"  {exists} {path}")
 
-def check_files():
-    print("\nVerificando arquivos")
-    
+def check_files(verbose=False):
+    """Verifica os arquivos obrigatórios; só imprime a lista completa em modo verbose"""
     required_files = [
         ('front/Screens/Login_screen.py', 'Tela de Login'),
         ('front/Screens/game_screen.py', 'Tela do Jogo'),
         ('backend/login.py', 'Sistema de Login'),
         ('backend/validador.py', 'Validador'),
-        ('Database/criar_banco.py', 'Banco de Dados'),
+        ('database/criar_banco.py', 'Banco de Dados'),
     ]
     
     optional_files = [
@@ -40,48 +63,43 @@ def check_files():
         ('assets/ScreenElements/gamescreen/logo-temp.png', 'Ícone do App')
     ]
     
+    base_dir = os.path.dirname(os.path.abspath(__file__))
     all_good = True
     
-    print("📋 Arquivos obrigatórios:")
     for file_path, description in required_files:
-        full_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), file_path)
-        exists = os.path.exists(full_path)
-        status = "✅" if exists else "❌"
-        print(f"  {status} {description} - {file_path}")
+        exists = os.path.exists(os.path.join(base_dir, file_path))
+        if verbose or not exists:
+            print(f"  {'✅' if exists else '❌'} {description} - {file_path}")
         if not exists:
             all_good = False
     
-    print("\n📝 Arquivos opcionais:")
-    for file_path, description in optional_files:
-        full_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), file_path)
-        exists = os.path.exists(full_path)
-        status = "✅" if exists else "⚠️"
-        print(f"  {status} {description} - {file_path}")
+    if verbose:
+        print("\n📝 Arquivos opcionais:")
+        for file_path, description in optional_files:
+            exists = os.path.exists(os.path.join(base_dir, file_path))
+            print(f"  {'✅' if exists else '⚠️'} {description} - {file_path}")
     
     return all_good
 
 def initialize_database():
     print("\nInicializando banco de dados...")
     try:
-        from database.criar_banco import Database, Funcoes_DataBase
+        from database.criar_banco import Funcoes_DataBase
+        from database.esquema import garantir_esquema
         
-        db_path = os.path.join("Database", "raizes_ocultas.db")
-        db = Database(db_path)
+        db_path = os.path.join("database", "raizes_ocultas.db")
         funcoes = Funcoes_DataBase(db_path)
         
-        if not db.banco_existe():
-            print("Criando tabelas...")
-            if db.criar_tabelas():
-                print("✅ Tabelas criadas com sucesso!")
-                
-                print("Inserindo perguntas padrão...")
-                sucesso, msg = funcoes.inserir_perguntas_padrao()
-                print(f"{'✅' if sucesso else '❌'} {msg}")
-            else:
-                print("❌ Erro ao criar tabelas")
-                return False
-        else:
-            print("✅ Banco de dados já existe")
+        # Cria o banco se preciso, aplica as migrações e confere as tabelas;
+        # o resultado fica em cache e os serviços do backend não verificam de novo
+        sucesso, msg = garantir_esquema(db_path)
+        print(f"{'✅' if sucesso else '❌'} {msg}")
+        if not sucesso:
+            return False
+        
+        # Só lê o arquivo de perguntas padrão se o banco tiver uma versão anterior
+        sucesso, msg = funcoes.inserir_perguntas_padrao()
+        print(f"{'✅' if sucesso else '❌'} {msg}")
         
         return True
     except ImportError as e:
@@ -91,8 +109,15 @@ def initialize_database():
         print(f"❌ Erro ao inicializar banco: {str(e)}")
         return False
 
+def warm_up_question_bank():
+    """Carrega o banco de perguntas em memória (chamado depois que a primeira janela aparece)"""
+    from backend.banco_perguntas import obter_banco_perguntas
+    obter_banco_perguntas(os.path.join("database", "raizes_ocultas.db")).carregar()
+
 def load_icon(relative_path):
     """Carrega um ícone a partir do caminho relativo ao script principal"""
+    from PyQt6.QtGui import QIcon
+    
     base_dir = os.path.dirname(os.path.abspath(__file__))
     icon_path = os.path.join(base_dir, *relative_path.split('/'))
     
@@ -103,53 +128,94 @@ def load_icon(relative_path):
 
 def main():
     print("🎮 === INICIANDO RAÍZES OCULTAS ===\n")
+    perfil = PerfilInicializacao(ativo="--profile-startup" in sys.argv)
+    verbose = "--verbose" in sys.argv
     
     # Configuração para ícone na taskbar no Windows
     if sys.platform == 'win32':
         import ctypes
         ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID('raizes.ocultas.1.0')
     
-    setup_paths()
+    setup_paths(verbose)
 
-    if not check_files():
+    if not check_files(verbose):
         print("\n❌ ERRO: Arquivos obrigatórios não encontrados!")
         return 1
+    perfil.marcar("caminhos e arquivos")
 
     if not initialize_database():
         print("\n❌ ERRO: Falha ao inicializar banco de dados!")
         return 1
+    perfil.marcar("banco de dados")
     
     try:
-        app = QApplication(sys.argv)
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import QTimer
+        
+        app = QApplication([a for a in sys.argv if a not in ("--profile-startup", "--verbose")])
         app.setApplicationName("Raízes Ocultas")
         
+        # Folha de estilo única da aplicação (front/tema.py)
+        from front.tema import aplicar_tema
+        aplicar_tema(app)
+        
         # Carrega o ícone principal
         app_icon = load_icon('assets/ScreenElements/gamescreen/logo-temp.png')
         
         if not app_icon.isNull():
             app.setWindowIcon(app_icon)
-            print("✅ Ícone principal carregado com sucesso")
         else:
             print("⚠️ Nenhum ícone principal carregado")
         
         app.setApplicationVersion("1.0")
+        perfil.marcar("QApplication e ícone")
+
+        # Cursor de espera enquanto houver chamadas ao banco em andamento
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtGui import QCursor
+        from front.tarefas import obter_ponte_backend
 
-        from front.Screens.Login_screen import TelaLogin        
-        janela_login = TelaLogin()
+        def indicar_ocupado(ocupado):
+            if ocupado:
+                app.setOverrideCursor(QCursor(Qt.CursorShape.BusyCursor))
+            else:
+                app.restoreOverrideCursor()
+        obter_ponte_backend().ocupado_alterado.connect(indicar_ocupado)
+
+        from front.navegacao import obter_navegador
+        from front.Screens.Login_screen import TelaLogin
+        perfil.marcar("import da tela de login")
+        
+        # As telas principais são mantidas pelo navegador e reaproveitadas
+        navegador = obter_navegador()
+        janela_login = navegador.tela("login")
+        perfil.marcar("construção da tela de login")
         
         # Define o mesmo ícone para a janela
         if not app_icon.isNull():
             janela_login.setWindowIcon(app_icon)
         
-        janela_login.show()
+        navegador.ir_para("login")
+
+        def primeira_janela_exibida():
+            perfil.marcar("primeira pintura")
+            perfil.relatorio()
+            # O que não é necessário para a tela de login fica para depois da primeira pintura
+            obter_ponte_backend().executar(warm_up_question_bank)
+        
+        QTimer.singleShot(0, primeira_janela_exibida)
         print("\n✅ Aplicação iniciada com sucesso!")
         print("=" * 50)
         
-        return app.exec()
+        codigo = app.exec()
+        if perfil.ativo:
+            from front.servico_assets import obter_servico_assets
+            print(obter_servico_assets().relatorio())
+            print(navegador.relatorio())
+        return codigo
         
     except ImportError as e:
         print(f"\n❌ ERRO DE IMPORTAÇÃO: {e}")
-        import traceback
         traceback.print_exc()
         return 1
         
@@ -159,4 +225,4 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())